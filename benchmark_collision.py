@@ -0,0 +1,126 @@
+import random
+import time
+import numpy as np
+from src.utils.constants import *
+
+
+def sample_scenarios(asset_loader, count, seed=0):
+    """
+    Random birds placed around a pipe pair, using real rotated sprites
+
+    Returns a list of (bird_image, bird_mask, bird_rect, pipes) tuples where
+    pipes holds the top and bottom pygame Pipe of one pair.
+    """
+    from src.game.pipe import Pipe
+
+    rng = random.Random(seed)
+    pipe_sprite = asset_loader.get_pipe_sprite("GREEN")
+    bird_types = list(BIRD_TYPES)
+    scenarios = []
+
+    for _ in range(count):
+        gap_center = rng.randint(PIPE_GAP_MARGIN, SCREEN_HEIGHT - PIPE_GAP_MARGIN)
+        pipe_x = rng.randint(40, 160)
+        pipes = [Pipe(pipe_x, pipe_sprite, PIPE_GAP, is_top=True, gap_center=gap_center),
+                 Pipe(pipe_x, pipe_sprite, PIPE_GAP, is_top=False, gap_center=gap_center)]
+
+        atlas = asset_loader.get_bird_atlas(rng.choice(bird_types))
+        frame = rng.randrange(3)
+        rotation = rng.uniform(-30, BIRD_MAX_ROTATION)
+        image, mask = atlas.get(frame, rotation)
+
+        # Bias birds towards the pipe edges, where the modes can disagree;
+        # some sit at the upper end of the top pipe (open sky above a low gap)
+        center_x = pipe_x + rng.randint(-30, PIPE_SPRITE_WIDTH + 30)
+        if rng.random() < 0.1:
+            center_y = (gap_center - PIPE_GAP // 2 - PIPE_SPRITE_HEIGHT) + rng.randint(-25, 25)
+        else:
+            center_y = gap_center + rng.randint(-PIPE_GAP // 2 - 25, PIPE_GAP // 2 + 25)
+        rect = image.get_rect(center=(center_x, center_y))
+        scenarios.append((image, mask, rect, pipes))
+
+    return scenarios
+
+
+def pixel_collision(asset_loader, mask, rect, pipes):
+    for pipe in pipes:
+        if rect.colliderect(pipe.rect):
+            pipe_mask = asset_loader.get_pipe_mask("GREEN", pipe.is_top)
+            if mask.overlap(pipe_mask, (pipe.rect.x - rect.x, pipe.rect.y - rect.y)):
+                return True
+    return False
+
+
+def hitbox_collision(rect, pipes):
+    hitbox = rect.inflate(-2 * HITBOX_BIRD_SHRINK, -2 * HITBOX_BIRD_SHRINK)
+    return any(hitbox.colliderect(pipe.rect.inflate(-2 * HITBOX_PIPE_SHRINK, -2 * HITBOX_PIPE_SHRINK))
+               for pipe in pipes)
+
+
+def run_benchmark(count=20000, seed=0):
+    """Compare hitbox and analytic collision against pixel-perfect masks"""
+    print("💥 COLLISION MODE CONSISTENCY BENCHMARK")
+    print("="*50)
+
+    import pygame
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    from src.sim.collision import analytic_collisions, pipe_pair_arrays
+    from src.utils.asset_loader import AssetLoader
+
+    asset_loader = AssetLoader()
+    asset_loader.load_images()
+    asset_loader.build_sprite_atlas()
+
+    scenarios = sample_scenarios(asset_loader, count, seed)
+    print(f"Scenarios: {count} random birds around one pipe pair")
+
+    start = time.perf_counter()
+    pixel = np.array([pixel_collision(asset_loader, mask, rect, pipes)
+                      for _, mask, rect, pipes in scenarios])
+    pixel_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    hitbox = np.array([hitbox_collision(rect, pipes) for _, _, rect, pipes in scenarios])
+    hitbox_time = time.perf_counter() - start
+
+    # Analytic mode is vectorized across birds sharing a pipe set; here every
+    # scenario has its own pipes, so time the per-scenario call honestly
+    start = time.perf_counter()
+    analytic = np.array([
+        analytic_collisions([rect.left], [rect.right], [rect.top], [rect.bottom],
+                            *pipe_pair_arrays(pipes))[0]
+        for _, _, rect, pipes in scenarios])
+    analytic_time = time.perf_counter() - start
+
+    print(f"Pixel-perfect hits: {int(pixel.sum())} ({pixel.mean()*100:.1f}%)")
+    print()
+    print(f"{'Mode':<10}{'Disagree':>10}{'False hit':>12}{'Missed':>10}{'us/check':>11}")
+    for name, result, elapsed in [("pixel", pixel, pixel_time),
+                                  ("hitbox", hitbox, hitbox_time),
+                                  ("analytic", analytic, analytic_time)]:
+        disagree = np.mean(result != pixel) * 100
+        false_hit = np.mean(result & ~pixel) * 100
+        missed = np.mean(~result & pixel) * 100
+        print(f"{name:<10}{disagree:>9.2f}%{false_hit:>11.2f}%{missed:>9.2f}%"
+              f"{elapsed / count * 1e6:>11.2f}")
+
+    # Broadphase scaling: one analytic call for a whole population
+    birds = 10000
+    rng = np.random.default_rng(seed)
+    x = 80 + rng.integers(0, 10, birds) * 2
+    y = rng.uniform(50, GROUND_Y - 50, birds)
+    _, _, _, pipes = scenarios[0]
+    start = time.perf_counter()
+    analytic_collisions(x - BIRD_WIDTH // 2, x + BIRD_WIDTH // 2,
+                        y - BIRD_HEIGHT // 2, y + BIRD_HEIGHT // 2,
+                        *pipe_pair_arrays(pipes))
+    batch_time = time.perf_counter() - start
+    print(f"\nAnalytic batch: {birds} birds in {batch_time*1000:.2f} ms")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    run_benchmark()
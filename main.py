@@ -1,8 +1,11 @@
 import sys
 import argparse
-import pygame
-from src.game.game_engine import GameEngine
-from src.utils.constants import POPULATION_SIZE
+from src.utils.constants import (POPULATION_SIZE, GENERATIONS, HEADLESS_TRAINING,
+                                 COLLISION_MODES, DEFAULT_COLLISION_MODE, EVALUATION_WORKERS,
+                                 MIGRATION_TOPOLOGIES, ISLAND_TOPOLOGY,
+                                 REPLACEMENT_METHODS, STEADY_STATE_REPLACEMENT,
+                                 DISTRIBUTED_PORT, CHECKPOINT_DIR, BACKUP_INTERVAL, BACKUP_COUNT)
+from src.utils.rng import restore_run, seed_run
 
 
 def print_banner():
@@ -28,6 +31,10 @@ def print_controls():
     │  P        - Pause/Unpause                   │
     │  S        - Save high score                 │
     │  ESC      - Quit game                       │
+    │  + / -    - Faster / slower simulation      │
+    │  0        - Back to real-time speed         │
+    │  U        - Toggle unthrottled fast-forward │
+    │  B        - Draw only the best bird         │
     └─────────────────────────────────────────────┘
     
     🤖 GAME MODES:
@@ -41,6 +48,7 @@ def print_controls():
 def validate_pygame():
     """Check if pygame is properly installed"""
     try:
+        import pygame
         pygame.init()
         return True
     except Exception as e:
@@ -49,6 +57,128 @@ def validate_pygame():
         return False
 
 
+def run_headless(args):
+    """Run AI training through the headless simulation (no pygame)"""
+    from src.sim.engine import HeadlessEngine
+
+    pop_size = args.population if args.population else POPULATION_SIZE
+    collision_mode = args.collision or "analytic"
+    generations = args.generations
+
+    checkpoint = None
+    if args.resume:
+        if (args.islands and args.islands > 1) or args.steady_state:
+            print("❌ --resume only supports generational training (no --islands/--steady-state)")
+            return 1
+        from src.utils.checkpoint import load_checkpoint
+        checkpoint = load_checkpoint(args.resume)
+        rng_service = restore_run(checkpoint['rng'])
+        engine_state = checkpoint['engine']
+        pop_size = engine_state['population_size']
+        collision_mode = engine_state['collision_mode']
+        completed = engine_state['generation'] - 1
+        generations = max(0, args.generations - completed)
+        print(f"♻️ Resuming {checkpoint['path']} after generation {completed} "
+              f"(run seed {rng_service.seed}), {generations} generations to go")
+
+    print(f"⚙️ Configured Population Size: {pop_size}")
+    print("🖥️ Headless training: rendering, sound and frame pacing disabled")
+    print("\n" + "="*60)
+
+    if collision_mode == "pixel":
+        print("⚠️ Pixel collision needs pygame masks, using analytic collision")
+        collision_mode = "analytic"
+    print(f"💥 Collision mode: {collision_mode}")
+
+    if args.islands and args.islands > 1:
+        return run_islands(args, pop_size, collision_mode)
+
+    workers = args.workers if args.workers is not None else EVALUATION_WORKERS
+    if args.steady_state:
+        return run_steady_state(args, pop_size, collision_mode, workers)
+
+    evaluator = None
+    local_workers = []
+    if args.listen:
+        import multiprocessing
+        from src.sim.distributed import DistributedEvaluator, parse_address, run_worker
+        host, port = parse_address(args.listen)
+        evaluator = DistributedEvaluator(host, port, collision_mode=collision_mode)
+        print(f"🌐 Evaluation coordinator listening on {evaluator.host}:{evaluator.port}")
+        print(f"💡 Start workers with: python -m src.sim.distributed "
+              f"--connect {evaluator.host}:{evaluator.port}")
+
+        connect_host = "127.0.0.1" if evaluator.host in ("0.0.0.0", "") else evaluator.host
+        for _ in range(args.local_workers or 0):
+            process = multiprocessing.Process(target=run_worker, daemon=True,
+                                              args=(connect_host, evaluator.port))
+            process.start()
+            local_workers.append(process)
+    elif workers > 1:
+        from src.sim.evaluator import ProcessPoolEvaluator
+        evaluator = ProcessPoolEvaluator(workers, collision_mode=collision_mode)
+        print(f"🧵 Evaluating on {workers} worker processes")
+
+    checkpointer = None
+    if args.checkpoint_every > 0:
+        from src.utils.checkpoint import Checkpointer
+        checkpointer = Checkpointer(CHECKPOINT_DIR, args.checkpoint_every, BACKUP_COUNT)
+        print(f"💾 Checkpoint every {checkpointer.interval} generations to {CHECKPOINT_DIR} "
+              f"(keeping {checkpointer.keep})")
+
+    engine = HeadlessEngine(population_size=pop_size,
+                            collision_mode=collision_mode,
+                            evaluator=evaluator,
+                            checkpointer=checkpointer)
+    if checkpoint is not None:
+        engine.restore_checkpoint(checkpoint)
+    try:
+        engine.run(generations)
+    except KeyboardInterrupt:
+        print("\n\n🛑 Training interrupted by user")
+    finally:
+        if checkpointer is not None:
+            checkpointer.close()
+        if evaluator is not None:
+            evaluator.close()
+        for process in local_workers:
+            process.join(timeout=5)
+    return 0
+
+
+def run_steady_state(args, pop_size, collision_mode, workers):
+    """Run headless training as generation-free steady-state evolution"""
+    from src.sim.steady_state import SteadyStateEngine
+
+    engine = SteadyStateEngine(population_size=pop_size,
+                               workers=workers,
+                               replacement=args.replacement or STEADY_STATE_REPLACEMENT,
+                               collision_mode=collision_mode)
+    try:
+        engine.run(args.generations)
+    except KeyboardInterrupt:
+        print("\n\n🛑 Training interrupted by user")
+    return 0
+
+
+def run_islands(args, pop_size, collision_mode):
+    """Run headless training as an island model (one process per island)"""
+    from src.sim.islands import IslandModel
+
+    model = IslandModel(island_count=args.islands,
+                        population_size=pop_size,
+                        topology=args.topology or ISLAND_TOPOLOGY,
+                        collision_mode=collision_mode)
+    try:
+        model.run(args.generations)
+    except KeyboardInterrupt:
+        print("\n\n🛑 Training interrupted by user")
+    finally:
+        model.print_summary()
+        model.save_best()
+    return 0
+
+
 def main():
     print_banner()
 
@@ -61,6 +191,12 @@ Examples:
   python main.py --mode human          # Play yourself
   python main.py --mode ai_training    # Watch AI learn
   python main.py --mode ai_play        # Watch trained AI
+  python main.py --mode ai_training --headless   # Train without a window
+  python main.py --mode ai_training --headless --seed 42   # Repeatable run
+  python main.py --mode ai_training --headless --islands 4   # Island model
+  python main.py --mode ai_training --headless --steady-state --workers 8
+  python main.py --mode ai_training --headless --listen 0.0.0.0:5757   # Remote workers
+  python main.py --mode ai_training --headless --resume data/checkpoints   # Continue a run
   
 For help: python main.py --help
         """
@@ -92,8 +228,132 @@ For help: python main.py --help
         help='Target FPS (default: 60)'
     )
 
+    parser.add_argument(
+        '--headless',
+        action='store_true',
+        help='Train without pygame or a display (ai_training only)'
+    )
+
+    parser.add_argument(
+        '--generations',
+        type=int,
+        default=GENERATIONS,
+        help=f'Generations to train in headless mode (default: {GENERATIONS})'
+    )
+
+    parser.add_argument(
+        '--collision',
+        choices=list(COLLISION_MODES),
+        default=None,
+        help=f'Pipe collision mode (default: {DEFAULT_COLLISION_MODE}, analytic when headless)'
+    )
+
+    parser.add_argument(
+        '--speed',
+        type=float,
+        default=None,
+        help='Simulation ticks per rendered frame (default: SPEED_MULTIPLIER)'
+    )
+
+    parser.add_argument(
+        '--unthrottled',
+        action='store_true',
+        help='Run the simulation without frame pacing'
+    )
+
+    parser.add_argument(
+        '--render-every',
+        type=int,
+        default=None,
+        help='Render one frame every N ticks when unthrottled'
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help=f'Headless evaluation worker processes (default: {EVALUATION_WORKERS})'
+    )
+
+    parser.add_argument(
+        '--islands',
+        type=int,
+        default=None,
+        help='Headless island model: independent populations (one process each) '
+             'exchanging their best birds'
+    )
+
+    parser.add_argument(
+        '--topology',
+        choices=list(MIGRATION_TOPOLOGIES),
+        default=None,
+        help=f'Island migration topology (default: {ISLAND_TOPOLOGY})'
+    )
+
+    parser.add_argument(
+        '--steady-state',
+        action='store_true',
+        help='Headless generation-free evolution: evaluate a new child whenever '
+             'a worker is free (--generations counts epochs of population-size evaluations)'
+    )
+
+    parser.add_argument(
+        '--replacement',
+        choices=list(REPLACEMENT_METHODS),
+        default=None,
+        help=f'Steady-state replacement (default: {STEADY_STATE_REPLACEMENT})'
+    )
+
+    parser.add_argument(
+        '--listen',
+        default=None,
+        metavar='[HOST:]PORT',
+        help=f'Headless: evaluate on TCP workers connecting to this address '
+             f'(e.g. 127.0.0.1:{DISTRIBUTED_PORT})'
+    )
+
+    parser.add_argument(
+        '--local-workers',
+        type=int,
+        default=None,
+        help='With --listen: also start this many workers on this machine'
+    )
+
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=None,
+        help='Run seed; the same seed repeats a run exactly (default: random)'
+    )
+
+    parser.add_argument(
+        '--resume',
+        default=None,
+        metavar='CHECKPOINT',
+        help='Headless: continue a run from a checkpoint file, or the newest one in a '
+             'directory (--generations counts the whole run)'
+    )
+
+    parser.add_argument(
+        '--checkpoint-every',
+        type=int,
+        default=BACKUP_INTERVAL,
+        help=f'Headless: checkpoint every N generations, 0 to disable '
+             f'(default: {BACKUP_INTERVAL}, last {BACKUP_COUNT} kept)'
+    )
+
     args = parser.parse_args()
 
+    rng_service = seed_run(args.seed)
+    if not args.resume:
+        print(f"🎲 Run seed: {rng_service.seed}")
+
+    if args.mode == "ai_training" and (args.headless or HEADLESS_TRAINING):
+        return run_headless(args)
+
+    import pygame
+    from src.game.game_engine import GameEngine
+
     pygame.init()
     game = GameEngine(mode=args.mode)
 
@@ -115,7 +375,12 @@ For help: python main.py --help
         game.asset_loader.sounds = {}
         print("🔇 Sound disabled")
 
+    if args.collision:
+        game.collision_mode = args.collision
+    print(f"💥 Collision mode: {game.collision_mode}")
+
     print(f"⚡ Target FPS: {args.fps}")
+    print(f"⏩ Speed: {game.scheduler.describe()}")
     print("\n" + "="*60)
 
     try:
@@ -123,10 +388,13 @@ For help: python main.py --help
         if hasattr(game, 'population_size'):
             game.population_size = args.population
 
-        # Set FPS
-        if hasattr(game, 'clock'):
-            # This will be used in the game loop
-            pass
+        # Frame pacing and fast-forward
+        game.scheduler.target_fps = args.fps
+        if args.speed is not None:
+            game.scheduler.speed_multiplier = game.scheduler.clamp_speed(args.speed)
+        if args.render_every is not None:
+            game.scheduler.render_interval = max(1, args.render_every)
+        game.scheduler.unthrottled = args.unthrottled
 
         # Disable sounds if requested
         if args.no_sound:
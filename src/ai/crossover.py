@@ -1,72 +1,130 @@
 import numpy as np
-import random
+from src.utils.rng import get_rng_service
 
 
 class Crossover:
+    """
+    Crossover operators.
+
+    The batch_* methods recombine M parent pairs at once: they take two (M, P)
+    parent matrices (rows of Population.genomes) and return two (M, P) child
+    matrices, built with one mask, cut-point or blend operation per batch.
+    The per-network methods are the same operators on a batch of one.
+    """
+
     @staticmethod
-    def single_point_crossover(parent1, parent2):
-        """Single-point crossover: Split at one random point"""
-        # Get parent parameters as arrays
-        params1 = parent1.get_weights_as_array()
-        params2 = parent2.get_weights_as_array()
+    def batch_single_point(parents_a, parents_b, rng=None):
+        """Single-point crossover: each pair swaps tails after one random cut"""
+        rng = get_rng_service().next_stream("crossover") if rng is None else rng
+        parents_a, parents_b = np.asarray(parents_a), np.asarray(parents_b)
+        count, num_params = parents_a.shape
+        if num_params < 2:
+            # No cut point inside the genome: the children copy their parents
+            return parents_a.copy(), parents_b.copy()
+
+        cut = rng.integers(1, num_params, size=count)
+        mask = np.arange(num_params) < cut[:, None]
+        return (np.where(mask, parents_a, parents_b),
+                np.where(mask, parents_b, parents_a))
 
-        # Random crossover point
-        crossover_point = random.randint(1, len(params1) - 1)
+    @staticmethod
+    def batch_two_point(parents_a, parents_b, rng=None):
+        """Two-point crossover: each pair swaps the segment between two random cuts"""
+        rng = get_rng_service().next_stream("crossover") if rng is None else rng
+        parents_a, parents_b = np.asarray(parents_a), np.asarray(parents_b)
+        count, num_params = parents_a.shape
+        if num_params < 3:
+            # Too short for two cuts strictly inside the genome
+            return Crossover.batch_single_point(parents_a, parents_b, rng)
 
-        # Create offspring
-        child1_params = np.concatenate([params1[:crossover_point],
-                                        params2[crossover_point:]])
-        child2_params = np.concatenate([params2[:crossover_point],
-                                        params1[crossover_point:]])
+        # first < second, both strictly inside the genome
+        first = rng.integers(1, num_params - 1, size=count)
+        second = rng.integers(first + 1, num_params)
+        genes = np.arange(num_params)
+        swap = (genes >= first[:, None]) & (genes < second[:, None])
+        return (np.where(swap, parents_b, parents_a),
+                np.where(swap, parents_a, parents_b))
 
-        # Create child networks
-        child1 = parent1.copy()
-        child2 = parent2.copy()
-        child1.set_weights_from_array(child1_params)
-        child2.set_weights_from_array(child2_params)
+    @staticmethod
+    def batch_uniform(parents_a, parents_b, crossover_rate=0.5, rng=None):
+        """Uniform crossover: each gene independently chosen from either parent"""
+        rng = get_rng_service().next_stream("crossover") if rng is None else rng
+        parents_a, parents_b = np.asarray(parents_a), np.asarray(parents_b)
 
-        return child1, child2
+        keep = rng.random(parents_a.shape) < crossover_rate
+        return (np.where(keep, parents_a, parents_b),
+                np.where(keep, parents_b, parents_a))
 
     @staticmethod
-    def uniform_crossover(parent1, parent2, crossover_rate=0.5):
-        """Uniform crossover: Each gene independently chosen from either parent"""
-        params1 = parent1.get_weights_as_array()
-        params2 = parent2.get_weights_as_array()
+    def batch_arithmetic(parents_a, parents_b, alpha=0.5, rng=None):
+        """
+        Arithmetic crossover: weighted average of parent parameters
 
-        # Create offspring parameters
-        child1_params = np.zeros_like(params1)
-        child2_params = np.zeros_like(params2)
+        alpha may be a scalar or one weight per pair (shape (M,) or (M, 1)).
+        """
+        parents_a, parents_b = np.asarray(parents_a), np.asarray(parents_b)
+        alpha = np.asarray(alpha, dtype=parents_a.dtype)
+        if alpha.ndim == 1:
+            alpha = alpha[:, None]
 
-        for i in range(len(params1)):
-            if random.random() < crossover_rate:
-                child1_params[i] = params1[i]
-                child2_params[i] = params2[i]
-            else:
-                child1_params[i] = params2[i]
-                child2_params[i] = params1[i]
+        return (alpha * parents_a + (1 - alpha) * parents_b,
+                alpha * parents_b + (1 - alpha) * parents_a)
 
-        # Create child networks
-        child1 = parent1.copy()
-        child2 = parent2.copy()
-        child1.set_weights_from_array(child1_params)
-        child2.set_weights_from_array(child2_params)
+    @staticmethod
+    def batch_crossover(parents_a, parents_b, method="single_point", rng=None):
+        """
+        Recombine every pair with the named operator (a CROSSOVER_METHODS key)
+
+        Args:
+            parents_a: (M, P) matrix of first parents
+            parents_b: (M, P) matrix of second parents
+            method: "single_point", "two_point", "uniform" or "arithmetic"
+            rng: numpy Generator (None for the run's next ad hoc "crossover" stream)
 
-        return child1, child2
+        Returns:
+            (children_a, children_b), two (M, P) matrices
+        """
+        operators = {
+            "single_point": Crossover.batch_single_point,
+            "two_point": Crossover.batch_two_point,
+            "uniform": Crossover.batch_uniform,
+            "arithmetic": Crossover.batch_arithmetic
+        }
+        if method not in operators:
+            raise ValueError(f"Unknown crossover method: {method}")
+        return operators[method](parents_a, parents_b, rng=rng)
 
     @staticmethod
-    def arithmetic_crossover(parent1, parent2, alpha=0.5):
-        """Arithmetic crossover: Weighted average of parent parameters"""
-        params1 = parent1.get_weights_as_array()
-        params2 = parent2.get_weights_as_array()
+    def _children(parent1, parent2, children_a, children_b):
+        """Wrap the single rows of a batch of one as networks (no initialization)"""
+        return parent1.with_params(children_a[0]), parent2.with_params(children_b[0])
+
+    @staticmethod
+    def single_point_crossover(parent1, parent2):
+        """Single-point crossover: Split at one random point"""
+        children = Crossover.batch_single_point(parent1.get_weights_as_array()[None],
+                                                parent2.get_weights_as_array()[None])
+        return Crossover._children(parent1, parent2, *children)
 
-        # Create offspring as weighted averages
-        child1_params = alpha * params1 + (1 - alpha) * params2
-        child2_params = alpha * params2 + (1 - alpha) * params1
+    @staticmethod
+    def two_point_crossover(parent1, parent2):
+        """Two-point crossover: Swap the segment between two random points"""
+        children = Crossover.batch_two_point(parent1.get_weights_as_array()[None],
+                                             parent2.get_weights_as_array()[None])
+        return Crossover._children(parent1, parent2, *children)
 
-        # Create child networks
-        child1 = parent1.copy()
-        child2 = parent2.copy()
-        child1.set_weights_from_array(child1_params)
-        child2.set_weights_from_array(child2_params)
+    @staticmethod
+    def uniform_crossover(parent1, parent2, crossover_rate=0.5):
+        """Uniform crossover: Each gene independently chosen from either parent"""
+        children = Crossover.batch_uniform(parent1.get_weights_as_array()[None],
+                                           parent2.get_weights_as_array()[None],
+                                           crossover_rate)
+        return Crossover._children(parent1, parent2, *children)
 
-        return child1, child2
+    @staticmethod
+    def arithmetic_crossover(parent1, parent2, alpha=0.5):
+        """Arithmetic crossover: Weighted average of parent parameters"""
+        children = Crossover.batch_arithmetic(parent1.get_weights_as_array()[None],
+                                              parent2.get_weights_as_array()[None],
+                                              alpha)
+        return Crossover._children(parent1, parent2, *children)
@@ -0,0 +1,174 @@
+import numpy as np
+from src.utils.constants import *
+from src.utils.rng import get_rng_service
+
+
+class Diversity:
+    """
+    Genetic diversity of a population's (N, P) genome matrix.
+
+    Exact statistics use per-gene sorting (mean pairwise L1) and BLAS Gram
+    matrices (pairwise Euclidean distances, computed in row blocks). When N
+    is too large for all pairs, distances are estimated from random pairs
+    and reported with a 95% confidence half-width; when P is large the
+    genomes are first randomly projected (Johnson-Lindenstrauss) and the
+    distortion bound is reported instead.
+    """
+
+    @staticmethod
+    def gene_variance(genomes):
+        """Variance of every gene across the population, shape (P,)"""
+        return np.var(np.asarray(genomes, dtype=np.float64), axis=0)
+
+    @staticmethod
+    def mean_squared_distance(gene_variance, size):
+        """Exact mean pairwise squared Euclidean distance from the variance profile"""
+        if size < 2:
+            return 0.0
+        return float(2 * size / (size - 1) * np.sum(gene_variance))
+
+    @staticmethod
+    def mean_pairwise_l1(genomes):
+        """
+        Exact mean pairwise L1 distance over all N*(N-1)/2 pairs
+
+        Per gene, sum_{i<j} |x_i - x_j| = sum_k x_(k) * (2k - N + 1) over the
+        sorted values, so this costs one sort per gene instead of N^2 work.
+        """
+        genomes = np.asarray(genomes, dtype=np.float64)
+        size = len(genomes)
+        if size < 2:
+            return 0.0
+
+        ordered = np.sort(genomes, axis=0)
+        coefficients = 2 * np.arange(size) - size + 1
+        total = float(coefficients @ ordered.sum(axis=1))
+        return total / (size * (size - 1) / 2)
+
+    @staticmethod
+    def exact_distance_stats(genomes, block_size=1024):
+        """
+        Mean, std, min and max of all pairwise Euclidean distances
+
+        Uses |a-b|^2 = |a|^2 + |b|^2 - 2 a.b with one matrix product per
+        block of rows, so memory stays at block_size * N.
+        """
+        genomes = np.asarray(genomes, dtype=np.float64)
+        size = len(genomes)
+        squared_norms = np.einsum("ij,ij->i", genomes, genomes)
+
+        total = 0.0
+        total_sq = 0.0
+        smallest = np.inf
+        largest = 0.0
+        columns = np.arange(size)
+
+        for start in range(0, size - 1, block_size):
+            rows = np.arange(start, min(start + block_size, size))
+            squared = (squared_norms[rows, None] + squared_norms[None, :]
+                       - 2 * genomes[rows] @ genomes.T)
+            # Upper triangle only (each pair once)
+            upper = columns[None, :] > rows[:, None]
+            distances = np.sqrt(np.maximum(squared[upper], 0))
+
+            total += distances.sum()
+            total_sq += np.square(distances).sum()
+            smallest = min(smallest, distances.min())
+            largest = max(largest, distances.max())
+
+        pairs = size * (size - 1) / 2
+        mean = total / pairs
+        return {
+            'mean': float(mean),
+            'std': float(np.sqrt(max(total_sq / pairs - mean ** 2, 0))),
+            'min': float(smallest),
+            'max': float(largest)
+        }
+
+    @staticmethod
+    def sampled_distance_stats(genomes, sample_pairs=DIVERSITY_SAMPLE_PAIRS, rng=None):
+        """Pairwise Euclidean distance statistics estimated from random distinct pairs"""
+        rng = get_rng_service().next_stream("diversity") if rng is None else rng
+        genomes = np.asarray(genomes, dtype=np.float64)
+        size = len(genomes)
+
+        first = rng.integers(0, size, sample_pairs)
+        second = rng.integers(0, size - 1, sample_pairs)
+        second += second >= first
+        distances = np.linalg.norm(genomes[first] - genomes[second], axis=1)
+
+        std = float(distances.std())
+        return {
+            'mean': float(distances.mean()),
+            'std': std,
+            'min': float(distances.min()),
+            'max': float(distances.max()),
+            'error': float(1.96 * std / np.sqrt(sample_pairs))
+        }
+
+    @staticmethod
+    def random_projection(genomes, dims, rng=None):
+        """Gaussian random projection to dims columns (distances kept in expectation)"""
+        rng = get_rng_service().next_stream("diversity") if rng is None else rng
+        genomes = np.asarray(genomes, dtype=np.float64)
+        projection = rng.normal(0, 1 / np.sqrt(dims), (genomes.shape[1], dims))
+        return genomes @ projection
+
+    @staticmethod
+    def population_diversity(genomes, exact_limit=DIVERSITY_EXACT_LIMIT,
+                             sample_pairs=DIVERSITY_SAMPLE_PAIRS,
+                             projection_dim=DIVERSITY_PROJECTION_DIM, rng=None):
+        """
+        Diversity report for the whole population
+
+        Args:
+            genomes: (N, P) genome matrix
+            exact_limit: Largest N for which all pairs are measured
+            sample_pairs: Random pairs used above exact_limit
+            projection_dim: Genomes with more genes are projected first
+            rng: numpy Generator (None for the run's next ad hoc "diversity" stream)
+
+        Returns:
+            dict with the exact mean pairwise L1 distance, Euclidean distance
+            statistics (with 'distance_error' half-width and 'method'), and
+            the per-gene variance profile
+        """
+        genomes = np.asarray(genomes, dtype=np.float64)
+        size, num_params = genomes.shape
+        variance = Diversity.gene_variance(genomes) if size else np.zeros(num_params)
+
+        report = {
+            'size': size,
+            'mean_l1': Diversity.mean_pairwise_l1(genomes),
+            'mean_squared_distance': Diversity.mean_squared_distance(variance, size),
+            'gene_variance': variance,
+            'mean_gene_variance': float(variance.mean()) if num_params else 0.0,
+            'distance_mean': 0.0,
+            'distance_std': 0.0,
+            'distance_min': 0.0,
+            'distance_max': 0.0,
+            'distance_error': 0.0,
+            'method': 'exact'
+        }
+        if size < 2:
+            return report
+
+        if size > exact_limit:
+            stats = Diversity.sampled_distance_stats(genomes, sample_pairs, rng)
+            report['distance_error'] = stats['error']
+            report['method'] = 'sampled'
+        elif num_params > projection_dim:
+            stats = Diversity.exact_distance_stats(
+                Diversity.random_projection(genomes, projection_dim, rng))
+            # Johnson-Lindenstrauss: all pair distances within (1 +/- eps) w.h.p.
+            eps = min(1.0, np.sqrt(8 * np.log(size) / projection_dim))
+            report['distance_error'] = float(eps * stats['mean'])
+            report['method'] = 'projected'
+        else:
+            stats = Diversity.exact_distance_stats(genomes)
+
+        report['distance_mean'] = stats['mean']
+        report['distance_std'] = stats['std']
+        report['distance_min'] = stats['min']
+        report['distance_max'] = stats['max']
+        return report
@@ -1,14 +1,24 @@
-import random
 import time
 import os
 import json
+import numpy as np
 from src.ai.neural_network import NeuralNetwork
 from src.ai.population import Population
 from src.ai.selection import Selection
 from src.ai.crossover import Crossover
 from src.ai.mutation import Mutation
 from src.ai.fitness import Fitness
+from src.ai.model_io import save_models
 from src.utils.constants import *
+from src.utils.rng import get_rng_service
+from src.utils.stats_log import StatsLog, compact
+
+# Settings restored with a checkpoint (mutation_rate adapts during a run)
+CHECKPOINT_PARAMETERS = [
+    'population_size', 'generations', 'mutation_rate', 'crossover_rate', 'elite_count',
+    'selection_method', 'crossover_method', 'mutation_method', 'immigrant_rate',
+    'adaptive_mutation', 'diversity_threshold'
+]
 
 
 class GeneticAlgorithm:
@@ -16,26 +26,34 @@ class GeneticAlgorithm:
                  generations=GENERATIONS,
                  mutation_rate=MUTATION_RATE,
                  crossover_rate=CROSSOVER_RATE,
-                 elite_count=ELITE_COUNT):
+                 elite_count=ELITE_COUNT,
+                 rng_service=None):
         self.population_size = population_size
         self.generations = generations
         self.mutation_rate = mutation_rate
         self.crossover_rate = crossover_rate
         self.elite_count = elite_count
 
+        # Source of every random stream (an island passes its own service)
+        self.rng_service = rng_service if rng_service is not None else get_rng_service()
+
         # Initialize population
-        self.population = Population(population_size)
+        self.population = Population(population_size, rng_service=self.rng_service)
 
         # Evolution statistics
         self.generation_stats = []
         self.best_fitness_history = []
         self.average_fitness_history = []
         self.diversity_history = []
+        # Append-only record log (open_stats_log), one record per generation
+        self.stats_log = None
 
         # Algorithm parameters
         self.selection_method = "tournament"
-        self.crossover_method = "single_point"
+        self.crossover_method = "uniform"
         self.mutation_method = "gaussian"
+        # Fraction of each generation replaced by random networks
+        self.immigrant_rate = IMMIGRANT_RATE
 
         # Adaptive parameters
         self.adaptive_mutation = True
@@ -45,7 +63,7 @@ class GeneticAlgorithm:
         """Assign neural network brains to birds"""
         # Ensure population is large enough (handle edge cases)
         while len(self.population.individuals) < len(birds):
-            self.population.individuals.append(
+            self.population.add_individual(
                 NeuralNetwork(NN_INPUT_NODES, NN_HIDDEN_NODES, NN_OUTPUT_NODES)
             )
             
@@ -53,6 +71,55 @@ class GeneticAlgorithm:
             if i < len(self.population.individuals):
                 bird.brain = self.population.individuals[i]
 
+    def evaluate_population(self, evaluator, course_seed, count=None):
+        """
+        Evaluate the first count individuals with an evaluator backend
+
+        Args:
+            evaluator: Object with evaluate(genomes, layer_sizes, course_seed)
+                       (see src.sim.evaluator)
+            course_seed: Pipe course every individual flies
+            count: Number of individuals (default: all)
+
+        Returns:
+            dict of per-individual 'fitness', 'score' and 'frames' arrays
+        """
+        genomes = self.population.genomes[:count]
+        results = evaluator.evaluate(genomes, self.population.layer_sizes, course_seed)
+        self.population.fitness_scores = results['fitness'].tolist()
+        return results
+
+    def emigrants(self, count):
+        """
+        Copies of the count fittest genomes of the evaluated population
+
+        Returns:
+            ((count, P) genome matrix, fitness of each row)
+        """
+        scores = np.asarray(self.population.fitness_scores, dtype=np.float64)
+        best = np.argsort(-scores, kind="stable")[:count]
+        return self.population.genomes[best].copy(), scores[best]
+
+    def immigrate(self, genomes, fitness):
+        """
+        Replace the worst individuals with migrants, which keep their fitness
+
+        Args:
+            genomes: (M, P) migrant genome matrix
+            fitness: Fitness of each migrant on its home island
+
+        Returns:
+            Population rows that now hold the migrants
+        """
+        scores = np.asarray(self.population.fitness_scores, dtype=np.float64)
+        count = min(len(genomes), len(scores))
+        worst = np.argsort(scores, kind="stable")[:count]
+
+        self.population.genomes[worst] = genomes[:count]
+        scores[worst] = fitness[:count]
+        self.population.fitness_scores = scores.tolist()
+        return worst
+
     def calculate_fitness_scores(self, birds, game_time_ms):
         """Calculate fitness for all birds after simulation"""
         fitness_scores = []
@@ -69,126 +136,74 @@ class GeneticAlgorithm:
 
     def select_parents(self, count=2):
         """Select parents for reproduction"""
-        parents = []
-
-        for _ in range(count):
-            if self.selection_method == "tournament":
-                parent = Selection.tournament_selection(
-                    self.population.individuals,
-                    self.population.fitness_scores,
-                    tournament_size=3
-                )
-            elif self.selection_method == "roulette":
-                parent = Selection.roulette_wheel_selection(
-                    self.population.individuals,
-                    self.population.fitness_scores
-                )
-            elif self.selection_method == "rank":
-                parent = Selection.rank_selection(
-                    self.population.individuals,
-                    self.population.fitness_scores
-                )
-            else:
-                parent = random.choice(self.population.individuals)
-
-            parents.append(parent)
-
-        return parents
-
-    def create_offspring(self, parent1, parent2):
-        """Create offspring through crossover and mutation"""
-        offspring = []
-
-        # Crossover
-        if random.random() < self.crossover_rate:
-            if self.crossover_method == "single_point":
-                child1, child2 = Crossover.single_point_crossover(
-                    parent1, parent2)
-            elif self.crossover_method == "two_point":
-                child1, child2 = Crossover.two_point_crossover(
-                    parent1, parent2)
-            elif self.crossover_method == "uniform":
-                child1, child2 = Crossover.uniform_crossover(parent1, parent2)
-            elif self.crossover_method == "arithmetic":
-                child1, child2 = Crossover.arithmetic_crossover(
-                    parent1, parent2)
-            else:
-                child1, child2 = parent1.copy(), parent2.copy()
-        else:
-            child1, child2 = parent1.copy(), parent2.copy()
-
-        offspring.extend([child1, child2])
-
-        # Mutation
-        for i, child in enumerate(offspring):
-            if self.mutation_method == "gaussian":
-                offspring[i] = Mutation.gaussian_mutation(
-                    child, self.mutation_rate)
-            elif self.mutation_method == "uniform":
-                offspring[i] = Mutation.uniform_mutation(
-                    child, self.mutation_rate)
-            elif self.mutation_method == "creep":
-                offspring[i] = Mutation.creep_mutation(
-                    child, self.mutation_rate)
-            elif self.mutation_method == "boundary":
-                offspring[i] = Mutation.boundary_mutation(
-                    child, self.mutation_rate)
-            elif self.mutation_method == "adaptive":
-                offspring[i] = Mutation.adaptive_mutation(
-                    child, self.population.generation, self.generations
-                )
-
-        return offspring
+        indices = Selection.select_indices(self.population.fitness_scores, count,
+                                           self.selection_method, tournament_size=3)
+        return [self.population.individuals[i] for i in indices]
 
     def evolve_generation(self):
         """Evolve population to next generation"""
         start_time = time.time()
 
+        # Independent random streams for this generation
+        generation = self.population.generation
+        rng_service = self.rng_service
+
         # Get current statistics
         current_stats = self.population.get_fitness_statistics()
-        diversity = self.population.get_diversity_measure()
+        diversity_stats = self.population.get_diversity_statistics(
+            rng=rng_service.stream("diversity", generation))
+        diversity = diversity_stats['mean_l1']
 
         # Store statistics
         self.best_fitness_history.append(current_stats['max'])
         self.average_fitness_history.append(current_stats['avg'])
         self.diversity_history.append(diversity)
 
-        # Create next generation
-        new_population = []
+        # Create next generation directly in the population's spare genome matrix
+        self.population.sort_by_fitness(descending=True)
+        new_genomes = self.population.next_genomes(self.population_size)
 
         # Elitism - keep best individuals
-        self.population.sort_by_fitness(descending=True)
-        elites = self.population.individuals[:self.elite_count]
-        
-        new_population = [elite.copy() for elite in elites]
+        elite_count = min(self.elite_count, len(self.population.genomes), self.population_size)
+        new_genomes[:elite_count] = self.population.genomes[:elite_count]
+        row = elite_count
 
         # Reproduction (Selection + Crossover)
-        # We leave space for random immigrants (10% of population)
-        immigrant_count = int(self.population_size * 0.1)
-        repro_count = self.population_size - len(new_population) - immigrant_count
-
-        while len(new_population) < (self.population_size - immigrant_count):
-            parent1 = Selection.tournament_selection(self.population.individuals, self.population.fitness_scores)
-            parent2 = Selection.tournament_selection(self.population.individuals, self.population.fitness_scores)
-            
-            offspring = Crossover.uniform_crossover(parent1, parent2)
-            
-            # Add mutated offspring
-            for child in offspring:
-                if len(new_population) < (self.population_size - immigrant_count):
-                    child = Mutation.gaussian_mutation(child, self.mutation_rate)
-                    new_population.append(child)
+        # We leave space for random immigrants (10% of population by default)
+        immigrant_count = int(self.population_size * self.immigrant_rate)
+        offspring_count = max(0, self.population_size - immigrant_count - row)
+
+        if offspring_count > 0:
+            # Each pair gives two children; recombine all pairs in one batch
+            pair_count = (offspring_count + 1) // 2
+            parents = Selection.select_indices(self.population.fitness_scores, 2 * pair_count,
+                                               self.selection_method, tournament_size=3,
+                                               rng=rng_service.stream("selection", generation))
+            parents_a = self.population.genomes[parents[0::2]]
+            parents_b = self.population.genomes[parents[1::2]]
+
+            children_a, children_b = Crossover.batch_crossover(
+                parents_a, parents_b, self.crossover_method,
+                rng=rng_service.stream("crossover", generation))
+            offspring = new_genomes[row:row + offspring_count]
+            offspring[0::2] = children_a[:len(offspring[0::2])]
+            offspring[1::2] = children_b[:len(offspring[1::2])]
+
+            # Mutate all offspring in place
+            Mutation.batch_mutation(offspring, self.mutation_method, self.mutation_rate,
+                                    generation, self.generations,
+                                    rng=rng_service.stream("mutation", generation))
+            row += offspring_count
         
         # Random Immigrants (Fresh Genes)
         # Inject completely random individuals to maintain diversity
-        for _ in range(immigrant_count):
-            new_population.append(NeuralNetwork(NN_INPUT_NODES, NN_HIDDEN_NODES, NN_OUTPUT_NODES))
+        # (this also fills any remaining gaps)
+        for row in range(row, self.population_size):
+            new_genomes[row] = NeuralNetwork(
+                NN_INPUT_NODES, NN_HIDDEN_NODES, NN_OUTPUT_NODES,
+                rng=rng_service.individual(generation, row)).get_weights_as_array()
 
-        # Fill any remaining gaps
-        while len(new_population) < self.population_size:
-            new_population.append(NeuralNetwork(NN_INPUT_NODES, NN_HIDDEN_NODES, NN_OUTPUT_NODES))
-
-        self.population.replace_population(new_population)
+        self.population.replace_genomes(new_genomes)
 
         # Adaptive parameter adjustment
         if self.adaptive_mutation and diversity < self.diversity_threshold:
@@ -206,29 +221,88 @@ class GeneticAlgorithm:
             'worst_fitness': current_stats['min'],
             'fitness_std': current_stats['std'],
             'diversity': diversity,
+            'distance_mean': diversity_stats['distance_mean'],
+            'distance_error': diversity_stats['distance_error'],
+            'mean_gene_variance': diversity_stats['mean_gene_variance'],
             'mutation_rate': self.mutation_rate,
             'evolution_time': generation_time,
             'elite_count': self.elite_count
         }
 
         self.generation_stats.append(gen_stats)
+        if self.stats_log is not None:
+            self.stats_log.append(gen_stats)
         return gen_stats
 
-    def save_generation_stats(self, filename="data/statistics/evolution_stats.json"):
-        """Save evolution statistics to file"""
+    def algorithm_parameters(self):
+        return {
+            'population_size': self.population_size,
+            'generations': self.generations,
+            'mutation_rate': MUTATION_RATE,
+            'crossover_rate': self.crossover_rate,
+            'elite_count': self.elite_count,
+            'selection_method': self.selection_method,
+            'crossover_method': self.crossover_method,
+            'mutation_method': self.mutation_method
+        }
+
+    def get_state(self):
+        """Snapshot of everything the next generations depend on (for checkpoints)"""
+        return {
+            'parameters': {key: getattr(self, key) for key in CHECKPOINT_PARAMETERS},
+            'generation': self.population.generation,
+            'genomes': self.population.genomes.copy(),
+            'fitness_scores': np.asarray(self.population.fitness_scores, dtype=np.float64),
+            'best_fitness_history': list(self.best_fitness_history),
+            'average_fitness_history': list(self.average_fitness_history),
+            'diversity_history': list(self.diversity_history),
+            'generation_stats': list(self.generation_stats),
+            'stats_log': self.stats_log.offsets() if self.stats_log is not None else None
+        }
+
+    def set_state(self, state):
+        """Continue from get_state() (the stats log is reopened by the caller)"""
+        for key, value in state['parameters'].items():
+            setattr(self, key, value)
+
+        population = self.population
+        population.load_genomes(state['genomes'])
+        population.fitness_scores = [float(score) for score in state['fitness_scores']]
+        population.generation = state['generation']
+
+        self.best_fitness_history = list(state['best_fitness_history'])
+        self.average_fitness_history = list(state['average_fitness_history'])
+        self.diversity_history = list(state['diversity_history'])
+        self.generation_stats = list(state['generation_stats'])
+
+    def open_stats_log(self, log_file=GENERATION_STATS_LOG, csv_file=GENERATION_STATS_FILE,
+                       offsets=None):
+        """
+        Stream every generation's statistics to an append-only log and CSV
+
+        Args:
+            offsets: StatsLog.offsets() to continue an earlier log from
+                     (None starts a new log with this run's parameters)
+        """
+        self.stats_log = StatsLog(log_file, csv_file, offsets)
+        if offsets is None:
+            self.stats_log.write_parameters(self.algorithm_parameters())
+        return self.stats_log
+
+    def close_stats_log(self):
+        if self.stats_log is not None:
+            self.stats_log.close()
+            self.stats_log = None
+
+    def save_generation_stats(self, filename=EVOLUTION_STATS_FILE):
+        """Save the legacy evolution statistics summary (compacted from the log if one is open)"""
+        if self.stats_log is not None:
+            return compact(self.stats_log.log_file, filename)
+
         os.makedirs(os.path.dirname(filename), exist_ok=True)
 
         stats_data = {
-            'algorithm_parameters': {
-                'population_size': self.population_size,
-                'generations': self.generations,
-                'mutation_rate': MUTATION_RATE,
-                'crossover_rate': self.crossover_rate,
-                'elite_count': self.elite_count,
-                'selection_method': self.selection_method,
-                'crossover_method': self.crossover_method,
-                'mutation_method': self.mutation_method
-            },
+            'algorithm_parameters': self.algorithm_parameters(),
             'generation_statistics': self.generation_stats,
             'fitness_history': {
                 'best': self.best_fitness_history,
@@ -239,11 +313,18 @@ class GeneticAlgorithm:
 
         with open(filename, 'w') as f:
             json.dump(stats_data, f, indent=2)
+        return stats_data
 
-    def save_best_individual(self, filename="data/models/best_bird.json"):
+    def save_best_individual(self, filename=BEST_BIRD_FILE):
         os.makedirs(os.path.dirname(filename), exist_ok=True)
         return self.population.save_best(filename)
 
+    def save_top_individuals(self, count=TOP_BIRDS_COUNT, filename=TOP_BIRDS_FILE):
+        """Save the count fittest networks, with their fitness, as one binary model stack"""
+        genomes, fitness = self.emigrants(count)
+        save_models(filename, genomes, self.population.layer_sizes, fitness)
+        return len(genomes)
+
     def get_evolution_summary(self):
         """Get summary of evolution process"""
         if not self.generation_stats:
@@ -0,0 +1,206 @@
+import argparse
+import os
+import struct
+import zlib
+import numpy as np
+from src.ai.neural_network import NeuralNetwork, PARAM_DTYPE
+from src.utils.constants import *
+
+# File layout (little-endian):
+#   header     MODEL_HEADER
+#   layers     layer_count x uint32 layer sizes
+#   fitness    model_count x float64 (NaN when unknown)
+#   padding    zeros up to a MODEL_ALIGNMENT boundary
+#   params     model_count x num_params parameters of the header dtype
+# The checksum is the CRC-32 of everything after the header.
+MODEL_MAGIC = b"FBNN"
+# magic, version, dtype code, layer count, model count, params per model, checksum
+MODEL_HEADER = struct.Struct("<4sHBBIII")
+MODEL_ALIGNMENT = 64
+
+# Parameter dtype codes
+MODEL_DTYPES = {1: np.dtype("<f4"), 2: np.dtype("<f8")}
+MODEL_DTYPE_CODES = {dtype: code for code, dtype in MODEL_DTYPES.items()}
+PARAM_FILE_DTYPE = np.dtype(PARAM_DTYPE).newbyteorder("<")
+
+
+class ModelFormatError(ValueError):
+    """A model file is not in the binary model format, or is damaged"""
+
+
+def data_offset(layer_count, model_count):
+    """Byte offset of the parameter block"""
+    offset = MODEL_HEADER.size + 4 * layer_count + 8 * model_count
+    return -(-offset // MODEL_ALIGNMENT) * MODEL_ALIGNMENT
+
+
+def save_models(filename, genomes, layer_sizes, fitness=None):
+    """
+    Write a stack of networks (e.g. the top-k of a generation) to one file
+
+    The file is written next to its destination and renamed into place, so
+    readers never see a half-written model.
+
+    Args:
+        filename: Destination path
+        genomes: (M, P) parameter matrix (or one (P,) vector)
+        layer_sizes: Architecture shared by every model
+        fitness: Optional fitness of each model
+    """
+    genomes = np.atleast_2d(np.asarray(genomes, dtype=PARAM_DTYPE))
+    layer_sizes = [int(size) for size in layer_sizes]
+    model_count, num_params = genomes.shape
+    if num_params != NeuralNetwork.count_params(layer_sizes):
+        raise ValueError(f"{num_params} parameters do not match layers {layer_sizes}")
+
+    scores = np.full(model_count, np.nan) if fitness is None else np.asarray(fitness, "<f8")
+    offset = data_offset(len(layer_sizes), model_count)
+
+    body = b"".join([
+        np.asarray(layer_sizes, dtype="<u4").tobytes(),
+        scores.astype("<f8").tobytes(),
+        bytes(offset - MODEL_HEADER.size - 4 * len(layer_sizes) - 8 * model_count),
+        genomes.astype(PARAM_FILE_DTYPE).tobytes()
+    ])
+    header = MODEL_HEADER.pack(MODEL_MAGIC, MODEL_FORMAT_VERSION,
+                               MODEL_DTYPE_CODES[PARAM_FILE_DTYPE], len(layer_sizes),
+                               model_count, num_params, zlib.crc32(body))
+
+    directory = os.path.dirname(filename)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temporary = f"{filename}.tmp"
+    with open(temporary, 'wb') as f:
+        f.write(header)
+        f.write(body)
+    os.replace(temporary, filename)
+
+
+def read_header(buffer):
+    if len(buffer) < MODEL_HEADER.size:
+        raise ModelFormatError("File too short for a model header")
+    magic, version, dtype_code, layer_count, model_count, num_params, checksum = \
+        MODEL_HEADER.unpack_from(buffer)
+    if magic != MODEL_MAGIC:
+        raise ModelFormatError(f"Not a model file (magic {magic!r})")
+    if version > MODEL_FORMAT_VERSION:
+        raise ModelFormatError(f"Model format version {version} is newer than "
+                               f"{MODEL_FORMAT_VERSION}")
+    if dtype_code not in MODEL_DTYPES:
+        raise ModelFormatError(f"Unknown parameter dtype code {dtype_code}")
+    return {
+        'version': version,
+        'dtype': MODEL_DTYPES[dtype_code],
+        'layer_count': layer_count,
+        'model_count': model_count,
+        'num_params': num_params,
+        'checksum': checksum
+    }
+
+
+def load_models(filename, mmap=True, verify=True):
+    """
+    Read a model file without parsing or copying the parameters
+
+    Args:
+        filename: Path of a file written by save_models
+        mmap: Map the file (np.memmap) instead of reading it into memory
+        verify: Check the CRC-32 (reads the whole file once)
+
+    Returns:
+        dict with 'layer_sizes', 'fitness' (M,) and read-only 'genomes' (M, P)
+    """
+    # np.memmap cannot map an empty file, so check the size first
+    size = os.path.getsize(filename)
+    if size < MODEL_HEADER.size:
+        raise ModelFormatError(f"Model file truncated ({size} of {MODEL_HEADER.size} header bytes)")
+
+    buffer = (np.memmap(filename, dtype=np.uint8, mode='r') if mmap
+              else np.fromfile(filename, dtype=np.uint8))
+    header = read_header(buffer)
+    layer_count, model_count, num_params = (header['layer_count'], header['model_count'],
+                                            header['num_params'])
+    offset = data_offset(layer_count, model_count)
+    end = offset + model_count * num_params * header['dtype'].itemsize
+    if len(buffer) < end:
+        raise ModelFormatError(f"Model file truncated ({len(buffer)} of {end} bytes)")
+    if verify and zlib.crc32(buffer[MODEL_HEADER.size:end]) != header['checksum']:
+        raise ModelFormatError("Model checksum mismatch")
+
+    layer_sizes = buffer[MODEL_HEADER.size:MODEL_HEADER.size + 4 * layer_count].view("<u4")
+    fitness_start = MODEL_HEADER.size + 4 * layer_count
+    fitness = buffer[fitness_start:fitness_start + 8 * model_count].view("<f8")
+    genomes = buffer[offset:end].view(header['dtype']).reshape(model_count, num_params)
+    if NeuralNetwork.count_params(layer_sizes.tolist()) != num_params:
+        raise ModelFormatError("Layer sizes do not match the parameter count")
+
+    return {
+        'version': header['version'],
+        'layer_sizes': layer_sizes.tolist(),
+        'fitness': np.array(fitness),
+        'genomes': genomes
+    }
+
+
+def network_from_params(layer_sizes, params):
+    """NeuralNetwork viewing params (no initialization)"""
+    return NeuralNetwork(layer_sizes[0], list(layer_sizes[1:-1]), layer_sizes[-1], params=params)
+
+
+def save_network(network, filename, fitness=None):
+    """Write one network in the binary format"""
+    save_models(filename, network.get_weights_as_array()[None, :], network.layer_sizes,
+                None if fitness is None else [fitness])
+
+
+def load_network(filename, index=0):
+    """Load one network (a writable copy) from a binary model file"""
+    # A copy is made anyway, so a plain read beats setting up a mapping
+    models = load_models(filename, mmap=False)
+    params = np.array(models['genomes'][index], dtype=PARAM_DTYPE)
+    return network_from_params(models['layer_sizes'], params)
+
+
+def import_json(json_file, filename=None):
+    """
+    Load a legacy JSON model (save_to_file format), optionally writing it as binary
+
+    Returns:
+        The NeuralNetwork
+    """
+    network = NeuralNetwork.from_file(json_file)
+    if filename is not None:
+        save_network(network, filename)
+    return network
+
+
+def export_json(filename, json_file, index=0):
+    """Write model `index` of a binary model file as legacy JSON"""
+    network = load_network(filename, index)
+    network.save_to_file(json_file)
+    return network
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert between JSON and binary model files")
+    parser.add_argument('command', choices=['import', 'export', 'info'],
+                        help='import: JSON -> binary, export: binary -> JSON, info: describe')
+    parser.add_argument('source')
+    parser.add_argument('destination', nargs='?')
+    parser.add_argument('--index', type=int, default=0, help='Model to export from a stack')
+    args = parser.parse_args()
+
+    if args.command == 'import':
+        import_json(args.source,
+                    args.destination or os.path.splitext(args.source)[0] + MODEL_EXTENSION)
+    elif args.command == 'export':
+        export_json(args.source, args.destination or os.path.splitext(args.source)[0] + ".json",
+                    args.index)
+    else:
+        models = load_models(args.source)
+        print(f"📦 {args.source}: format v{models['version']}, {len(models['genomes'])} model(s), "
+              f"layers {models['layer_sizes']}, fitness {models['fitness'].tolist()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,112 @@
 import numpy as np
-import random
+from src.utils.constants import *
+from src.utils.rng import get_rng_service
 
 
 class Mutation:
+    """
+    Mutation operators.
+
+    The batch_* kernels mutate an (M, P) genome matrix (or a slice of
+    Population.genomes) in place with one mask draw and one value draw per
+    batch, and return the number of genes they changed. The per-network
+    methods copy the individual and run the same kernel on a batch of one.
+    """
+
+    @staticmethod
+    def mutation_mask(genomes, mutation_rate, rng):
+        """Boolean (M, P) mask, True for each gene that mutates"""
+        return rng.random(genomes.shape) < mutation_rate
+
+    @staticmethod
+    def batch_gaussian(genomes, mutation_rate=0.1, mutation_strength=MUTATION_STRENGTH, rng=None):
+        """Gaussian mutation: add N(0, mutation_strength) noise to the masked genes"""
+        rng = get_rng_service().next_stream("mutation") if rng is None else rng
+        mask = Mutation.mutation_mask(genomes, mutation_rate, rng)
+        count = int(np.count_nonzero(mask))
+        genomes[mask] += rng.normal(0, mutation_strength, count).astype(genomes.dtype)
+        return count
+
+    @staticmethod
+    def batch_uniform(genomes, mutation_rate=0.1, mutation_range=MUTATION_RANGE, rng=None):
+        """Uniform mutation: replace the masked genes with U(-range, +range)"""
+        rng = get_rng_service().next_stream("mutation") if rng is None else rng
+        mask = Mutation.mutation_mask(genomes, mutation_rate, rng)
+        count = int(np.count_nonzero(mask))
+        genomes[mask] = rng.uniform(-mutation_range, mutation_range, count)
+        return count
+
+    @staticmethod
+    def batch_creep(genomes, mutation_rate=0.1, creep_step=CREEP_STEP, rng=None):
+        """Creep mutation: nudge the masked genes by a small U(-step, +step)"""
+        rng = get_rng_service().next_stream("mutation") if rng is None else rng
+        mask = Mutation.mutation_mask(genomes, mutation_rate, rng)
+        count = int(np.count_nonzero(mask))
+        genomes[mask] += rng.uniform(-creep_step, creep_step, count).astype(genomes.dtype)
+        return count
+
+    @staticmethod
+    def batch_boundary(genomes, mutation_rate=0.1, limit=BOUNDARY_LIMIT, rng=None):
+        """Boundary mutation: set the masked genes to -limit or +limit at random"""
+        rng = get_rng_service().next_stream("mutation") if rng is None else rng
+        mask = Mutation.mutation_mask(genomes, mutation_rate, rng)
+        count = int(np.count_nonzero(mask))
+        genomes[mask] = np.where(rng.random(count) < 0.5, -limit, limit)
+        return count
+
+    @staticmethod
+    def adaptive_rate(generation, max_generations,
+                      initial_rate=ADAPTIVE_INITIAL_RATE, final_rate=ADAPTIVE_FINAL_RATE):
+        """Mutation rate moving linearly from initial_rate to final_rate over the run"""
+        progress = min(1.0, max(0.0, generation / max_generations)) if max_generations else 1.0
+        return initial_rate * (1 - progress) + final_rate * progress
+
+    @staticmethod
+    def batch_adaptive(genomes, generation, max_generations,
+                       initial_rate=ADAPTIVE_INITIAL_RATE, final_rate=ADAPTIVE_FINAL_RATE,
+                       mutation_strength=MUTATION_STRENGTH, rng=None):
+        """Gaussian mutation at the generation-scheduled adaptive rate"""
+        mutation_rate = Mutation.adaptive_rate(generation, max_generations,
+                                               initial_rate, final_rate)
+        return Mutation.batch_gaussian(genomes, mutation_rate, mutation_strength, rng)
+
+    @staticmethod
+    def batch_mutation(genomes, method="gaussian", mutation_rate=0.1,
+                       generation=0, max_generations=GENERATIONS, rng=None):
+        """
+        Mutate a genome matrix in place with the named operator (a MUTATION_METHODS key)
+
+        Args:
+            genomes: (M, P) matrix, changed in place
+            method: "gaussian", "uniform", "creep", "boundary" or "adaptive"
+            mutation_rate: Per-gene probability (ignored by "adaptive")
+            generation: Current generation (for "adaptive")
+            max_generations: Total generations (for "adaptive")
+            rng: numpy Generator (None for the run's next ad hoc "mutation" stream)
+
+        Returns:
+            Number of genes mutated
+        """
+        if method == "adaptive":
+            return Mutation.batch_adaptive(genomes, generation, max_generations, rng=rng)
+
+        kernels = {
+            "gaussian": Mutation.batch_gaussian,
+            "uniform": Mutation.batch_uniform,
+            "creep": Mutation.batch_creep,
+            "boundary": Mutation.batch_boundary
+        }
+        if method not in kernels:
+            raise ValueError(f"Unknown mutation method: {method}")
+        return kernels[method](genomes, mutation_rate, rng=rng)
+
+    @staticmethod
+    def _mutated_copy(individual, kernel, *args):
+        """Copy the individual and run a batch kernel on its single row"""
+        mutated_individual = individual.clone()
+        kernel(mutated_individual.get_weights_as_array()[None], *args)
+        return mutated_individual
+
     @staticmethod
     def gaussian_mutation(individual, mutation_rate=0.1, mutation_strength=0.2):
         """
@@ -16,16 +120,8 @@ class Mutation:
         Returns:
             Mutated neural network
         """
-        mutated_individual = individual.copy()
-        params = mutated_individual.get_weights_as_array()
-
-        for i in range(len(params)):
-            if random.random() < mutation_rate:
-                # Add Gaussian noise
-                params[i] += np.random.normal(0, mutation_strength)
-
-        mutated_individual.set_weights_from_array(params)
-        return mutated_individual
+        return Mutation._mutated_copy(individual, Mutation.batch_gaussian,
+                                      mutation_rate, mutation_strength)
 
     @staticmethod
     def uniform_mutation(individual, mutation_rate=0.1, mutation_range=0.5):
@@ -40,16 +136,40 @@ class Mutation:
         Returns:
             Mutated neural network
         """
-        mutated_individual = individual.copy()
-        params = mutated_individual.get_weights_as_array()
+        return Mutation._mutated_copy(individual, Mutation.batch_uniform,
+                                      mutation_rate, mutation_range)
 
-        for i in range(len(params)):
-            if random.random() < mutation_rate:
-                # Replace with uniform random value
-                params[i] = random.uniform(-mutation_range, mutation_range)
+    @staticmethod
+    def creep_mutation(individual, mutation_rate=0.1, creep_step=CREEP_STEP):
+        """
+        Creep mutation: Nudge parameters by small uniform steps
 
-        mutated_individual.set_weights_from_array(params)
-        return mutated_individual
+        Args:
+            individual: Neural network to mutate
+            mutation_rate: Probability of mutating each parameter
+            creep_step: Maximum size of a step
+
+        Returns:
+            Mutated neural network
+        """
+        return Mutation._mutated_copy(individual, Mutation.batch_creep,
+                                      mutation_rate, creep_step)
+
+    @staticmethod
+    def boundary_mutation(individual, mutation_rate=0.1, limit=BOUNDARY_LIMIT):
+        """
+        Boundary mutation: Set parameters to the lower or upper bound
+
+        Args:
+            individual: Neural network to mutate
+            mutation_rate: Probability of mutating each parameter
+            limit: Parameters are set to -limit or +limit
+
+        Returns:
+            Mutated neural network
+        """
+        return Mutation._mutated_copy(individual, Mutation.batch_boundary,
+                                      mutation_rate, limit)
 
     @staticmethod
     def adaptive_mutation(individual, generation, max_generations,
@@ -69,7 +189,7 @@ class Mutation:
             Mutated neural network
         """
         # Calculate adaptive mutation rate
-        progress = generation / max_generations
-        mutation_rate = initial_rate * (1 - progress) + final_rate * progress
+        mutation_rate = Mutation.adaptive_rate(generation, max_generations,
+                                               initial_rate, final_rate)
 
         return Mutation.gaussian_mutation(individual, mutation_rate, mutation_strength)
@@ -1,11 +1,15 @@
 import numpy as np
 import json
-import time
 from src.utils.constants import *
+from src.utils.rng import get_rng_service
+
+# Precision of every network parameter (and of Population.genomes)
+PARAM_DTYPE = np.float32
 
 
 class NeuralNetwork:
-    def __init__(self, input_nodes=4, hidden_nodes=[6, 4], output_nodes=1, seed=None):
+    def __init__(self, input_nodes=4, hidden_nodes=[6, 4], output_nodes=1, seed=None, params=None,
+                 rng=None):
         """
         Initialize neural network with specified architecture
 
@@ -13,7 +17,13 @@ class NeuralNetwork:
             input_nodes: Number of input neurons (bird state: y, velocity, pipe_x, pipe_y)
             hidden_nodes: List of hidden layer sizes [6, 4] 
             output_nodes: Number of output neurons (1 for jump decision)
-            seed: Random seed for initialization (None for automatic)
+            seed: Random seed for initialization (None for the next "init"
+                  stream of the run's RNG service)
+            params: Flat parameter vector to use instead of random initialization
+                    (e.g. a row of Population.genomes, which is viewed, not copied)
+            rng: numpy Generator to initialize from (overrides seed)
+
+        Global random state (random / np.random) is never used or reseeded.
         """
         self.input_nodes = input_nodes
         self.hidden_nodes = hidden_nodes
@@ -23,32 +33,36 @@ class NeuralNetwork:
         self.layer_sizes = [input_nodes] + hidden_nodes + [output_nodes]
         self.num_layers = len(self.layer_sizes)
 
-        # FIXED: Set unique random seed if not provided
-        if seed is not None:
-            # Ensure seed is in valid range for numpy
-            seed = int(seed) % (2**31 - 1)
-            np.random.seed(seed)
-        else:
-            # Create unique seed based on current time and random component
-            unique_seed = (int(time.time() * 1000000) +
-                           np.random.randint(0, 100000)) % (2**31 - 1)
-            np.random.seed(unique_seed)
-
-        # Initialize weights and biases
+        # Weights and biases are reshaped views into one flat vector
+        self.params = None
         self.weights = []
         self.biases = []
-        self.initialize_network()
 
-        # Activation functions
-        self.activation_functions = {
+        if params is not None:
+            self.bind(params)
+        else:
+            if rng is None:
+                if seed is not None:
+                    # Ensure seed is in valid range for numpy
+                    rng = np.random.default_rng(int(seed) % (2**31 - 1))
+                else:
+                    rng = get_rng_service().next_stream("init")
+
+            self.initialize_network(rng)
+
+    @property
+    def activation_functions(self):
+        """Activation functions by name"""
+        return {
             'sigmoid': self.sigmoid,
             'tanh': self.tanh,
             'relu': self.relu,
             'leaky_relu': self.leaky_relu
         }
 
-    def initialize_network(self):
+    def initialize_network(self, rng):
         """FIXED: Initialize weights and biases with proper diversity"""
+        parts = []
         for i in range(self.num_layers - 1):
             # Xavier/Glorot initialization for better convergence
             fan_in = self.layer_sizes[i]
@@ -57,24 +71,62 @@ class NeuralNetwork:
 
             # Weights: shape (current_layer_size, next_layer_size)
             # FIXED: Add extra randomization to ensure diversity
-            weight_matrix = np.random.uniform(-limit, limit,
+            weight_matrix = rng.uniform(-limit, limit,
                                               (self.layer_sizes[i], self.layer_sizes[i + 1]))
 
             # Add small random perturbation to ensure no two networks are identical
-            perturbation = np.random.normal(0, 0.01, weight_matrix.shape)
+            perturbation = rng.normal(0, 0.01, weight_matrix.shape)
             weight_matrix += perturbation
 
-            self.weights.append(weight_matrix)
+            parts.append(weight_matrix.ravel())
 
             # Biases: shape (next_layer_size,)
-            bias_vector = np.random.uniform(-0.5,
+            bias_vector = rng.uniform(-0.5,
                                             0.5, (self.layer_sizes[i + 1],))
 
             # Add perturbation to biases too
-            bias_perturbation = np.random.normal(0, 0.01, bias_vector.shape)
+            bias_perturbation = rng.normal(0, 0.01, bias_vector.shape)
             bias_vector += bias_perturbation
 
-            self.biases.append(bias_vector)
+            parts.append(bias_vector)
+
+        self.bind(np.concatenate(parts).astype(PARAM_DTYPE))
+
+    @staticmethod
+    def count_params(layer_sizes):
+        """Number of weights and biases of a network with these layer sizes"""
+        return sum(layer_sizes[i] * layer_sizes[i + 1] + layer_sizes[i + 1]
+                   for i in range(len(layer_sizes) - 1))
+
+    def bind(self, params):
+        """
+        Point the network at a flat parameter vector
+
+        weights[i] and biases[i] become reshaped views into params (layer by
+        layer, weights then biases), so writing to params changes the network
+        and flattening it again costs nothing.
+
+        Args:
+            params: 1-D float32 array with get_total_params() entries
+        """
+        params = np.asarray(params)
+        if params.dtype != PARAM_DTYPE:
+            params = params.astype(PARAM_DTYPE)
+        if params.shape != (self.count_params(self.layer_sizes),):
+            raise ValueError(
+                f"Expected {self.count_params(self.layer_sizes)} parameters, got {params.shape}")
+
+        self.params = params
+        self.weights = []
+        self.biases = []
+        idx = 0
+        for i in range(self.num_layers - 1):
+            fan_in = self.layer_sizes[i]
+            fan_out = self.layer_sizes[i + 1]
+            self.weights.append(params[idx:idx + fan_in * fan_out].reshape(fan_in, fan_out))
+            idx += fan_in * fan_out
+            self.biases.append(params[idx:idx + fan_out])
+            idx += fan_out
 
     def sigmoid(self, x):
         """Sigmoid activation function"""
@@ -146,13 +198,11 @@ class NeuralNetwork:
         Used by genetic algorithm for crossover and mutation
 
         Returns:
-            numpy array: All network parameters flattened
+            numpy array: All network parameters flattened. This is the network's
+            own parameter vector (no copy); copy it before changing it unless
+            the change is meant for this network.
         """
-        params = []
-        for i in range(len(self.weights)):
-            params.extend(self.weights[i].flatten())
-            params.extend(self.biases[i].flatten())
-        return np.array(params)
+        return self.params
 
     def set_weights_from_array(self, params_array):
         """
@@ -166,36 +216,50 @@ class NeuralNetwork:
             raise ValueError(
                 f"Expected {self.get_total_params()} parameters, got {len(params_array)}")
 
-        idx = 0
-        for i in range(len(self.weights)):
-            # Reshape weights
-            weight_size = self.weights[i].size
-            self.weights[i] = params_array[idx:idx +
-                                           weight_size].reshape(self.weights[i].shape)
-            idx += weight_size
-
-            # Reshape biases
-            bias_size = self.biases[i].size
-            self.biases[i] = params_array[idx:idx +
-                                          bias_size].reshape(self.biases[i].shape)
-            idx += bias_size
+        # Copy in place so views (and a Population genome row) stay valid
+        self.params[:] = params_array
 
     def get_total_params(self):
         """Get total number of parameters in the network"""
-        total = 0
-        for i in range(len(self.weights)):
-            total += self.weights[i].size + self.biases[i].size
-        return total
+        return self.params.size
+
+    def with_params(self, params):
+        """
+        Network with this architecture bound to params (viewed, not copied)
+
+        Skips __init__ entirely: no weight initialization and no use of any
+        random number generator.
+        """
+        network = NeuralNetwork.__new__(NeuralNetwork)
+        network.input_nodes = self.input_nodes
+        network.hidden_nodes = self.hidden_nodes
+        network.output_nodes = self.output_nodes
+        network.layer_sizes = self.layer_sizes
+        network.num_layers = self.num_layers
+        network.bind(params)
+        return network
+
+    def clone(self):
+        """
+        Copy of the network in a fresh buffer
+
+        Never initializes weights or touches global RNG state. The training
+        loop does not clone at all: elites and children are written into the
+        population's spare genome matrix (Population.next_genomes).
+        """
+        return self.with_params(self.params.copy())
 
     def copy(self):
         """Create a deep copy of the neural network"""
-        new_network = NeuralNetwork(
-            self.input_nodes, self.hidden_nodes, self.output_nodes)
-        new_network.set_weights_from_array(self.get_weights_as_array())
-        return new_network
+        return self.clone()
 
     def save_to_file(self, filename):
-        """Save network to JSON file"""
+        """Save network to file (binary model format, or legacy JSON for a .json name)"""
+        if not filename.endswith(".json"):
+            from src.ai.model_io import save_network
+            save_network(self, filename)
+            return
+
         network_data = {
             'architecture': {
                 'input_nodes': self.input_nodes,
@@ -210,18 +274,36 @@ class NeuralNetwork:
             json.dump(network_data, f, indent=2)
 
     def load_from_file(self, filename):
-        """Load network from JSON file"""
+        """Load network from a binary model file or a legacy JSON file"""
+        if not filename.endswith(".json"):
+            from src.ai.model_io import load_models
+            models = load_models(filename, mmap=False)
+            sizes = models['layer_sizes']
+            self.__init__(sizes[0], sizes[1:-1], sizes[-1],
+                          params=np.array(models['genomes'][0], dtype=PARAM_DTYPE))
+            return
+
         with open(filename, 'r') as f:
             network_data = json.load(f)
 
+        # Restore weights and biases, flattened in bind() order
+        parts = []
+        for w, b in zip(network_data['weights'], network_data['biases']):
+            parts.append(np.ravel(w))
+            parts.append(np.ravel(b))
+
         # Restore architecture
         arch = network_data['architecture']
         self.__init__(arch['input_nodes'],
-                      arch['hidden_nodes'], arch['output_nodes'])
-
-        # Restore weights and biases
-        self.weights = [np.array(w) for w in network_data['weights']]
-        self.biases = [np.array(b) for b in network_data['biases']]
+                      arch['hidden_nodes'], arch['output_nodes'],
+                      params=np.concatenate(parts).astype(PARAM_DTYPE))
+
+    @classmethod
+    def from_file(cls, filename):
+        """Load a network without random initialization (see load_from_file)"""
+        network = cls.__new__(cls)
+        network.load_from_file(filename)
+        return network
 
     def get_network_info(self):
         """Get network architecture information"""
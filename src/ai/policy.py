@@ -0,0 +1,106 @@
+import numpy as np
+
+
+class PopulationPolicy:
+    """
+    Batched inference for a whole population of neural networks.
+
+    Stacks the weights and biases of every individual into per-layer tensors
+    of shape (N, in, out) and (N, out), so one forward pass over an (N, 4)
+    observation matrix costs one batched matmul per layer instead of one
+    NeuralNetwork.forward_pass call per bird.
+    """
+
+    def __init__(self, individuals):
+        """
+        Args:
+            individuals: List of NeuralNetwork objects sharing one architecture
+                         (usually Population.individuals)
+        """
+        self.weights = []
+        self.biases = []
+        self.size = 0
+        self.refresh(individuals)
+
+    def refresh(self, individuals):
+        """Re-stack parameters after the population has changed"""
+        self.size = len(individuals)
+        if not individuals:
+            self.weights = []
+            self.biases = []
+            return
+
+        layer_sizes = individuals[0].layer_sizes
+        for network in individuals:
+            if network.layer_sizes != layer_sizes:
+                raise ValueError(
+                    f"All networks must share one architecture, got {network.layer_sizes} and {layer_sizes}")
+
+        self.layer_sizes = layer_sizes
+        num_layers = len(individuals[0].weights)
+        self.weights = [np.stack([network.weights[i] for network in individuals])
+                        for i in range(num_layers)]
+        self.biases = [np.stack([network.biases[i] for network in individuals])
+                       for i in range(num_layers)]
+
+    def forward(self, observations, alive_mask=None):
+        """
+        Forward pass for every (alive) individual at once
+
+        Args:
+            observations: (N, input_nodes) matrix, row i is bird i's game state
+            alive_mask: Optional boolean array; dead rows are skipped
+
+        Returns:
+            (N, output_nodes) array of outputs, NaN for dead birds
+        """
+        # Same input precision as NeuralNetwork.forward_pass
+        activation = np.asarray(observations, dtype=np.float32)
+        if activation.shape != (self.size, self.layer_sizes[0]):
+            raise ValueError(
+                f"Expected observations of shape {(self.size, self.layer_sizes[0])}, got {activation.shape}")
+
+        weights, biases = self.weights, self.biases
+        rows = None
+        if alive_mask is not None and not np.all(alive_mask):
+            rows = np.flatnonzero(alive_mask)
+            activation = activation[rows]
+            weights = [w[rows] for w in weights]
+            biases = [b[rows] for b in biases]
+
+        last = len(weights) - 1
+        for i in range(len(weights)):
+            z = np.matmul(activation[:, None, :], weights[i])[:, 0, :] + biases[i]
+            z = np.clip(z, -500, 500)
+            if i < last:
+                activation = np.tanh(z)
+            else:
+                activation = 1.0 / (1.0 + np.exp(-z))
+
+        if rows is None:
+            return activation
+
+        outputs = np.full((self.size, activation.shape[1]), np.nan)
+        outputs[rows] = activation
+        return outputs
+
+    def decide(self, observations, alive_mask=None):
+        """
+        Jump decisions for the whole population
+
+        Args:
+            observations: (N, input_nodes) matrix of game states
+            alive_mask: Optional boolean array; dead birds never jump
+
+        Returns:
+            Boolean array of length N, True where the bird should jump
+        """
+        outputs = self.forward(observations, alive_mask)[:, 0]
+        # NaN (dead) compares False
+        return outputs > 0.5
+
+    def __len__(self):
+        return self.size
+
+    def __str__(self):
+        return f"PopulationPolicy(size={self.size}, layers={getattr(self, 'layer_sizes', [])})"
@@ -1,11 +1,24 @@
-import time
-from src.ai.neural_network import NeuralNetwork
+import numpy as np
+from src.ai.neural_network import NeuralNetwork, PARAM_DTYPE
+from src.ai.diversity import Diversity
+from src.utils.rng import get_rng_service
 from src.utils.constants import *
 
 
 class Population:
-    def __init__(self, size, network_architecture=None):
+    """
+    Population of neural networks stored as one (N, P) genome matrix.
+
+    Row i of genomes holds every parameter of individuals[i]; the
+    NeuralNetwork objects are views into their row, so the genetic operators
+    can work on whole rows or on the matrix at once. A spare matrix of the
+    same shape is kept to build the next generation in without allocating.
+    """
+
+    def __init__(self, size, network_architecture=None, rng_service=None):
         self.size = size
+        # Streams for the initial networks (an island passes its own service)
+        self.rng_service = rng_service if rng_service is not None else get_rng_service()
         self.individuals = []
         self.fitness_scores = []
         self.generation = 1
@@ -19,30 +32,88 @@ class Population:
             }
 
         self.architecture = network_architecture
+        self.layer_sizes = ([network_architecture['input_nodes']] +
+                            list(network_architecture['hidden_nodes']) +
+                            [network_architecture['output_nodes']])
+        self.num_params = NeuralNetwork.count_params(self.layer_sizes)
+
+        self.genomes = np.zeros((0, self.num_params), dtype=PARAM_DTYPE)
+        self.spare_genomes = np.zeros((0, self.num_params), dtype=PARAM_DTYPE)
         self.initialize_population()
 
     def initialize_population(self):
         """Create initial random population with FORCED DIVERSITY"""
         self.individuals = []
-        current_time = int(time.time() * 1000)
+        self.genomes = np.empty((self.size, self.num_params), dtype=PARAM_DTYPE)
+        rng_service = self.rng_service
 
         print(f"🧬 Generating {self.size} unique neural networks...")
 
         for i in range(self.size):
-            # Create a unique seed for every single bird
-            # Combining time + index ensures no two birds are identical
-            unique_seed = (current_time + i * 997) % (2**32 - 1)
-
+            # Every bird gets its own stream, keyed by (generation 0, index)
             network = NeuralNetwork(
                 input_nodes=self.architecture['input_nodes'],
                 hidden_nodes=self.architecture['hidden_nodes'],
                 output_nodes=self.architecture['output_nodes'],
-                seed=unique_seed  # Explicitly pass the seed
+                rng=rng_service.individual(0, i)
             )
+            self.genomes[i] = network.params
+            network.bind(self.genomes[i])
             self.individuals.append(network)
 
+        self.spare_genomes = np.empty_like(self.genomes)
         self.fitness_scores = [0.0] * self.size
 
+    def create_view(self, row):
+        """NeuralNetwork whose parameters are row `row` of the genome matrix"""
+        return NeuralNetwork(self.architecture['input_nodes'],
+                             self.architecture['hidden_nodes'],
+                             self.architecture['output_nodes'],
+                             params=self.genomes[row])
+
+    def rebind(self):
+        """Point individuals[i] at genomes[i], creating or dropping views as needed"""
+        individuals = self.individuals[:len(self.genomes)]
+        for i, network in enumerate(individuals):
+            network.bind(self.genomes[i])
+        for i in range(len(individuals), len(self.genomes)):
+            individuals.append(self.create_view(i))
+        self.individuals = individuals
+
+    def next_genomes(self, count=None):
+        """
+        Spare (count, P) matrix to write the next generation into
+
+        Its contents are undefined; pass it to replace_genomes when filled.
+        """
+        if count is None:
+            count = len(self.genomes)
+        if self.spare_genomes.shape[0] != count:
+            self.spare_genomes = np.empty((count, self.num_params), dtype=PARAM_DTYPE)
+        return self.spare_genomes
+
+    def load_genomes(self, genomes):
+        """
+        Install a new genome matrix and rebind the individuals to its rows
+
+        The current matrix becomes the spare buffer, so networks from before
+        the call must not be used afterwards (the birds are recreated anyway).
+        """
+        genomes = np.asarray(genomes, dtype=PARAM_DTYPE)
+        if genomes.ndim != 2 or genomes.shape[1] != self.num_params:
+            raise ValueError(
+                f"Expected genomes of shape (N, {self.num_params}), got {genomes.shape}")
+
+        self.spare_genomes, self.genomes = self.genomes, genomes
+        self.rebind()
+
+    def add_individual(self, network):
+        """Append a network as a new genome row (grows the matrix)"""
+        self.genomes = np.vstack([self.genomes, network.get_weights_as_array()[None, :]])
+        self.spare_genomes = np.empty_like(self.genomes)
+        self.individuals.append(network)
+        self.rebind()
+
     def get_best_individual(self):
         """Get the best performing individual"""
         if not self.fitness_scores:
@@ -61,7 +132,6 @@ class Population:
         if not self.fitness_scores:
             return {'min': 0, 'max': 0, 'avg': 0, 'std': 0}
 
-        import numpy as np
         scores = np.array(self.fitness_scores)
         return {
             'min': float(np.min(scores)),
@@ -72,25 +142,38 @@ class Population:
         }
 
     def replace_population(self, new_individuals):
-        """Replace current population with new individuals"""
+        """Replace current population with new individuals (their parameters are copied)"""
         # Allow slight mismatches in size (handle immigrants/elites) by trimming or padding if necessary
         if len(new_individuals) > self.size:
             new_individuals = new_individuals[:self.size]
 
-        self.individuals = new_individuals
-        self.fitness_scores = [0.0] * len(new_individuals)
+        genomes = self.next_genomes(len(new_individuals))
+        for i, network in enumerate(new_individuals):
+            genomes[i] = network.get_weights_as_array()
+        self.replace_genomes(genomes)
+
+    def replace_genomes(self, genomes):
+        """Replace current population with the rows of an (N, P) genome matrix"""
+        if len(genomes) > self.size:
+            genomes = genomes[:self.size]
+
+        self.load_genomes(genomes)
+        self.fitness_scores = [0.0] * len(genomes)
         self.generation += 1
 
     def sort_by_fitness(self, descending=True):
-        """Sort population by fitness"""
+        """Sort population (genome rows) by fitness"""
         if not self.fitness_scores or len(self.fitness_scores) != len(self.individuals):
             return
 
-        sorted_data = sorted(zip(self.individuals, self.fitness_scores),
-                             key=lambda x: x[1], reverse=descending)
-        self.individuals, self.fitness_scores = zip(*sorted_data)
-        self.individuals = list(self.individuals)
-        self.fitness_scores = list(self.fitness_scores)
+        scores = np.asarray(self.fitness_scores, dtype=np.float64)
+        # Stable either way, like sorted(..., reverse=descending)
+        order = np.argsort(-scores if descending else scores, kind="stable")
+
+        genomes = self.next_genomes()
+        np.take(self.genomes, order, axis=0, out=genomes)
+        self.load_genomes(genomes)
+        self.fitness_scores = scores[order].tolist()
 
     def save_best(self, filename):
         """Save best individual to file"""
@@ -102,25 +185,15 @@ class Population:
         return 0
 
     def get_diversity_measure(self):
-        """Calculate genetic diversity of population"""
+        """Calculate genetic diversity of population (exact mean pairwise L1 distance)"""
         if len(self.individuals) < 2:
             return 0
 
-        # Calculate average pairwise distance between individuals
-        total_distance = 0
-        comparisons = 0
-        sample_size = min(10, len(self.individuals))
-
-        for i in range(sample_size):
-            for j in range(i + 1, sample_size):
-                params1 = self.individuals[i].get_weights_as_array()
-                params2 = self.individuals[j].get_weights_as_array()
-                distance = sum(abs(p1 - p2)
-                               for p1, p2 in zip(params1, params2))
-                total_distance += distance
-                comparisons += 1
-
-        return total_distance / comparisons if comparisons > 0 else 0
+        return Diversity.mean_pairwise_l1(self.genomes)
+
+    def get_diversity_statistics(self, rng=None):
+        """Full diversity report (distances, error bounds, per-gene variance)"""
+        return Diversity.population_diversity(self.genomes, rng=rng)
 
     def __len__(self):
         return len(self.individuals)
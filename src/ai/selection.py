@@ -1,56 +1,140 @@
-import random
+import numpy as np
+from src.utils.constants import *
+from src.utils.rng import get_rng_service
+
 
 class Selection:
+    """
+    Parent selection.
+
+    The *_indices methods pick every parent of a generation in one call and
+    return an array of row indices into the population (and its genome
+    matrix); fitness weights, cumulative sums and ranks are computed once
+    per call. The per-individual methods are the same draws with count=1.
+    """
+
+    @staticmethod
+    def tournament_indices(fitness_scores, count, tournament_size=TOURNAMENT_SIZE, rng=None):
+        """
+        Run count tournaments at once over an (count, k) index draw
+
+        Contestants are drawn with replacement, so a tournament costs O(k)
+        instead of a sample over the whole population.
+        """
+        rng = get_rng_service().next_stream("selection") if rng is None else rng
+        fitness = np.asarray(fitness_scores, dtype=np.float64)
+        size = max(1, min(tournament_size, len(fitness)))
+
+        contestants = rng.integers(0, len(fitness), size=(count, size))
+        winners = np.argmax(fitness[contestants], axis=1)
+        return contestants[np.arange(count), winners]
+
+    @staticmethod
+    def selection_weights(fitness_scores):
+        """Non-negative roulette weights (negative fitness is shifted like before)"""
+        weights = np.asarray(fitness_scores, dtype=np.float64)
+        min_fitness = weights.min()
+        if min_fitness < 0:
+            weights = weights - min_fitness + 1
+        return weights
+
+    @staticmethod
+    def roulette_indices(weights, count, rng=None):
+        """Roulette wheel: count independent spins via cumsum + searchsorted"""
+        rng = get_rng_service().next_stream("selection") if rng is None else rng
+        cumulative = np.cumsum(weights)
+        total = cumulative[-1]
+        if total <= 0:
+            return rng.integers(0, len(cumulative), size=count)
+
+        spins = rng.random(count) * total
+        return np.minimum(np.searchsorted(cumulative, spins, side="right"),
+                          len(cumulative) - 1)
+
+    @staticmethod
+    def sus_indices(weights, count, rng=None):
+        """
+        Stochastic universal sampling: count equally spaced pointers, one spin
+
+        Returned in random order so consecutive picks can be paired as parents.
+        """
+        rng = get_rng_service().next_stream("selection") if rng is None else rng
+        cumulative = np.cumsum(weights)
+        total = cumulative[-1]
+        if total <= 0:
+            return rng.integers(0, len(cumulative), size=count)
+
+        step = total / count
+        pointers = rng.random() * step + step * np.arange(count)
+        picks = np.minimum(np.searchsorted(cumulative, pointers, side="right"),
+                           len(cumulative) - 1)
+        return rng.permutation(picks)
+
+    @staticmethod
+    def rank_weights(fitness_scores, selection_pressure=SELECTION_PRESSURE):
+        """
+        Linear ranking weights, computed with one sort
+
+        The worst individual gets 2 - pressure, the best gets pressure
+        (pressure in [1, 2]; ties keep their original order).
+        """
+        fitness = np.asarray(fitness_scores, dtype=np.float64)
+        size = len(fitness)
+        ranks = np.empty(size, dtype=np.float64)
+        ranks[np.argsort(fitness, kind="stable")] = np.arange(size)
+
+        if size == 1:
+            return np.ones(1)
+        return (2 - selection_pressure) + 2 * (selection_pressure - 1) * ranks / (size - 1)
+
+    @staticmethod
+    def elite_indices(fitness_scores, count):
+        """Indices of the count best individuals (cycled if count exceeds the population)"""
+        order = np.argsort(-np.asarray(fitness_scores, dtype=np.float64), kind="stable")
+        return np.resize(order, count)
+
+    @staticmethod
+    def select_indices(fitness_scores, count, method="tournament",
+                       tournament_size=TOURNAMENT_SIZE, rng=None):
+        """
+        All parent indices for a generation in one call
+
+        Args:
+            fitness_scores: Fitness of every individual
+            count: Number of parents to pick
+            method: "tournament", "roulette", "sus", "rank" or "elite"
+            tournament_size: Contestants per tournament
+            rng: numpy Generator (None for the run's next ad hoc "selection" stream)
+
+        Returns:
+            Integer array of count row indices
+        """
+        if method == "tournament":
+            return Selection.tournament_indices(fitness_scores, count, tournament_size, rng)
+        if method == "roulette":
+            return Selection.roulette_indices(Selection.selection_weights(fitness_scores), count, rng)
+        if method == "sus":
+            return Selection.sus_indices(Selection.selection_weights(fitness_scores), count, rng)
+        if method == "rank":
+            return Selection.roulette_indices(Selection.rank_weights(fitness_scores), count, rng)
+        if method == "elite":
+            return Selection.elite_indices(fitness_scores, count)
+        raise ValueError(f"Unknown selection method: {method}")
+
     @staticmethod
     def tournament_selection(population, fitness_scores, tournament_size=3):
-        # Select random individuals for tournament
-        tournament_indices = random.sample(range(len(population)), 
-                                         min(tournament_size, len(population)))
-        
-        # Find the best individual in tournament
-        best_idx = max(tournament_indices, key=lambda i: fitness_scores[i])
-        return population[best_idx]
-    
+        return population[Selection.tournament_indices(fitness_scores, 1, tournament_size)[0]]
+
     @staticmethod
     def roulette_wheel_selection(population, fitness_scores):
-        # Handle negative fitness values by shifting
-        min_fitness = min(fitness_scores)
-        if min_fitness < 0:
-            adjusted_fitness = [f - min_fitness + 1 for f in fitness_scores]
-        else:
-            adjusted_fitness = fitness_scores
-            
-        total_fitness = sum(adjusted_fitness)
-        if total_fitness == 0:
-            return random.choice(population)
-            
-        # Calculate selection probabilities
-        probabilities = [f / total_fitness for f in adjusted_fitness]
-        
-        # Spin the wheel
-        r = random.random()
-        cumulative_prob = 0
-        for i, prob in enumerate(probabilities):
-            cumulative_prob += prob
-            if r <= cumulative_prob:
-                return population[i]
-                
-        return population[-1]  # Fallback
-    
-    @staticmethod  
+        weights = Selection.selection_weights(fitness_scores)
+        return population[Selection.roulette_indices(weights, 1)[0]]
+
+    @staticmethod
     def rank_selection(population, fitness_scores):
-        # Create rank-based weights
-        sorted_indices = sorted(range(len(fitness_scores)), 
-                              key=lambda i: fitness_scores[i])
-        ranks = [0] * len(population)
-        for rank, idx in enumerate(sorted_indices):
-            ranks[idx] = rank + 1
-            
-        return Selection.roulette_wheel_selection(population, ranks)
-    
+        weights = Selection.rank_weights(fitness_scores)
+        return population[Selection.roulette_indices(weights, 1)[0]]
+
     @staticmethod
     def elite_selection(population, fitness_scores, elite_count):
-        elite_indices = sorted(range(len(fitness_scores)), 
-                             key=lambda i: fitness_scores[i], 
-                             reverse=True)[:elite_count]
-        return [population[i] for i in elite_indices]
\ No newline at end of file
+        return [population[i] for i in Selection.elite_indices(fitness_scores, elite_count)]
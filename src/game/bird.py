@@ -3,8 +3,10 @@ from src.utils.constants import *
 
 
 class Bird:
-    def __init__(self, x, y, bird_sprites, bird_type="BLUE"):
+    def __init__(self, x, y, bird_sprites, bird_type="BLUE", atlas=None):
         self.sprites = bird_sprites
+        self.atlas = atlas
+        self.mask = None
         self.bird_type = bird_type
         self.current_sprite = 0
         self.image = self.sprites[self.current_sprite] if self.sprites else pygame.Surface(
@@ -26,8 +28,8 @@ class Bird:
         self.fitness = 0
         self.brain = None
 
-        # Track passed pipes for scoring (Fix for AI training)
-        self.passed_pipes = []
+        # Sequence number of the next pipe pair to pass (for scoring)
+        self.next_pipe_seq = 0
 
         self.flap_speed = 5
         self.frames_survived = 0
@@ -49,7 +51,7 @@ class Bird:
             self.velocity = self.max_velocity
 
         self.rect.y += int(self.velocity)
-        self.rotation = min(25, max(-90, -(self.velocity * 3)))
+        self.rotation = min(BIRD_MAX_ROTATION, max(BIRD_MIN_ROTATION, -(self.velocity * 3)))
         self.update_animation()
 
         # Continuous fitness reward for staying alive
@@ -64,8 +66,14 @@ class Bird:
             self.current_sprite = (self.current_sprite + 1) % len(self.sprites)
             self.flap_animation_counter = 0
 
-        original_image = self.sprites[self.current_sprite]
-        self.image = pygame.transform.rotate(original_image, self.rotation)
+        if self.atlas:
+            # Cached rotation + mask, no per-frame transform
+            self.image, self.mask = self.atlas.get(
+                self.current_sprite, self.rotation)
+        else:
+            original_image = self.sprites[self.current_sprite]
+            self.image = pygame.transform.rotate(original_image, self.rotation)
+            self.mask = None
         old_center = self.rect.center
         self.rect = self.image.get_rect(center=old_center)
 
@@ -166,7 +174,7 @@ class Bird:
         self.score = 0
         self.fitness = 0
         self.current_sprite = 0
-        self.passed_pipes = []
+        self.next_pipe_seq = 0
         self.frames_survived = 0
 
     def draw(self, screen):
@@ -175,7 +183,9 @@ class Bird:
 
     def get_mask(self):
         """Get collision mask for the bird"""
-        return pygame.mask.from_surface(self.image)
+        if self.mask is None:
+            self.mask = pygame.mask.from_surface(self.image)
+        return self.mask
 
     def get_fitness_info(self):
         return {
@@ -1,14 +1,22 @@
+import os
 import pygame
 import sys
 import time
 import random
 import numpy as np
+from collections import deque
 from src.utils.asset_loader import AssetLoader
 from src.game.bird import Bird
-from src.game.pipe import PipeManager
 from src.game.renderer import Renderer
+from src.game.scheduler import FrameScheduler
 from src.utils.constants import *
 from src.ai.neural_network import NeuralNetwork
+from src.ai.policy import PopulationPolicy
+from src.sim.collision import analytic_collisions
+from src.sim.course import PipeCourse
+from src.sim.observation import build_observations
+from src.utils.telemetry import Telemetry, DEBUG, LEVELS
+from src.utils.rng import get_rng_service
 
 
 class GameEngine:
@@ -19,9 +27,8 @@ class GameEngine:
         self.paused = False
         self.theme = "DAY"
 
-        # Set different random seeds for true randomness
-        random.seed(time.time())
-        np.random.seed(int(time.time() * 1000000) % 2**32)
+        # Seed the game loop's random / np.random from the run seed
+        get_rng_service().seed_legacy()
 
         # Display setup
         # self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
@@ -30,6 +37,8 @@ class GameEngine:
 
         pygame.display.set_caption("Flappy Bird - Genetic Algorithm [DEBUG]")
         self.clock = pygame.time.Clock()
+        self.scheduler = FrameScheduler()
+        self.render_best_only = False
 
         # Screen dimensions
         self.screen_width = SCREEN_WIDTH
@@ -50,8 +59,8 @@ class GameEngine:
 
         # Game objects
         self.birds = []
-        self.pipe_manager = PipeManager(
-            self.asset_loader.get_pipe_sprite("GREEN"))
+        self.pipe_type = "GREEN"
+        self.collision_mode = DEFAULT_COLLISION_MODE
 
         # Game variables
         self.score = 0
@@ -65,14 +74,22 @@ class GameEngine:
         self.generation_start_time = time.time()
         self.generation_frame_count = 0
 
+        # Seeded pipe course shared with the headless engine (see new_course)
+        self.course_round = 1
+        self.pipe_course = PipeCourse(seed=get_rng_service().course_seed(self.generation))
+        self.pipe_rects = None
+
         # Initialize genetic algorithm
         self.genetic_algorithm = None
+        self.policy = None
 
         # DEBUG: Add comprehensive debugging
         self.debug_mode = False
-        self.decision_log = []
-        self.game_state_log = []
-        self.collision_log = []
+        self.telemetry = Telemetry()
+        self.telemetry.start()
+        self.decision_log = deque(maxlen=TELEMETRY_HISTORY_SIZE)
+        self.game_state_log = deque(maxlen=TELEMETRY_HISTORY_SIZE)
+        self.collision_log = deque(maxlen=TELEMETRY_HISTORY_SIZE)
 
         # Performance tracking
         self.fps_counter = 0
@@ -93,7 +110,8 @@ class GameEngine:
     def init_human_game(self):
         """Initialize game for human player"""
         bird_sprites = self.asset_loader.get_bird_sprites("BLUE")
-        self.birds = [Bird(100, 300, bird_sprites, "BLUE")]
+        self.birds = [Bird(100, 300, bird_sprites, "BLUE",
+                      self.asset_loader.get_bird_atlas("BLUE"))]
         print("Human game mode initialized")
 
     def init_ai_training(self):
@@ -111,6 +129,7 @@ class GameEngine:
                 crossover_rate=CROSSOVER_RATE,
                 elite_count=ELITE_COUNT
             )
+            self.genetic_algorithm.open_stats_log()
             print(f"✅ Genetic Algorithm initialized")
 
         # Create birds and assign neural network brains
@@ -134,23 +153,26 @@ class GameEngine:
             start_x = 80 + (i % 10) * 2  # Spread across screen width
             start_y = 200 + (i % 20) * 10  # Spread across different heights
 
-            bird = Bird(start_x, start_y, bird_sprites, bird_type)
+            bird = Bird(start_x, start_y, bird_sprites, bird_type,
+                        self.asset_loader.get_bird_atlas(bird_type))
             self.birds.append(bird)
 
         # FIXED: Create diverse neural networks with different random seeds
         if not hasattr(self.genetic_algorithm, 'population') or not self.genetic_algorithm.population.individuals:
             print("🧠 Creating initial neural networks with diverse weights...")
             for i, bird in enumerate(self.birds):
-                # Set different seed for each bird to ensure diversity
-                seed = (int(time.time() * 1000000) + i * 1337) % (2**31 - 1)
-
+                # Separate random stream for each bird to ensure diversity
                 brain = NeuralNetwork(
-                    NN_INPUT_NODES, NN_HIDDEN_NODES, NN_OUTPUT_NODES, seed=seed)
+                    NN_INPUT_NODES, NN_HIDDEN_NODES, NN_OUTPUT_NODES,
+                    rng=get_rng_service().individual(0, i))
                 bird.brain = brain
         else:
             # Use evolved brains
             self.genetic_algorithm.assign_brains_to_birds(self.birds)
 
+        # Stack all brains for batched inference in update_birds_with_debugging
+        self.policy = PopulationPolicy([bird.brain for bird in self.birds])
+
         self.test_neural_network_diversity()
         print(f"✅ Created {len(self.birds)} AI birds")
 
@@ -178,17 +200,19 @@ class GameEngine:
     def init_ai_play(self):
         """Initialize game for watching trained AI play"""
         bird_sprites = self.asset_loader.get_bird_sprites("BLUE")
-        bird = Bird(100, 300, bird_sprites, "BLUE")
+        bird = Bird(100, 300, bird_sprites, "BLUE",
+                      self.asset_loader.get_bird_atlas("BLUE"))
 
         try:
             from src.ai.neural_network import NeuralNetwork
-            brain = NeuralNetwork(
-                NN_INPUT_NODES, NN_HIDDEN_NODES, NN_OUTPUT_NODES)
-            brain.load_from_file("data/models/best_bird.json")
+            # Binary model from training, else the legacy JSON model
+            model_file = (BEST_BIRD_FILE if os.path.exists(BEST_BIRD_FILE)
+                          else BEST_BIRD_JSON_FILE)
+            brain = NeuralNetwork.from_file(model_file)
             bird.brain = brain
-            print("🧠 Loaded best bird model")
-        except:
-            print("⚠️ Could not load best bird, using random")
+            print(f"🧠 Loaded best bird model ({model_file})")
+        except Exception as e:
+            print(f"⚠️ Could not load best bird ({e}), using random")
 
         self.birds = [bird]
         print("AI play mode initialized")
@@ -216,9 +240,32 @@ class GameEngine:
                     self.paused = not self.paused
                 elif event.key == pygame.K_d:  # Toggle debug mode
                     self.debug_mode = not self.debug_mode
+                    self.set_debug_telemetry(self.debug_mode)
+                elif event.key in (pygame.K_EQUALS, pygame.K_PLUS, pygame.K_KP_PLUS):
+                    self.scheduler.faster()
+                    print(f"⏩ Speed: {self.scheduler.describe()}")
+                elif event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+                    self.scheduler.slower()
+                    print(f"⏪ Speed: {self.scheduler.describe()}")
+                elif event.key == pygame.K_0:      # back to real time
+                    self.scheduler.reset_speed()
+                    print(f"▶️ Speed: {self.scheduler.describe()}")
+                elif event.key == pygame.K_u:      # unthrottled fast-forward
+                    self.scheduler.toggle_unthrottled()
+                    print(f"⏩ Speed: {self.scheduler.describe()}")
+                elif event.key == pygame.K_b:      # draw only the best bird
+                    self.render_best_only = not self.render_best_only
 
         return True
 
+    def set_debug_telemetry(self, enabled):
+        """Record and print DEBUG telemetry while debug mode is on"""
+        if enabled:
+            self.telemetry.level = self.telemetry.echo_level = DEBUG
+        else:
+            self.telemetry.level = LEVELS[TELEMETRY_LEVEL]
+            self.telemetry.echo_level = LEVELS[TELEMETRY_ECHO_LEVEL]
+
     def handle_human_input(self):
         if self.game_state == GAME_STATES["MENU"]:
             self.game_state = GAME_STATES["PLAYING"]
@@ -240,7 +287,8 @@ class GameEngine:
         self.generation_frame_count += 1
         
         self.update_birds_with_debugging()
-        self.pipe_manager.update()
+        self.pipe_course.update()
+        self.pipe_rects = None
         self.check_scoring()
         self.check_game_over()
         self.update_fps_counter()
@@ -250,6 +298,23 @@ class GameEngine:
         alive_count = 0
         decision_summary = {"jump": 0, "no_jump": 0}
 
+        # Sampling decisions are made once per frame, not per bird
+        frame = self.generation_frame_count
+        log_state = self.telemetry.enabled("game_state", DEBUG, frame)
+        log_decisions = self.telemetry.enabled("decision", DEBUG, frame)
+
+        # Evaluate every alive brain in one batched pass when training
+        policy_outputs = None
+        if self.mode == "ai_training" and self.policy is not None:
+            alive_mask = np.array([bird.alive for bird in self.birds])
+            observations = build_observations(
+                [bird.rect.left for bird in self.birds],
+                [bird.rect.right for bird in self.birds],
+                [bird.rect.centery for bird in self.birds],
+                [bird.velocity for bird in self.birds],
+                *self.pipe_course.bottom_arrays())
+            policy_outputs = self.policy.forward(observations, alive_mask)[:, 0]
+
         for i, bird in enumerate(self.birds):
             if bird.alive:
                 alive_count += 1
@@ -260,28 +325,41 @@ class GameEngine:
                     pass
                 elif self.mode in ["ai_training", "ai_play"]:
                     # FIXED: AI decision making with detailed debugging
-                    if bird.brain:
+                    if policy_outputs is not None:
+                        output = policy_outputs[i]
+                        jump = output > 0.5
+
+                        if i == 0 and log_state:
+                            self.log_game_state(i, observations[i])
+                        if i < 3 and log_decisions:
+                            self.log_decision(i, output, jump)
+
+                        if jump:
+                            decision_summary["jump"] += 1
+                        else:
+                            decision_summary["no_jump"] += 1
+
+                    elif bird.brain:
                         # Get current game state
-                        pipes = self.pipe_manager.get_pipes()
-                        game_state = bird.get_game_state(pipes)
+                        game_state = build_observations(
+                            [bird.rect.left], [bird.rect.right], [bird.rect.centery],
+                            [bird.velocity], *self.pipe_course.bottom_arrays())[0]
 
-                        # DEBUG: Log game state for first bird
-                        if i == 0 and self.generation_frame_count % 10 == 0:
-                            print(
-                                f"Frame {self.generation_frame_count}: Bird state = {[f'{x:.3f}' for x in game_state]}")
+                        if i == 0 and log_state:
+                            self.log_game_state(i, game_state)
 
                         # Make neural network decision
                         try:
                             output = bird.brain.forward_pass(game_state)
                             jump = output > 0.5
 
-                            # DEBUG: Log decisions for analysis
-                            if i < 3 and self.generation_frame_count % 15 == 0:
-                                print(
-                                    f"   Bird {i}: NN output={output:.3f}, jump={jump}")
+                            if i < 3 and log_decisions:
+                                self.log_decision(i, output, jump)
 
                         except Exception as e:
-                            print(f"⚠️ Neural network error for bird {i}: {e}")
+                            self.telemetry.warning(
+                                "nn_error", "⚠️ Neural network error for bird %d: %s", i, e,
+                                frame=frame)
                             jump = random.random() < 0.1  # Fallback
 
                         # Track decision statistics
@@ -304,18 +382,39 @@ class GameEngine:
                     bird, ground_y, i)
 
                 if collision:
-                    # DEBUG: Log collision details
-                    if self.debug_mode and i < 3:
-                        print(
-                            f"   Bird {i} collision at frame {self.generation_frame_count}: y={bird.rect.y}, reason={collision}")
+                    self.log_collision(i, bird, collision)
+
+        if self.collision_mode == "analytic":
+            self.check_pipe_collisions_analytic()
 
-        # DEBUG: Print decision summary every 30 frames
-        if self.generation_frame_count % 30 == 0 and alive_count > 0:
+        if alive_count > 0 and self.telemetry.enabled("decision_summary", frame=frame):
             total_decisions = sum(decision_summary.values())
             if total_decisions > 0:
                 jump_pct = (decision_summary["jump"] / total_decisions) * 100
-                print(
-                    f"Frame {self.generation_frame_count}: {alive_count} alive, {jump_pct:.1f}% jumping")
+                self.telemetry.info("decision_summary", "%d alive, %.1f%% jumping",
+                                    alive_count, jump_pct, frame=frame)
+
+    def log_game_state(self, bird_index, game_state):
+        """Keep a sampled network input vector and send it to telemetry"""
+        frame = self.generation_frame_count
+        state = [float(x) for x in game_state]
+        self.game_state_log.append((frame, bird_index, state))
+        self.telemetry.debug("game_state", "Bird %d state = %s", bird_index,
+                             [round(x, 3) for x in state], frame=frame)
+
+    def log_decision(self, bird_index, output, jump):
+        """Keep a sampled network decision and send it to telemetry"""
+        frame = self.generation_frame_count
+        self.decision_log.append((frame, bird_index, float(output), bool(jump)))
+        self.telemetry.debug("decision", "Bird %d: NN output=%.3f, jump=%s",
+                             bird_index, output, jump, frame=frame)
+
+    def log_collision(self, bird_index, bird, reason):
+        """Keep a collision record and send it to telemetry"""
+        frame = self.generation_frame_count
+        self.collision_log.append((frame, bird_index, bird.rect.y, reason))
+        self.telemetry.debug("collision", "Bird %d collision: y=%d, reason=%s",
+                             bird_index, bird.rect.y, reason, frame=frame)
 
     def check_bird_collision_detailed(self, bird, ground_y, bird_index):
         if not bird.alive:
@@ -333,47 +432,127 @@ class GameEngine:
             collision_reason = "ceiling"
             bird.alive = False
 
-        # Check pipe collision with detailed detection
-        else:
-            pipes = self.pipe_manager.get_pipes()
-            for pipe in pipes:
-                if bird.rect.colliderect(pipe.rect):
-                    # Use mask collision for pixel-perfect detection
-                    try:
-                        bird_mask = pygame.mask.from_surface(bird.image)
-                        pipe_mask = pygame.mask.from_surface(pipe.image)
-                        offset = (pipe.rect.x - bird.rect.x,
-                                  pipe.rect.y - bird.rect.y)
-                        if bird_mask.overlap(pipe_mask, offset):
-                            collision_reason = f"pipe_{pipe.is_top}"
-                            bird.alive = False
-                            break
-                    except:
-                        # Fallback to rect collision
-                        collision_reason = f"pipe_{pipe.is_top}_rect"
-                        bird.alive = False
-                        break
+        # Pipes: analytic mode checks every bird at once in check_pipe_collisions_analytic
+        elif self.collision_mode == "hitbox":
+            collision_reason = self.check_pipe_collision_hitbox(bird)
 
-        # Handle collision for human mode
-        if collision_reason and self.mode == "human":
+        elif self.collision_mode == "pixel":
+            collision_reason = self.check_pipe_collision_pixel(bird)
+
+        if collision_reason:
+            self.on_bird_collision()
+
+        return collision_reason
+
+    def new_course(self):
+        """
+        Restart the pipe course with a run-seeded schedule: one course per
+        generation when training (the same one the headless engine uses),
+        one per round otherwise
+        """
+        self.course_round += 1
+        round_index = self.generation if self.mode == "ai_training" else self.course_round
+        self.pipe_course.reset(get_rng_service().course_seed(round_index))
+        self.pipe_rects = None
+
+    def get_pipe_rects(self):
+        """(rect, is_top) of every pipe on screen, built once per frame from the course"""
+        if self.pipe_rects is None:
+            left, _, _, gap_bottom, top_pipe_top = self.pipe_course.pair_arrays()
+            width, height = self.pipe_course.width, self.pipe_course.height
+            self.pipe_rects = []
+            for x, top, bottom in zip(left, top_pipe_top, gap_bottom):
+                self.pipe_rects.append((pygame.Rect(int(x), int(top), width, height), True))
+                self.pipe_rects.append((pygame.Rect(int(x), int(bottom), width, height), False))
+        return self.pipe_rects
+
+    def check_pipe_collision_pixel(self, bird):
+        """Pixel-perfect pipe collision using the cached bird and pipe masks"""
+        for pipe_rect, is_top in self.get_pipe_rects():
+            if bird.rect.colliderect(pipe_rect):
+                try:
+                    bird_mask = bird.get_mask()
+                    pipe_mask = self.asset_loader.get_pipe_mask(self.pipe_type, is_top)
+                    offset = (pipe_rect.x - bird.rect.x,
+                              pipe_rect.y - bird.rect.y)
+                    if bird_mask.overlap(pipe_mask, offset):
+                        bird.alive = False
+                        return f"pipe_{is_top}"
+                except:
+                    # Fallback to rect collision
+                    bird.alive = False
+                    return f"pipe_{is_top}_rect"
+        return None
+
+    def check_pipe_collision_hitbox(self, bird):
+        """Lenient rect collision: both boxes shrunk like Bird.check_collision"""
+        hitbox = bird.rect.inflate(-2 * HITBOX_BIRD_SHRINK, -2 * HITBOX_BIRD_SHRINK)
+        for pipe_rect, is_top in self.get_pipe_rects():
+            pipe_hitbox = pipe_rect.inflate(-2 * HITBOX_PIPE_SHRINK, -2 * HITBOX_PIPE_SHRINK)
+            if hitbox.colliderect(pipe_hitbox):
+                bird.alive = False
+                return f"pipe_{is_top}_hitbox"
+        return None
+
+    def check_pipe_collisions_analytic(self):
+        """Vectorized pipe collision for all alive birds against the pipes in their column"""
+        alive_birds = [bird for bird in self.birds if bird.alive]
+        if not alive_birds:
+            return 0
+
+        hit = analytic_collisions(
+            [bird.rect.left for bird in alive_birds],
+            [bird.rect.right for bird in alive_birds],
+            [bird.rect.top for bird in alive_birds],
+            [bird.rect.bottom for bird in alive_birds],
+            *self.pipe_course.pair_arrays())
+
+        alive_indices = [i for i, bird in enumerate(self.birds) if bird.alive]
+        for i in np.flatnonzero(hit):
+            alive_birds[i].alive = False
+            self.log_collision(alive_indices[i], alive_birds[i], "pipe_analytic")
+
+        if hit.any():
+            self.on_bird_collision()
+        return int(np.count_nonzero(hit))
+
+    def on_bird_collision(self):
+        """Handle collision for human mode"""
+        if self.mode == "human":
             self.game_state = GAME_STATES["GAME_OVER"]
             sound = self.asset_loader.get_sound("hit")
             if sound:
                 sound.play()
             self.save_high_score()
 
-        return collision_reason
+    def check_score(self, bird):
+        """
+        Check if bird passed through its next pipe.
+        Each bird only remembers the sequence number of the next pair it has
+        to pass (bird.next_pipe_seq), so scoring is one comparison per bird.
+        """
+        # Pairs that left the screen before the bird passed them never score
+        bird.next_pipe_seq = max(bird.next_pipe_seq, self.pipe_course.oldest_seq())
+
+        right = self.pipe_course.right_edge(bird.next_pipe_seq)
+        if right is not None and right < bird.rect.left:
+            bird.next_pipe_seq += 1
+            # Immediate fitness reward for passing
+            bird.fitness += FITNESS_BONUS_PIPE
+            return 1
+        return 0
 
     def check_scoring(self):
         """Check and update scoring with debugging"""
         for bird in self.birds:
             if bird.alive:
-                score_gained = self.pipe_manager.check_score(bird)
+                score_gained = self.check_score(bird)
                 if score_gained > 0:
                     bird.score += score_gained
                     self.score = max(self.score, bird.score)
 
-                    print(f"🎯 Bird scored! New score: {bird.score}")
+                    self.telemetry.info("score", "🎯 Bird scored! New score: %d", bird.score,
+                                        frame=self.generation_frame_count)
 
                     # Update high score
                     if self.score > self.high_score:
@@ -428,19 +607,19 @@ class GameEngine:
         print(f"   🏆 Best fitness: {max_fitness:.1f}")
         print(f"   🎯 Best score: {best_score}")
 
-        # Evolve
-        self.genetic_algorithm.evolve_generation()
-
-        # Save best individual
+        # Save best individuals while their fitness is known
         if self.generation % 10 == 0 or best_score > 0:  # Save if we actually scored
             self.genetic_algorithm.save_best_individual()
-            self.genetic_algorithm.save_generation_stats()
+            self.genetic_algorithm.save_top_individuals()
+
+        # Evolve (appends this generation to the stats log)
+        self.genetic_algorithm.evolve_generation()
 
         self.generation += 1
         self.generation_start_time = time.time()
         self.generation_frame_count = 0
         self.score = 0
-        self.pipe_manager.clear()
+        self.new_course()
         self.create_ai_birds_with_debugging()
 
     def update_fps_counter(self):
@@ -455,8 +634,8 @@ class GameEngine:
 
         self.renderer.draw_fps(self.current_fps)
         self.renderer.draw_background(self.theme)
-        self.renderer.draw_pipes(self.pipe_manager)
-        self.renderer.draw_birds(self.birds)
+        self.renderer.draw_pipes(self.pipe_course, self.pipe_type)
+        self.renderer.draw_birds(self.get_birds_to_render())
 
         ground_y = self.renderer.draw_ground()
 
@@ -470,6 +649,15 @@ class GameEngine:
         # Update display
         pygame.display.flip()
 
+    def get_birds_to_render(self):
+        """All birds, or only the current best alive bird when render_best_only is set"""
+        if not self.render_best_only:
+            return self.birds
+        alive_birds = [bird for bird in self.birds if bird.alive]
+        if not alive_birds:
+            return []
+        return [max(alive_birds, key=lambda bird: bird.fitness)]
+
     def draw_debug_info(self):
         """Draw debug information on screen"""
         font = self.asset_loader.get_font("small")
@@ -555,6 +743,16 @@ class GameEngine:
 
         # Draw FPS at bottom-left, just above progress bar
         self.renderer.draw_fps(self.current_fps, 15, self.screen_height - 80)
+        self.draw_speed_info(15, self.screen_height - 100)
+
+    def draw_speed_info(self, x, y):
+        """Show the current simulation speed"""
+        font = self.asset_loader.get_font("small")
+        if font:
+            text = f"Speed: {self.scheduler.describe()}"
+            if self.render_best_only:
+                text += " [best bird]"
+            self.screen.blit(font.render(text, True, (255, 255, 255)), (x, y))
 
     def draw_ai_play_ui(self):
         """Draw UI for AI play mode"""
@@ -573,7 +771,7 @@ class GameEngine:
         self.frame_count = 0
         self.generation_frame_count = 0
         self.game_start_time = time.time()
-        self.pipe_manager.clear()
+        self.new_course()
         self.init_game_mode()
 
     def load_high_score(self):
@@ -596,8 +794,13 @@ class GameEngine:
         while running:
             running = self.handle_events()
             if not running: break
-            self.update_game()
+            for _ in range(self.scheduler.ticks_per_frame()):
+                self.update_game()
             self.render_game()
-            self.clock.tick(FPS)
+            self.scheduler.wait(self.clock)
+        self.telemetry.close()
+        if self.genetic_algorithm is not None and self.genetic_algorithm.stats_log is not None:
+            self.genetic_algorithm.save_generation_stats()
+            self.genetic_algorithm.close_stats_log()
         pygame.quit()
         sys.exit()
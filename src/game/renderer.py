@@ -80,8 +80,10 @@ class Renderer:
                     pygame.draw.circle(self.screen, color,
                                        (bird.rect.centerx, bird.rect.centery), 3)
 
-    def draw_pipes(self, pipe_manager):
-        pipe_manager.draw(self.screen)
+    def draw_pipes(self, pipe_course, pipe_type="GREEN"):
+        # Every pair is blitted with the same two sprites (top one pre-flipped)
+        pipe_course.draw(self.screen, self.assets.get_pipe_sprite(pipe_type, is_top=True),
+                         self.assets.get_pipe_sprite(pipe_type))
 
     def draw_score(self, score, center_x=None):
         score_str = str(score)
@@ -0,0 +1,57 @@
+from src.utils.constants import *
+
+
+class FrameScheduler:
+    """
+    Decouples simulation ticks from rendered frames.
+
+    In real-time mode the game renders at target_fps and runs
+    speed_multiplier simulation ticks per rendered frame (a multiplier below
+    1 slows the frame rate down instead). In unthrottled mode there is no
+    frame pacing at all: the simulation runs flat out and a frame is only
+    rendered every render_interval ticks.
+    """
+
+    def __init__(self, target_fps=FPS, speed_multiplier=SPEED_MULTIPLIER,
+                 render_interval=RENDER_INTERVAL, unthrottled=False):
+        self.target_fps = target_fps
+        self.speed_multiplier = self.clamp_speed(speed_multiplier)
+        self.render_interval = max(1, int(render_interval))
+        self.unthrottled = unthrottled
+
+    @staticmethod
+    def clamp_speed(speed):
+        return min(MAX_SPEED_MULTIPLIER, max(MIN_SPEED_MULTIPLIER, speed))
+
+    def ticks_per_frame(self):
+        """Simulation ticks to run before the next rendered frame"""
+        if self.unthrottled:
+            return self.render_interval
+        return max(1, int(self.speed_multiplier))
+
+    def wait(self, clock):
+        """Pace the loop (no-op when unthrottled)"""
+        if self.unthrottled:
+            return
+        clock.tick(self.target_fps * min(1.0, self.speed_multiplier))
+
+    def faster(self):
+        self.speed_multiplier = self.clamp_speed(self.speed_multiplier * 2)
+
+    def slower(self):
+        self.speed_multiplier = self.clamp_speed(self.speed_multiplier / 2)
+
+    def reset_speed(self):
+        self.speed_multiplier = 1.0
+        self.unthrottled = False
+
+    def toggle_unthrottled(self):
+        self.unthrottled = not self.unthrottled
+
+    def describe(self):
+        if self.unthrottled:
+            return f"MAX (1/{self.render_interval})"
+        return f"{self.speed_multiplier:g}x"
+
+    def __str__(self):
+        return f"FrameScheduler({self.describe()}, target_fps={self.target_fps})"
@@ -0,0 +1,71 @@
+import numpy as np
+from src.utils.constants import *
+
+
+def pipe_pair_arrays(pipes):
+    """
+    Describe each pipe pair by its x-range and gap bounds
+
+    Takes pygame Pipe objects (src/game/pipe.py), read through their rect.
+    A pair is identified by its bottom pipe; the top pipe ends at gap_top and
+    is one sprite height tall.
+
+    Returns:
+        (left, right, gap_top, gap_bottom, top_pipe_top) float arrays, one
+        entry per pair
+    """
+    bottoms = [pipe for pipe in pipes if not pipe.is_top]
+    left = np.array([getattr(pipe, 'rect', pipe).left for pipe in bottoms], dtype=np.float64)
+    right = np.array([getattr(pipe, 'rect', pipe).right for pipe in bottoms], dtype=np.float64)
+    gap_bottom = np.array([getattr(pipe, 'rect', pipe).top for pipe in bottoms], dtype=np.float64)
+    gap_top = np.array([max(0, pipe.gap_center - pipe.pipe_gap // 2) for pipe in bottoms],
+                       dtype=np.float64)
+    height = np.array([getattr(pipe, 'rect', pipe).height for pipe in bottoms], dtype=np.float64)
+    return left, right, gap_top, gap_bottom, gap_top - height
+
+
+def analytic_collisions(bird_left, bird_right, bird_top, bird_bottom,
+                        pipe_left, pipe_right, gap_top, gap_bottom, top_pipe_top,
+                        bird_shrink=0, pipe_shrink=0):
+    """
+    Pipe collisions for many birds at once using gap bounds.
+
+    Broadphase: only pipe pairs whose x-range overlaps the column spanned by
+    the birds are tested (one or two pairs in practice). Narrowphase: a bird
+    that overlaps a pair horizontally collides when its box reaches below the
+    gap bottom (the bottom pipe runs past the ground) or above the gap top
+    while still reaching below the top pipe's upper edge. The top pipe is
+    one sprite tall, so a low gap leaves open sky above it. This is the same
+    answer as a rect overlap test against both pipes.
+
+    Args:
+        bird_left, bird_right, bird_top, bird_bottom: Bird box edges
+        pipe_left, pipe_right, gap_top, gap_bottom, top_pipe_top: Pair arrays
+                                                                  (see pipe_pair_arrays)
+        bird_shrink: Pixels removed from each side of every bird box
+        pipe_shrink: Pixels removed from each side of every pipe box
+
+    Returns:
+        Boolean array, True where the bird hits a pipe
+    """
+    bird_left = np.asarray(bird_left, dtype=np.float64) + bird_shrink
+    bird_right = np.asarray(bird_right, dtype=np.float64) - bird_shrink
+    bird_top = np.asarray(bird_top, dtype=np.float64) + bird_shrink
+    bird_bottom = np.asarray(bird_bottom, dtype=np.float64) - bird_shrink
+
+    hit = np.zeros(len(bird_left), dtype=bool)
+    if len(pipe_left) == 0 or len(bird_left) == 0:
+        return hit
+
+    pipe_left = np.asarray(pipe_left) + pipe_shrink
+    pipe_right = np.asarray(pipe_right) - pipe_shrink
+
+    column = (pipe_left < bird_right.max()) & (bird_left.min() < pipe_right)
+    for j in np.flatnonzero(column):
+        overlap_x = (bird_left < pipe_right[j]) & (pipe_left[j] < bird_right)
+        top_pipe = ((bird_top < gap_top[j] - pipe_shrink) &
+                    (top_pipe_top[j] + pipe_shrink < bird_bottom))
+        bottom_pipe = gap_bottom[j] + pipe_shrink < bird_bottom
+        hit |= overlap_x & (top_pipe | bottom_pipe)
+
+    return hit
@@ -0,0 +1,144 @@
+import numpy as np
+from src.utils.constants import *
+
+
+class PipeCourse:
+    """
+    Array-backed, seeded pipe course.
+
+    Gap centers are drawn up front from a seed into a NumPy array, so the same
+    course can be replayed by every generation or worker. Pipe pairs on screen
+    live in a fixed-capacity ring buffer of (x, gap_center, seq) where seq is
+    the pair's index in the schedule; spawning never allocates objects.
+    """
+
+    def __init__(self, seed=None, length=PIPE_COURSE_LENGTH, capacity=PIPE_COURSE_CAPACITY):
+        """
+        Args:
+            seed: Seed for the gap schedule (None for a random course)
+            length: Number of gap centers drawn per schedule chunk
+            capacity: Maximum number of pipe pairs on screen at once
+        """
+        self.length = length
+        self.capacity = capacity
+        self.pipe_gap = PIPE_GAP
+        self.speed = PIPE_SPEED
+        self.spawn_delay = PIPE_SPAWN_DELAY
+        self.width = PIPE_SPRITE_WIDTH
+        self.height = PIPE_SPRITE_HEIGHT
+
+        # Ring buffer storage
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.gap_center = np.zeros(capacity, dtype=np.float64)
+        self.seq = np.zeros(capacity, dtype=np.int64)
+
+        self.reset(seed if seed is not None else np.random.SeedSequence().entropy)
+
+    def reset(self, seed=None):
+        """
+        Clear the screen and restart the course
+
+        Args:
+            seed: New schedule seed; None replays the current schedule
+        """
+        if seed is not None:
+            self.seed = seed
+            self.rng = np.random.default_rng(seed)
+            self.schedule = self.draw_gap_centers(self.length)
+
+        self.head = 0
+        self.count = 0
+        self.spawn_timer = 0
+        self.next_seq = 0
+
+    def draw_gap_centers(self, count):
+        return self.rng.integers(PIPE_GAP_MARGIN, SCREEN_HEIGHT - PIPE_GAP_MARGIN + 1,
+                                 size=count).astype(np.float64)
+
+    def gap_center_for(self, seq):
+        """Gap center of pair number seq, extending the schedule if needed"""
+        while seq >= len(self.schedule):
+            self.schedule = np.concatenate(
+                [self.schedule, self.draw_gap_centers(self.length)])
+        return self.schedule[seq]
+
+    def active_slots(self):
+        """Ring buffer slots of the pairs on screen, oldest first"""
+        return (self.head + np.arange(self.count)) % self.capacity
+
+    def update(self):
+        """Move pairs left, drop pairs that left the screen, spawn on schedule"""
+        slots = self.active_slots()
+        self.x[slots] -= self.speed
+
+        # Pairs leave in spawn order, so only the oldest ones can be off screen
+        while self.count and self.x[self.head] + self.width < 0:
+            self.head = (self.head + 1) % self.capacity
+            self.count -= 1
+
+        self.spawn_timer += 1
+        if self.spawn_timer >= self.spawn_delay:
+            self.spawn_pipes()
+            self.spawn_timer = 0
+
+    def spawn_pipes(self):
+        if self.count == self.capacity:
+            raise RuntimeError(
+                f"PipeCourse capacity {self.capacity} exceeded, increase PIPE_COURSE_CAPACITY")
+
+        slot = (self.head + self.count) % self.capacity
+        self.x[slot] = SCREEN_WIDTH + 10
+        self.gap_center[slot] = self.gap_center_for(self.next_seq)
+        self.seq[slot] = self.next_seq
+        self.next_seq += 1
+        self.count += 1
+
+    def bottom_arrays(self):
+        """(left, right, gap_center) of the pairs on screen, like bottom_pipe_arrays"""
+        slots = self.active_slots()
+        left = self.x[slots]
+        return left, left + self.width, self.gap_center[slots]
+
+    def pair_arrays(self):
+        """
+        (left, right, gap_top, gap_bottom, top_pipe_top) of the pairs on screen,
+        like pipe_pair_arrays
+        """
+        slots = self.active_slots()
+        left = self.x[slots]
+        gap = self.gap_center[slots]
+        gap_top = np.maximum(0, gap - self.pipe_gap // 2)
+        return (left, left + self.width, gap_top, gap + self.pipe_gap // 2,
+                gap_top - self.height)
+
+    def sequence_numbers(self):
+        """Schedule index of every pair on screen, oldest first"""
+        return self.seq[self.active_slots()]
+
+    def oldest_seq(self):
+        """Schedule index of the oldest pair on screen (next_seq when empty)"""
+        return self.next_seq - self.count
+
+    def right_edge(self, seq):
+        """Right edge of pair number seq, or None if it is not on screen"""
+        offset = seq - self.oldest_seq()
+        if 0 <= offset < self.count:
+            return self.x[(self.head + offset) % self.capacity] + self.width
+        return None
+
+    def draw(self, screen, top_sprite, bottom_sprite):
+        """Blit every pair with two shared sprites (top one already flipped)"""
+        left, _, gap_top, gap_bottom, _ = self.pair_arrays()
+        for x, top, bottom in zip(left, gap_top, gap_bottom):
+            screen.blit(top_sprite, (x, top - top_sprite.get_height()))
+            screen.blit(bottom_sprite, (x, bottom))
+
+    def clear(self):
+        """Restart the current schedule"""
+        self.reset()
+
+    def __len__(self):
+        return self.count
+
+    def __str__(self):
+        return f"PipeCourse(seed={self.seed}, on_screen={self.count}, spawned={self.next_seq})"
@@ -0,0 +1,392 @@
+import argparse
+import os
+import socket
+import struct
+import threading
+import time
+from collections import deque
+import numpy as np
+from src.sim.evaluator import SerialEvaluator, evaluate_shard
+from src.utils.constants import *
+
+# Frame: magic, message type, payload length (network byte order)
+HEADER = struct.Struct("!4sBI")
+MAGIC = b"FBG1"
+
+# Message types
+HELLO = 1        # worker -> coordinator, payload: worker name (utf-8)
+TASK = 2         # coordinator -> worker, payload: TASK_HEADER, layer sizes, genome rows
+RESULT = 3       # worker -> coordinator, payload: RESULT_HEADER, result columns
+HEARTBEAT = 4    # worker -> coordinator, no payload
+SHUTDOWN = 5     # coordinator -> worker, no payload
+
+# task id, course seed, first population index, rows, max frames, collision mode, layers
+TASK_HEADER = struct.Struct("!IqIIIBB")
+LAYER_SIZE = struct.Struct("!I")
+# task id, rows
+RESULT_HEADER = struct.Struct("!II")
+
+COLLISION_CODES = {"analytic": 0, "hitbox": 1}
+COLLISION_NAMES = {code: name for name, code in COLLISION_CODES.items()}
+
+# Array payloads are little-endian whatever the machine
+GENOME_WIRE_DTYPE = np.dtype("<f4")
+RESULT_WIRE_DTYPES = (('fitness', np.dtype("<f8")), ('score', np.dtype("<i8")),
+                      ('frames', np.dtype("<i8")))
+
+
+def parse_address(address, default_host=DISTRIBUTED_HOST):
+    """'host:port', ':port' or 'port' -> (host, port)"""
+    host, _, port = str(address).rpartition(":")
+    return host or default_host, int(port)
+
+
+def send_frame(sock, kind, payload=b""):
+    sock.sendall(HEADER.pack(MAGIC, kind, len(payload)) + payload)
+
+
+def recv_exact(sock, size):
+    data = bytearray()
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("Connection closed")
+        data += chunk
+    return bytes(data)
+
+
+def recv_frame(sock):
+    """Next (message type, payload) from the socket"""
+    magic, kind, length = HEADER.unpack(recv_exact(sock, HEADER.size))
+    if magic != MAGIC:
+        raise ConnectionError(f"Bad frame magic {magic!r}")
+    return kind, recv_exact(sock, length) if length else b""
+
+
+def encode_task(task_id, course_seed, start, genomes, layer_sizes, max_frames, collision_mode):
+    header = TASK_HEADER.pack(task_id, course_seed, start, len(genomes), max_frames,
+                              COLLISION_CODES[collision_mode], len(layer_sizes))
+    layers = b"".join(LAYER_SIZE.pack(size) for size in layer_sizes)
+    return header + layers + np.ascontiguousarray(genomes, dtype=GENOME_WIRE_DTYPE).tobytes()
+
+
+def decode_task(payload):
+    """TASK payload -> dict of the task fields (genomes is a read-only view)"""
+    task_id, course_seed, start, count, max_frames, collision, layer_count = \
+        TASK_HEADER.unpack_from(payload)
+    offset = TASK_HEADER.size
+    layer_sizes = [LAYER_SIZE.unpack_from(payload, offset + i * LAYER_SIZE.size)[0]
+                   for i in range(layer_count)]
+    offset += layer_count * LAYER_SIZE.size
+
+    genomes = np.frombuffer(payload, dtype=GENOME_WIRE_DTYPE, offset=offset).reshape(count, -1)
+    return {
+        'task_id': task_id,
+        'course_seed': course_seed,
+        'start': start,
+        'genomes': genomes,
+        'layer_sizes': layer_sizes,
+        'max_frames': max_frames,
+        'collision_mode': COLLISION_NAMES[collision]
+    }
+
+
+def encode_result(task_id, results):
+    count = len(results['fitness'])
+    return RESULT_HEADER.pack(task_id, count) + b"".join(
+        np.asarray(results[field], dtype=dtype).tobytes() for field, dtype in RESULT_WIRE_DTYPES)
+
+
+def decode_result(payload):
+    """RESULT payload -> (task id, dict of result arrays)"""
+    task_id, count = RESULT_HEADER.unpack_from(payload)
+    offset = RESULT_HEADER.size
+    results = {}
+    for field, dtype in RESULT_WIRE_DTYPES:
+        results[field] = np.frombuffer(payload, dtype=dtype, count=count, offset=offset)
+        offset += count * dtype.itemsize
+    return task_id, results
+
+
+class WorkerConnection:
+    """Coordinator-side state of one connected worker"""
+
+    def __init__(self, sock, address):
+        self.sock = sock
+        self.address = address
+        self.name = f"{address[0]}:{address[1]}"
+        self.last_seen = time.time()
+        self.alive = True
+        self.tasks = set()
+        self.send_lock = threading.Lock()
+
+    def send(self, kind, payload=b""):
+        with self.send_lock:
+            send_frame(self.sock, kind, payload)
+
+    def close(self):
+        self.alive = False
+        try:
+            self.sock.close()
+        except OSError:
+            pass
+
+    def __str__(self):
+        return f"WorkerConnection({self.name}, tasks={len(self.tasks)})"
+
+
+class DistributedEvaluator(SerialEvaluator):
+    """
+    Evaluator backend that farms genome shards out to workers over TCP.
+
+    Workers (run_worker, on this or other machines) connect to the
+    coordinator, receive TASK frames holding a run of genome rows and the
+    course seed, and stream RESULT frames back while sending heartbeats.
+    A worker that closes its connection or stays silent for
+    heartbeat_timeout is dropped and its tasks are re-queued; a task counts
+    once, whichever copy finishes first. Results do not depend on which
+    worker flies a shard, so they match SerialEvaluator's exactly.
+    """
+
+    def __init__(self, host=DISTRIBUTED_HOST, port=DISTRIBUTED_PORT,
+                 max_frames=HEADLESS_MAX_FRAMES, collision_mode="analytic",
+                 task_size=DISTRIBUTED_TASK_SIZE, tasks_per_worker=DISTRIBUTED_TASKS_PER_WORKER,
+                 heartbeat_timeout=DISTRIBUTED_HEARTBEAT_TIMEOUT,
+                 worker_timeout=DISTRIBUTED_WORKER_TIMEOUT):
+        """
+        Args:
+            host: Interface to listen on
+            port: Port to listen on (0 picks a free one, see self.port)
+            max_frames: Frame cap per episode
+            collision_mode: "analytic" or "hitbox"
+            task_size: Genome rows per task
+            tasks_per_worker: Tasks in flight per worker
+            heartbeat_timeout: Seconds of silence before a worker is dropped
+            worker_timeout: Seconds evaluate() waits with no worker connected
+        """
+        super().__init__(max_frames, collision_mode)
+        self.task_size = max(1, task_size)
+        self.tasks_per_worker = max(1, tasks_per_worker)
+        self.heartbeat_timeout = heartbeat_timeout
+        self.worker_timeout = worker_timeout
+
+        self.server = socket.create_server((host, port))
+        self.host, self.port = self.server.getsockname()[:2]
+        self.workers = []
+        self.lock = threading.Lock()
+        # Signalled on every result, connection and disconnection
+        self.changed = threading.Condition(self.lock)
+        self.finished = deque()
+        self.closed = False
+        self.next_task_id = 0
+        self.requeued = 0
+
+        self.accept_thread = threading.Thread(target=self.accept_loop, daemon=True)
+        self.accept_thread.start()
+
+    def accept_loop(self):
+        while not self.closed:
+            try:
+                sock, address = self.server.accept()
+            except OSError:
+                return
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            worker = WorkerConnection(sock, address)
+            threading.Thread(target=self.read_loop, args=(worker,), daemon=True).start()
+
+    def read_loop(self, worker):
+        """Reader thread of one worker: heartbeats, hello and results"""
+        try:
+            while True:
+                kind, payload = recv_frame(worker.sock)
+                with self.changed:
+                    worker.last_seen = time.time()
+                    if kind == HELLO:
+                        if payload:
+                            worker.name = payload.decode("utf-8", "replace")
+                        self.workers.append(worker)
+                        print(f"🔌 Worker {worker.name} connected")
+                    elif kind == RESULT:
+                        self.finished.append((worker, *decode_result(payload)))
+                    self.changed.notify_all()
+        except (ConnectionError, OSError, struct.error):
+            with self.changed:
+                worker.alive = False
+                self.changed.notify_all()
+
+    def live_workers(self):
+        return [worker for worker in self.workers if worker.alive]
+
+    def drop_dead_workers(self, queue, tasks):
+        """Re-queue the tasks of workers that disconnected or stopped heartbeating"""
+        now = time.time()
+        for worker in list(self.workers):
+            if worker.alive and now - worker.last_seen > self.heartbeat_timeout:
+                print(f"💀 Worker {worker.name} missed its heartbeat")
+                worker.close()
+            if not worker.alive:
+                for task_id in worker.tasks:
+                    if task_id in tasks:
+                        queue.appendleft(task_id)
+                        self.requeued += 1
+                worker.tasks.clear()
+                self.workers.remove(worker)
+                print(f"🔌 Worker {worker.name} dropped")
+
+    def assign(self, queue, tasks):
+        """Give queued tasks to workers with free slots; returns (worker, task_id) pairs"""
+        assignments = []
+        for worker in self.live_workers():
+            while queue and len(worker.tasks) < self.tasks_per_worker:
+                task_id = queue.popleft()
+                if task_id in tasks:
+                    worker.tasks.add(task_id)
+                    assignments.append((worker, task_id))
+        return assignments
+
+    def evaluate(self, genomes, layer_sizes, course_seed):
+        count = len(genomes)
+        results = self.empty_results(count)
+        # Task ids are unique across calls, so a straggler from an earlier
+        # generation can never be taken for a task of this one
+        tasks = {}
+        for start in range(0, count, self.task_size):
+            tasks[self.next_task_id] = (start, min(start + self.task_size, count))
+            self.next_task_id = (self.next_task_id + 1) % 2 ** 32
+        queue = deque(tasks)
+        waiting_since = time.time()
+
+        while tasks:
+            with self.changed:
+                while self.finished:
+                    worker, task_id, shard = self.finished.popleft()
+                    worker.tasks.discard(task_id)
+                    # Late copies of a re-queued task are ignored
+                    if task_id not in tasks:
+                        continue
+                    start, stop = tasks.pop(task_id)
+                    for field in results:
+                        results[field][start:stop] = shard[field]
+                if not tasks:
+                    break
+
+                self.drop_dead_workers(queue, tasks)
+                if self.live_workers():
+                    waiting_since = time.time()
+                elif time.time() - waiting_since > self.worker_timeout:
+                    raise RuntimeError(f"No evaluation worker connected to "
+                                       f"{self.host}:{self.port} for {self.worker_timeout}s")
+                assignments = self.assign(queue, tasks)
+
+            # Send outside the lock so reader threads keep draining results
+            for worker, task_id in assignments:
+                start, stop = tasks[task_id]
+                try:
+                    worker.send(TASK, encode_task(task_id, course_seed, start, genomes[start:stop],
+                                                  layer_sizes, self.max_frames, self.collision_mode))
+                except OSError:
+                    # drop_dead_workers re-queues everything it held
+                    worker.close()
+
+            with self.changed:
+                if not self.finished:
+                    self.changed.wait(timeout=min(0.5, self.heartbeat_timeout / 2))
+        return results
+
+    def close(self):
+        """Stop listening and tell connected workers to exit"""
+        self.closed = True
+        with self.changed:
+            for worker in self.live_workers():
+                try:
+                    worker.send(SHUTDOWN)
+                except OSError:
+                    pass
+                worker.close()
+            self.workers = []
+        self.server.close()
+
+    def __str__(self):
+        return f"DistributedEvaluator({self.host}:{self.port}, workers={len(self.live_workers())})"
+
+
+def run_worker(host=DISTRIBUTED_HOST, port=DISTRIBUTED_PORT, name=None,
+               heartbeat_interval=DISTRIBUTED_HEARTBEAT_INTERVAL,
+               connect_timeout=DISTRIBUTED_WORKER_TIMEOUT):
+    """
+    Evaluation worker: connect to a coordinator and fly the shards it sends
+
+    Heartbeats go out from a separate thread, so a long episode does not
+    look like a dead worker.
+
+    Returns:
+        Number of tasks evaluated
+    """
+    deadline = time.time() + connect_timeout
+    while True:
+        try:
+            sock = socket.create_connection((host, port))
+            break
+        except OSError:
+            if time.time() > deadline:
+                raise
+            time.sleep(0.2)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    send_lock = threading.Lock()
+    stopped = threading.Event()
+    name = name or f"{socket.gethostname()}/{os.getpid()}"
+
+    def send(kind, payload=b""):
+        with send_lock:
+            send_frame(sock, kind, payload)
+
+    def heartbeat():
+        while not stopped.wait(heartbeat_interval):
+            try:
+                send(HEARTBEAT)
+            except OSError:
+                return
+
+    send(HELLO, name.encode("utf-8"))
+    threading.Thread(target=heartbeat, daemon=True).start()
+
+    evaluated = 0
+    try:
+        while True:
+            kind, payload = recv_frame(sock)
+            if kind == SHUTDOWN:
+                break
+            if kind != TASK:
+                continue
+
+            task = decode_task(payload)
+            count = len(task['genomes'])
+            shard = evaluate_shard(task['genomes'],
+                                   np.arange(task['start'], task['start'] + count),
+                                   task['layer_sizes'], task['course_seed'],
+                                   task['max_frames'], task['collision_mode'])
+            send(RESULT, encode_result(task['task_id'], shard))
+            evaluated += 1
+    except (ConnectionError, OSError):
+        pass
+    finally:
+        stopped.set()
+        sock.close()
+    return evaluated
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Flappy Bird distributed evaluation worker")
+    parser.add_argument('--connect', default=f"{DISTRIBUTED_HOST}:{DISTRIBUTED_PORT}",
+                        help='Coordinator address host:port')
+    parser.add_argument('--name', default=None, help='Worker name shown by the coordinator')
+    args = parser.parse_args()
+
+    host, port = parse_address(args.connect)
+    print(f"🔌 Worker connecting to {host}:{port}")
+    print(f"✅ Worker finished after {run_worker(host, port, args.name)} tasks")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,325 @@
+import time
+import numpy as np
+from src.ai.neural_network import NeuralNetwork
+from src.ai.policy import PopulationPolicy
+from src.sim.collision import analytic_collisions
+from src.sim.course import PipeCourse
+from src.sim.observation import build_observations
+from src.sim.swarm import BirdSwarm
+from src.utils.constants import *
+from src.utils.rng import get_rng_service
+
+
+class HeadlessEngine:
+    """
+    Runs AI training without pygame, a display, assets or frame pacing.
+
+    Mirrors the training loop of GameEngine (update birds, update pipes,
+    check scoring, end generation when every bird is dead) on a BirdSwarm,
+    and stops a generation after max_frames so a perfect bird cannot run
+    forever. Without pygame masks, pipe collisions use the "analytic" (exact
+    sprite boxes) or "hitbox" (shrunk boxes) mode.
+    """
+
+    def __init__(self, population_size=POPULATION_SIZE, max_frames=HEADLESS_MAX_FRAMES,
+                 collision_mode="analytic", course_seed=None, evaluator=None,
+                 rng_service=None, name=None, checkpointer=None):
+        """
+        Args:
+            population_size: Birds per generation
+            max_frames: Frame cap per generation
+            collision_mode: "analytic" or "hitbox"
+            course_seed: Fixed pipe course seed (None for one per generation)
+            evaluator: Optional evaluator (src.sim.evaluator) that runs the
+                       episodes elsewhere, e.g. in worker processes
+            rng_service: RNG service of the run (default: the process-wide one)
+            name: Label for log lines; a named engine (an island) leaves
+                  saving models and statistics to its owner
+            checkpointer: Optional src.utils.checkpoint.Checkpointer that
+                          saves the run between generations (see --resume)
+        """
+        if collision_mode not in ("analytic", "hitbox"):
+            raise ValueError(
+                f"Headless collision mode must be 'analytic' or 'hitbox', got {collision_mode!r}")
+
+        self.population_size = population_size
+        self.max_frames = max_frames
+        self.collision_mode = collision_mode
+
+        self.swarm = None
+        self.brains = []
+        self.policy = None
+
+        self.rng_service = rng_service if rng_service is not None else get_rng_service()
+        self.name = name
+
+        self.score = 0
+        self.generation = 1
+        # A fixed course_seed replays the same course every generation
+        self.course_seed = course_seed
+        self.pipe_course = PipeCourse(seed=self.next_course_seed())
+        self.generation_frame_count = 0
+        self.generation_start_time = time.time()
+
+        self.genetic_algorithm = None
+        self.evaluator = evaluator
+        self.checkpointer = checkpointer
+        self.checkpoint_generation = None
+        # True from scoring to the next generation's birds (no consistent snapshot)
+        self.ending_generation = False
+
+    def next_course_seed(self):
+        """Fixed course_seed, or the run's course stream for this generation"""
+        if self.course_seed is not None:
+            return self.course_seed
+        return self.rng_service.course_seed(self.generation)
+
+    def init_ai_training(self):
+        """Create the genetic algorithm and the first set of birds"""
+        from src.ai.genetic_algorithm import GeneticAlgorithm
+
+        if self.genetic_algorithm is None:
+            print(
+                f"🧬 Initializing Genetic Algorithm with population size: {self.population_size}")
+            self.genetic_algorithm = GeneticAlgorithm(
+                population_size=self.population_size,
+                generations=GENERATIONS,
+                mutation_rate=MUTATION_RATE,
+                crossover_rate=CROSSOVER_RATE,
+                elite_count=ELITE_COUNT,
+                rng_service=self.rng_service
+            )
+            if self.name is None:
+                self.genetic_algorithm.open_stats_log()
+
+        self.create_ai_birds()
+
+    def create_ai_birds(self):
+        """Create the swarm at GameEngine's start positions and hand out brains"""
+        self.swarm = BirdSwarm.spawn(self.population_size)
+
+        population = self.genetic_algorithm.population
+        while len(population.individuals) < self.population_size:
+            population.add_individual(
+                NeuralNetwork(NN_INPUT_NODES, NN_HIDDEN_NODES, NN_OUTPUT_NODES))
+        self.load_birds(population.individuals[:self.population_size])
+
+    def load_birds(self, brains, indices=None):
+        """
+        Spawn one bird per brain
+
+        Args:
+            brains: NeuralNetwork per bird
+            indices: Population index of each bird (sets its start position)
+        """
+        self.swarm = BirdSwarm.spawn(len(brains), indices)
+        self.brains = brains
+        self.policy = PopulationPolicy(self.brains)
+
+    def update_game(self):
+        """Advance the simulation by one frame"""
+        self.generation_frame_count += 1
+
+        self.update_birds()
+        self.pipe_course.update()
+        self.check_scoring()
+
+    def update_birds(self):
+        swarm = self.swarm
+
+        observations = build_observations(swarm.left, swarm.right, swarm.y, swarm.velocity,
+                                          *self.pipe_course.bottom_arrays())
+        swarm.step(self.policy.decide(observations, swarm.alive))
+        self.check_pipe_collisions()
+
+    def check_pipe_collisions(self):
+        """Kill birds that hit a pipe, testing only pipes in the bird column"""
+        swarm = self.swarm
+        shrink = (HITBOX_BIRD_SHRINK, HITBOX_PIPE_SHRINK) if self.collision_mode == "hitbox" else (0, 0)
+
+        hit = analytic_collisions(swarm.left, swarm.right, swarm.top, swarm.bottom,
+                                  *self.pipe_course.pair_arrays(),
+                                  bird_shrink=shrink[0], pipe_shrink=shrink[1])
+        swarm.kill(hit)
+
+    def check_scoring(self):
+        """
+        Score each bird against the one pair it has to pass next.
+
+        Birds store the sequence number of their next pair (swarm.next_pipe),
+        so scoring is a single gather + comparison against that pair's right
+        edge for the whole swarm.
+        """
+        swarm = self.swarm
+        course = self.pipe_course
+        if course.count == 0:
+            return
+
+        # Pairs that left the screen before a bird passed them never score
+        first_seq = course.seq[course.head]
+        np.maximum(swarm.next_pipe, first_seq, out=swarm.next_pipe)
+
+        offset = swarm.next_pipe - first_seq
+        on_screen = offset < course.count
+        slots = (course.head + np.minimum(offset, course.count - 1)) % course.capacity
+        leading_right = course.x[slots] + course.width
+
+        passed = swarm.alive & on_screen & (leading_right < swarm.left)
+        swarm.next_pipe[passed] += 1
+        swarm.score[passed] += 1
+        swarm.fitness[passed] += FITNESS_BONUS_PIPE
+
+        if swarm.size:
+            self.score = max(self.score, int(swarm.score.max()))
+
+    def is_generation_over(self):
+        if self.generation_frame_count >= self.max_frames:
+            return True
+        return not self.swarm.any_alive()
+
+    def simulate(self):
+        """Step the current birds until they all die or time runs out"""
+        while not self.is_generation_over():
+            self.update_game()
+
+    def episode_results(self):
+        """Per-bird fitness (with the score bonus), score and frames survived"""
+        swarm = self.swarm
+        return {
+            # Extra multiplier for score to prioritize scoring over just floating
+            'fitness': swarm.fitness + swarm.score * 10,
+            'score': swarm.score.copy(),
+            'frames': swarm.frames_survived.copy()
+        }
+
+    def run_generation(self):
+        """Simulate the current birds (here or on the evaluator) and evolve"""
+        return self.end_generation(self.evaluate_generation())
+
+    def evaluate_generation(self):
+        """Simulate the current birds (here or on the evaluator) and return their results"""
+        if self.evaluator is not None:
+            results = self.genetic_algorithm.evaluate_population(
+                self.evaluator, self.pipe_course.seed, self.population_size)
+            self.generation_frame_count = int(results['frames'].max()) if len(results['frames']) else 0
+        else:
+            self.simulate()
+            results = self.episode_results()
+        return results
+
+    def end_generation(self, results):
+        """Score the generation, evolve, and reset the world"""
+        generation_time = time.time() - self.generation_start_time
+        self.ending_generation = True
+
+        fitness_scores = results['fitness'].tolist()
+        self.genetic_algorithm.population.fitness_scores = fitness_scores
+
+        max_fitness = max(fitness_scores) if fitness_scores else 0
+        best_score = int(results['score'].max()) if len(results['score']) else 0
+
+        label = f"{self.name} " if self.name else ""
+        print(f"🧬 {label}Generation {self.generation}: best fitness {max_fitness:.1f}, "
+              f"best score {best_score}, {self.generation_frame_count} frames "
+              f"in {generation_time:.2f}s")
+
+        # Models are saved while the evaluated fitness is still known
+        if self.name is None and (self.generation % 10 == 0 or best_score > 0):
+            self.genetic_algorithm.save_best_individual()
+            self.genetic_algorithm.save_top_individuals()
+
+        # Statistics are appended to the stats log by evolve_generation
+        self.genetic_algorithm.evolve_generation()
+
+        result = {
+            'generation': self.generation,
+            'best_fitness': max_fitness,
+            'best_score': best_score,
+            'frames': self.generation_frame_count,
+            'time': generation_time
+        }
+
+        self.generation += 1
+        self.generation_start_time = time.time()
+        self.generation_frame_count = 0
+        self.score = 0
+        self.pipe_course.reset(self.next_course_seed())
+        self.create_ai_birds()
+        self.ending_generation = False
+
+        if self.checkpointer is not None and self.checkpointer.due(result['generation']):
+            self.save_checkpoint()
+
+        return result
+
+    def checkpoint_state(self):
+        """Snapshot of the run between generations (arrays are copies)"""
+        return {
+            'engine': {
+                'generation': self.generation,
+                'population_size': self.population_size,
+                'max_frames': self.max_frames,
+                'collision_mode': self.collision_mode,
+                'course_seed': self.course_seed
+            },
+            'genetic_algorithm': self.genetic_algorithm.get_state(),
+            'rng': self.rng_service.get_state()
+        }
+
+    def save_checkpoint(self):
+        """Hand a snapshot to the checkpointer (skipped while a generation is half evolved)"""
+        completed = self.generation - 1
+        if self.ending_generation or completed in (0, self.checkpoint_generation):
+            return False
+        self.checkpointer.submit(completed, self.checkpoint_state())
+        self.checkpoint_generation = completed
+        return True
+
+    def restore_checkpoint(self, state):
+        """
+        Continue a run from checkpoint_state()
+
+        The RNG service must already be restored (src.utils.rng.restore_run),
+        since every later stream is keyed by the run seed and the generation.
+        """
+        from src.ai.genetic_algorithm import GeneticAlgorithm
+
+        engine_state = state['engine']
+        ga_state = state['genetic_algorithm']
+        self.generation = engine_state['generation']
+        self.max_frames = engine_state['max_frames']
+        self.course_seed = engine_state['course_seed']
+        self.checkpoint_generation = self.generation - 1
+
+        self.genetic_algorithm = GeneticAlgorithm(population_size=self.population_size,
+                                                  rng_service=self.rng_service)
+        self.genetic_algorithm.set_state(ga_state)
+        if self.name is None:
+            # Cut the log back to the checkpoint and keep appending to it
+            self.genetic_algorithm.open_stats_log(offsets=ga_state['stats_log'])
+
+        self.generation_frame_count = 0
+        self.generation_start_time = time.time()
+        self.score = 0
+        self.pipe_course.reset(self.next_course_seed())
+        self.create_ai_birds()
+
+    def run(self, generations=GENERATIONS):
+        """Train for the given number of generations"""
+        print(f"🚀 Starting headless training for {generations} generations")
+        if self.genetic_algorithm is None:
+            self.init_ai_training()
+
+        results = []
+        try:
+            for _ in range(generations):
+                results.append(self.run_generation())
+        finally:
+            if self.checkpointer is not None:
+                # Also keep the last completed generation of an interrupted run
+                self.save_checkpoint()
+                self.checkpointer.flush()
+            if self.genetic_algorithm.stats_log is not None:
+                self.genetic_algorithm.save_generation_stats()
+                self.genetic_algorithm.close_stats_log()
+        return results
@@ -0,0 +1,189 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from src.ai.neural_network import NeuralNetwork
+from src.sim.engine import HeadlessEngine
+from src.sim.shared import SharedPopulationBuffer
+from src.utils.constants import *
+
+
+def networks_from_genomes(genomes, layer_sizes):
+    """NeuralNetwork views of every genome row (no copies, no initialization)"""
+    return [NeuralNetwork(layer_sizes[0], list(layer_sizes[1:-1]), layer_sizes[-1], params=row)
+            for row in genomes]
+
+
+def evaluate_shard(genomes, indices, layer_sizes, course_seed,
+                   max_frames=HEADLESS_MAX_FRAMES, collision_mode="analytic"):
+    """
+    Fly one headless episode for a shard of the population
+
+    Birds never interact and the course does not depend on them, so each
+    bird's result only depends on its genome, its population index (start
+    position) and the course seed: any sharding gives the same results.
+
+    Args:
+        genomes: (M, P) genome rows of the shard
+        indices: Population index of each row
+        layer_sizes: Network architecture, e.g. [4, 6, 4, 1]
+        course_seed: Pipe course seed shared by every shard
+
+    Returns:
+        dict of 'fitness', 'score' and 'frames' arrays for the shard
+    """
+    engine = HeadlessEngine(len(indices), max_frames, collision_mode, course_seed)
+    engine.load_birds(networks_from_genomes(genomes, layer_sizes), indices)
+    engine.simulate()
+    return engine.episode_results()
+
+
+class SerialEvaluator:
+    """Evaluates the whole population in this process (the reference evaluator)"""
+
+    def __init__(self, max_frames=HEADLESS_MAX_FRAMES, collision_mode="analytic"):
+        self.max_frames = max_frames
+        self.collision_mode = collision_mode
+
+    def empty_results(self, count):
+        return {
+            'fitness': np.zeros(count, dtype=np.float64),
+            'score': np.zeros(count, dtype=np.int64),
+            'frames': np.zeros(count, dtype=np.int64)
+        }
+
+    def evaluate(self, genomes, layer_sizes, course_seed):
+        """
+        Fly every genome on the course
+
+        Args:
+            genomes: (N, P) genome matrix (row i is population index i)
+            layer_sizes: Network architecture
+            course_seed: Pipe course seed
+
+        Returns:
+            dict of per-individual 'fitness', 'score' and 'frames' arrays
+        """
+        if len(genomes) == 0:
+            return self.empty_results(0)
+        return evaluate_shard(genomes, np.arange(len(genomes)), layer_sizes, course_seed,
+                              self.max_frames, self.collision_mode)
+
+    def close(self):
+        pass
+
+    def __str__(self):
+        return "SerialEvaluator()"
+
+
+class ProcessPoolEvaluator(SerialEvaluator):
+    """
+    Shards the population across a ProcessPoolExecutor.
+
+    Genomes and results live in a SharedPopulationBuffer that every worker
+    attaches to once, when the pool starts; a task is just a (start, stop,
+    course_seed) row range, so per-generation traffic is a few bytes per
+    shard whatever the population size. Every shard flies the same seeded
+    course, so the merged results are identical to SerialEvaluator's. The
+    population is cut into several shards per worker so that shards full of
+    long-lived birds do not leave the other workers idle at the end of a
+    generation.
+    """
+
+    def __init__(self, workers=None, max_frames=HEADLESS_MAX_FRAMES, collision_mode="analytic",
+                 chunks_per_worker=EVALUATION_CHUNKS_PER_WORKER):
+        super().__init__(max_frames, collision_mode)
+        self.workers = workers or os.cpu_count() or 1
+        self.chunks_per_worker = chunks_per_worker
+        self.executor = None
+        self.buffer = None
+        self.layer_sizes = None
+
+    def start(self, count, layer_sizes):
+        """(Re)start the pool on a shared buffer for count genomes of this architecture"""
+        self.close()
+        self.buffer = SharedPopulationBuffer(count, NeuralNetwork.count_params(layer_sizes))
+        self.layer_sizes = list(layer_sizes)
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.workers, initializer=_attach_worker,
+            initargs=(self.buffer.descriptor(), self.layer_sizes,
+                      self.max_frames, self.collision_mode))
+
+    def shards(self, count):
+        """(start, stop) population row range of every shard"""
+        shard_count = max(1, min(count, self.workers * self.chunks_per_worker))
+        return [(int(idx[0]), int(idx[-1]) + 1)
+                for idx in np.array_split(np.arange(count), shard_count) if len(idx)]
+
+    def evaluate(self, genomes, layer_sizes, course_seed):
+        count = len(genomes)
+        if count == 0:
+            return self.empty_results(0)
+        if (self.executor is None or list(layer_sizes) != self.layer_sizes
+                or not self.buffer.fits(count, genomes.shape[1])):
+            self.start(count, layer_sizes)
+
+        self.buffer.load(genomes)
+        futures = [self.executor.submit(_evaluate_rows, start, stop, course_seed)
+                   for start, stop in self.shards(count)]
+        for future in futures:
+            future.result()
+        return self.buffer.read_results(count)
+
+    def submit_rows(self, row, genomes, first_index, course_seed):
+        """
+        Start evaluating genomes in shared rows [row, row + M) without waiting
+
+        For callers that keep several small tasks in flight (steady-state
+        evolution) on a buffer from start(). Once the returned future is
+        done, read_rows(row, M) holds the results.
+
+        Args:
+            first_index: Population index (start position) of the first genome
+        """
+        self.buffer.load(genomes, row)
+        return self.executor.submit(_evaluate_rows, row, row + len(genomes), course_seed,
+                                    first_index)
+
+    def read_rows(self, row, count):
+        return self.buffer.read_results(count, row)
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+        if self.buffer is not None:
+            self.buffer.close()
+            self.buffer = None
+
+    def __str__(self):
+        return f"ProcessPoolEvaluator(workers={self.workers})"
+
+
+# State of a pool worker process, set once by _attach_worker
+_worker = {}
+
+
+def _attach_worker(descriptor, layer_sizes, max_frames, collision_mode):
+    """Pool initializer: attach to the trainer's shared buffer"""
+    _worker['buffer'] = SharedPopulationBuffer.attach(descriptor)
+    _worker['layer_sizes'] = layer_sizes
+    _worker['max_frames'] = max_frames
+    _worker['collision_mode'] = collision_mode
+
+
+def _evaluate_rows(start, stop, course_seed, first_index=None):
+    """
+    Pool task: evaluate shared rows [start, stop) and write their results back
+
+    Row i is population index i unless first_index gives the index of row start.
+    """
+    buffer = _worker['buffer']
+    if first_index is None:
+        first_index = start
+    results = evaluate_shard(buffer.genomes[start:stop],
+                             np.arange(first_index, first_index + stop - start),
+                             _worker['layer_sizes'], course_seed,
+                             _worker['max_frames'], _worker['collision_mode'])
+    for field, values in results.items():
+        buffer.results[field][start:stop] = values
+    return stop - start
@@ -0,0 +1,234 @@
+import multiprocessing
+import queue
+import numpy as np
+from src.ai.genetic_algorithm import GeneticAlgorithm
+from src.ai.neural_network import NeuralNetwork
+from src.sim.engine import HeadlessEngine
+from src.utils.constants import *
+from src.utils.rng import RNGService, get_rng_service
+
+
+def migration_targets(topology, island_count, generation, rng_service):
+    """
+    Island that each island sends its migrants to at one migration
+
+    Both topologies are rings, so every island receives exactly one packet
+    per migration. "random" reshuffles the ring with the run's migration
+    stream, which every island derives identically without talking.
+    """
+    islands = np.arange(island_count)
+    if topology == "ring":
+        return (islands + 1) % island_count
+    if topology == "random":
+        order = rng_service.stream("migration", generation).permutation(island_count)
+        targets = np.empty(island_count, dtype=np.int64)
+        targets[order] = np.roll(order, -1)
+        return targets
+    raise ValueError(f"Unknown migration topology: {topology}")
+
+
+def configure_island(genetic_algorithm, settings):
+    """Apply an ISLAND_SETTINGS entry (GeneticAlgorithm attribute overrides)"""
+    for key, value in settings.items():
+        if not hasattr(genetic_algorithm, key):
+            raise ValueError(f"Unknown island setting: {key}")
+        setattr(genetic_algorithm, key, value)
+
+
+def run_island(index, config, inboxes, reports):
+    """
+    Island process: evolve one population and swap migrants every interval
+
+    An island only waits for its one incoming packet at a migration;
+    between migrations it never synchronizes with the others.
+
+    Args:
+        index: Island index
+        config: Run settings (see IslandModel.island_config)
+        inboxes: One migrant Queue per island
+        reports: Queue of ('generation' | 'done', index, payload) messages
+    """
+    run_rng = RNGService(config['seed'])
+    island_rng = run_rng.for_island(index)
+    island_count = config['island_count']
+
+    engine = HeadlessEngine(config['population_size'], config['max_frames'],
+                            config['collision_mode'], rng_service=island_rng,
+                            name=f"Island {index}")
+    genetic_algorithm = GeneticAlgorithm(population_size=config['population_size'],
+                                         rng_service=island_rng)
+    configure_island(genetic_algorithm, config['settings'])
+    engine.genetic_algorithm = genetic_algorithm
+    engine.init_ai_training()
+
+    best_genome, best_fitness = None, -np.inf
+    pending = {}
+
+    for _ in range(config['generations']):
+        generation = engine.generation
+        results = engine.evaluate_generation()
+        genetic_algorithm.population.fitness_scores = results['fitness'].tolist()
+
+        genomes, fitness = genetic_algorithm.emigrants(1)
+        if len(fitness) and fitness[0] > best_fitness:
+            best_genome, best_fitness = genomes[0], float(fitness[0])
+
+        if island_count > 1 and generation % config['migration_interval'] == 0:
+            targets = migration_targets(config['topology'], island_count, generation, run_rng)
+            inboxes[targets[index]].put((generation,) + genetic_algorithm.emigrants(config['migrants']))
+
+            # Packets of later migrations can arrive early from a faster island
+            while generation not in pending:
+                sent_generation, migrant_genomes, migrant_fitness = inboxes[index].get()
+                pending[sent_generation] = (migrant_genomes, migrant_fitness)
+            migrant_genomes, migrant_fitness = pending.pop(generation)
+
+            rows = genetic_algorithm.immigrate(migrant_genomes, migrant_fitness)
+            results['fitness'][rows] = migrant_fitness[:len(rows)]
+
+        reports.put(('generation', index, engine.end_generation(results)))
+
+    reports.put(('done', index, {
+        'best_genome': best_genome,
+        'best_fitness': best_fitness,
+        'generation_stats': genetic_algorithm.generation_stats
+    }))
+
+
+class IslandModel:
+    """
+    Island-model GA: one population per process, top-k migration every G generations.
+
+    Each island is a HeadlessEngine with its own GeneticAlgorithm, operator
+    settings and RNG streams (RNGService.for_island), so a seeded run repeats
+    exactly. Islands only meet at migrations, where each sends copies of its
+    best individuals to the next island of the topology; the migrants replace
+    the receiver's worst individuals before it evolves.
+    """
+
+    def __init__(self, island_count=ISLAND_COUNT, population_size=POPULATION_SIZE,
+                 migration_interval=ISLAND_MIGRATION_INTERVAL, migrants=ISLAND_MIGRANTS,
+                 topology=ISLAND_TOPOLOGY, settings=None, max_frames=HEADLESS_MAX_FRAMES,
+                 collision_mode="analytic", seed=None):
+        """
+        Args:
+            island_count: Number of islands (processes)
+            population_size: Individuals per island
+            migration_interval: Generations between migrations (G)
+            migrants: Individuals each island sends per migration (k)
+            topology: A MIGRATION_TOPOLOGIES key
+            settings: Per-island GeneticAlgorithm overrides, cycled over the
+                      islands (default: ISLAND_SETTINGS)
+            max_frames: Frame cap per generation
+            collision_mode: "analytic" or "hitbox"
+            seed: Run seed (default: the process-wide RNG service's seed)
+        """
+        if topology not in MIGRATION_TOPOLOGIES:
+            raise ValueError(f"Unknown migration topology: {topology}")
+
+        self.island_count = island_count
+        self.population_size = population_size
+        self.migration_interval = max(1, migration_interval)
+        self.migrants = min(migrants, population_size)
+        self.topology = topology
+        self.settings = settings if settings is not None else ISLAND_SETTINGS
+        self.max_frames = max_frames
+        self.collision_mode = collision_mode
+        self.seed = seed if seed is not None else get_rng_service().seed
+
+        self.history = [[] for _ in range(island_count)]
+        self.islands = [None] * island_count
+
+    def island_config(self, index, generations):
+        return {
+            'seed': self.seed,
+            'island_count': self.island_count,
+            'population_size': self.population_size,
+            'generations': generations,
+            'migration_interval': self.migration_interval,
+            'migrants': self.migrants,
+            'topology': self.topology,
+            'settings': dict(self.settings[index % len(self.settings)]),
+            'max_frames': self.max_frames,
+            'collision_mode': self.collision_mode
+        }
+
+    def run(self, generations=GENERATIONS):
+        """
+        Evolve every island for the given number of generations
+
+        Returns:
+            Per-island list of the generation results of HeadlessEngine
+        """
+        print(f"🏝️ Starting {self.island_count} islands of {self.population_size} birds, "
+              f"{self.topology} migration of {self.migrants} every "
+              f"{self.migration_interval} generations")
+
+        inboxes = [multiprocessing.Queue() for _ in range(self.island_count)]
+        reports = multiprocessing.Queue()
+        processes = [multiprocessing.Process(target=run_island, daemon=True,
+                                             args=(i, self.island_config(i, generations),
+                                                   inboxes, reports))
+                     for i in range(self.island_count)]
+        for process in processes:
+            process.start()
+
+        try:
+            done = 0
+            while done < self.island_count:
+                try:
+                    kind, index, payload = reports.get(timeout=1.0)
+                except queue.Empty:
+                    failed = [i for i, p in enumerate(processes) if p.exitcode not in (None, 0)]
+                    if failed:
+                        raise RuntimeError(f"Island process {failed[0]} exited with code "
+                                           f"{processes[failed[0]].exitcode}")
+                    continue
+
+                if kind == 'generation':
+                    self.history[index].append(payload)
+                else:
+                    self.islands[index] = payload
+                    done += 1
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.join(timeout=5.0)
+                if process.is_alive():
+                    process.terminate()
+
+        return self.history
+
+    def best(self):
+        """(island index, best genome, best fitness) over all islands"""
+        finished = [(i, island) for i, island in enumerate(self.islands)
+                    if island is not None and island['best_genome'] is not None]
+        if not finished:
+            return None
+        index, island = max(finished, key=lambda item: item[1]['best_fitness'])
+        return index, island['best_genome'], island['best_fitness']
+
+    def save_best(self, filename=BEST_BIRD_FILE):
+        """Save the best individual of any island"""
+        best = self.best()
+        if best is None:
+            return 0
+        index, genome, fitness = best
+        NeuralNetwork(NN_INPUT_NODES, NN_HIDDEN_NODES, NN_OUTPUT_NODES,
+                      params=genome).save_to_file(filename)
+        return fitness
+
+    def print_summary(self):
+        for index, island in enumerate(self.islands):
+            if island is None:
+                continue
+            settings = self.settings[index % len(self.settings)]
+            print(f"🏝️ Island {index} ({settings.get('selection_method', 'tournament')}/"
+                  f"{settings.get('crossover_method', 'uniform')}/"
+                  f"{settings.get('mutation_method', 'gaussian')}): "
+                  f"best fitness {island['best_fitness']:.1f}")
+
+    def __str__(self):
+        return (f"IslandModel(islands={self.island_count}, pop={self.population_size}, "
+                f"topology={self.topology}, every={self.migration_interval}, "
+                f"migrants={self.migrants})")
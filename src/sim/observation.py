@@ -0,0 +1,78 @@
+import numpy as np
+from src.utils.constants import *
+
+
+def bottom_pipe_arrays(pipes):
+    """
+    Extract the bottom pipes of a pipe list as arrays
+
+    Takes pygame Pipe objects (src/game/pipe.py), read through their rect.
+
+    Returns:
+        (left, right, gap_center) float arrays, one entry per bottom pipe
+    """
+    bottoms = [pipe for pipe in pipes if not pipe.is_top]
+    left = np.array([getattr(pipe, 'rect', pipe).left for pipe in bottoms], dtype=np.float64)
+    right = np.array([getattr(pipe, 'rect', pipe).right for pipe in bottoms], dtype=np.float64)
+    gap_center = np.array([pipe.gap_center for pipe in bottoms], dtype=np.float64)
+    return left, right, gap_center
+
+
+def build_observations(bird_left, bird_right, bird_y, velocity,
+                       pipe_left, pipe_right, pipe_gap_center):
+    """
+    Neural network inputs for many birds at once.
+
+    Produces the same [bird_y, vel, dist_x, diff_y] rows, with the same
+    normalization, as Bird.get_game_state. The next-pipe lookup is done once
+    per distinct bird_left value and shared by every bird at that x.
+
+    Args:
+        bird_left, bird_right: Horizontal box edges of each bird
+        bird_y: Vertical center of each bird
+        velocity: Vertical velocity of each bird
+        pipe_left, pipe_right, pipe_gap_center: Bottom pipe arrays
+                                                (see bottom_pipe_arrays)
+
+    Returns:
+        (N, 4) float array of observations
+    """
+    bird_left = np.asarray(bird_left, dtype=np.float64)
+    bird_right = np.asarray(bird_right, dtype=np.float64)
+    bird_y = np.asarray(bird_y, dtype=np.float64)
+    velocity = np.asarray(velocity, dtype=np.float64)
+
+    observations = np.empty((len(bird_y), 4))
+    observations[:, 0] = np.clip(bird_y / SCREEN_HEIGHT, 0.0, 1.0)
+    observations[:, 1] = np.clip((velocity + 10) / 20, 0.0, 1.0)
+    observations[:, 2] = 1.0
+    observations[:, 3] = 0.5
+
+    if len(pipe_left) == 0 or len(bird_y) == 0:
+        return observations
+
+    # Next pipe per distinct x: the closest bottom pipe still ahead of the bird
+    unique_left, inverse = np.unique(bird_left, return_inverse=True)
+    ahead = np.asarray(pipe_right)[None, :] > unique_left[:, None] - 20
+    candidate_left = np.where(ahead, np.asarray(pipe_left)[None, :], np.inf)
+    next_idx = np.argmin(candidate_left, axis=1)
+    has_pipe = ahead.any(axis=1)
+
+    bird_has_pipe = has_pipe[inverse]
+    bird_next = next_idx[inverse][bird_has_pipe]
+
+    next_left = np.asarray(pipe_left)[bird_next]
+    next_gap = np.asarray(pipe_gap_center)[bird_next]
+
+    observations[bird_has_pipe, 2] = np.clip(
+        (next_left - bird_right[bird_has_pipe]) / SCREEN_WIDTH, 0.0, 1.0)
+    observations[bird_has_pipe, 3] = np.clip(
+        0.5 + (bird_y[bird_has_pipe] - next_gap) / SCREEN_HEIGHT, 0.0, 1.0)
+
+    return observations
+
+
+def swarm_observations(swarm, pipes):
+    """(N, 4) observation matrix for every bird in a BirdSwarm"""
+    return build_observations(swarm.left, swarm.right, swarm.y, swarm.velocity,
+                              *bottom_pipe_arrays(pipes))
@@ -0,0 +1,88 @@
+from multiprocessing import shared_memory
+import numpy as np
+from src.ai.neural_network import PARAM_DTYPE
+
+# Per-individual result columns, in block order
+RESULT_FIELDS = (
+    ('fitness', np.float64),
+    ('score', np.int64),
+    ('frames', np.int64)
+)
+
+
+class SharedPopulationBuffer:
+    """
+    Genome matrix and per-individual results in multiprocessing.shared_memory.
+
+    The trainer creates the buffer and copies each generation's genomes in
+    (one memcpy); evaluation workers attach once by block name, read their
+    rows by index and write fitness, score and frames straight into the
+    result block, so nothing but (start, stop, seed) task descriptors ever
+    crosses a process boundary.
+    """
+
+    def __init__(self, capacity, num_params, genome_name=None, result_name=None):
+        """
+        Args:
+            capacity: Rows (individuals) the buffer can hold
+            num_params: Genes per row
+            genome_name: Existing genome block to attach to (None creates one)
+            result_name: Existing result block to attach to (None creates one)
+        """
+        self.capacity = capacity
+        self.num_params = num_params
+        self.owner = genome_name is None
+
+        genome_bytes = max(1, capacity * num_params * np.dtype(PARAM_DTYPE).itemsize)
+        result_bytes = max(1, capacity * 8 * len(RESULT_FIELDS))
+        self.genome_block = self._block(genome_name, genome_bytes)
+        self.result_block = self._block(result_name, result_bytes)
+
+        self.genomes = np.ndarray((capacity, num_params), dtype=PARAM_DTYPE,
+                                  buffer=self.genome_block.buf)
+        self.results = {}
+        for column, (field, dtype) in enumerate(RESULT_FIELDS):
+            self.results[field] = np.ndarray((capacity,), dtype=dtype, buffer=self.result_block.buf,
+                                             offset=column * capacity * 8)
+
+    def _block(self, name, size):
+        if name is None:
+            return shared_memory.SharedMemory(create=True, size=size)
+
+        # Pool workers share the trainer's resource tracker, so attaching
+        # registers nothing new and only the owner's unlink frees the block
+        return shared_memory.SharedMemory(name=name)
+
+    @classmethod
+    def attach(cls, descriptor):
+        """Attach to a buffer from its descriptor() in another process"""
+        return cls(*descriptor)
+
+    def descriptor(self):
+        """Small picklable tuple that identifies the buffer"""
+        return (self.capacity, self.num_params, self.genome_block.name, self.result_block.name)
+
+    def fits(self, count, num_params):
+        return count <= self.capacity and num_params == self.num_params
+
+    def load(self, genomes, start=0):
+        """Copy a (N, P) genome matrix into rows [start, start + N)"""
+        self.genomes[start:start + len(genomes)] = genomes
+
+    def read_results(self, count, start=0):
+        """Copies of the results of rows [start, start + count)"""
+        return {field: values[start:start + count].copy() for field, values in self.results.items()}
+
+    def close(self):
+        """Detach; the owner also frees the blocks"""
+        # Views must go before the mapping can be closed
+        self.genomes = None
+        self.results = {}
+        for block in (self.genome_block, self.result_block):
+            block.close()
+            if self.owner:
+                block.unlink()
+
+    def __str__(self):
+        return (f"SharedPopulationBuffer(capacity={self.capacity}, "
+                f"num_params={self.num_params})")
@@ -0,0 +1,301 @@
+import os
+import time
+from concurrent.futures import Future, FIRST_COMPLETED, wait
+import numpy as np
+from src.ai.crossover import Crossover
+from src.ai.mutation import Mutation
+from src.ai.selection import Selection
+from src.sim.evaluator import ProcessPoolEvaluator, evaluate_shard
+from src.utils.constants import *
+from src.utils.rng import get_rng_service
+
+
+class InlineExecutor:
+    """Executor that runs each task on submit (steady-state evolution without workers)"""
+
+    def submit(self, function, *args):
+        future = Future()
+        future.set_result(function(*args))
+        return future
+
+    def shutdown(self):
+        pass
+
+
+class SteadyStateEngine:
+    """
+    Generation-free evolution that starts an evaluation whenever a worker frees up.
+
+    The population and operator settings come from a GeneticAlgorithm. New
+    children are bred from the individuals evaluated so far each time a task
+    completes, so workers never wait for the slowest bird of a generation.
+    A task flies up to `batch` genomes as one shard, which spreads the cost
+    of building an engine over several evaluations.
+    With several workers, tasks run on a ProcessPoolEvaluator: each task in
+    flight owns `batch` rows of its shared-memory buffer, so only row ranges
+    cross the process boundary.
+    A finished child replaces the worst individual (or the loser of a
+    tournament) if it is at least as fit. Every population_size evaluations
+    (the first being the initial population) make one reported epoch, and
+    epoch e is flown on course e, like generation e of HeadlessEngine.
+    Epochs are written to the same statistics log as generations.
+    """
+
+    def __init__(self, population_size=POPULATION_SIZE, workers=1,
+                 replacement=STEADY_STATE_REPLACEMENT, max_frames=HEADLESS_MAX_FRAMES,
+                 collision_mode="analytic", in_flight=STEADY_STATE_IN_FLIGHT,
+                 batch=STEADY_STATE_BATCH, rng_service=None):
+        """
+        Args:
+            population_size: Individuals kept in the pool
+            workers: Worker processes (1 evaluates in-process, reproducibly)
+            replacement: A REPLACEMENT_METHODS key
+            max_frames: Frame cap per episode
+            collision_mode: "analytic" or "hitbox"
+            in_flight: Tasks queued per worker
+            batch: Genomes evaluated per task (1 for one child at a time)
+            rng_service: RNG service of the run (default: the process-wide one)
+        """
+        if replacement not in REPLACEMENT_METHODS:
+            raise ValueError(f"Unknown replacement method: {replacement}")
+
+        self.population_size = population_size
+        self.workers = workers or os.cpu_count() or 1
+        self.replacement = replacement
+        self.max_frames = max_frames
+        self.collision_mode = collision_mode
+        self.capacity = max(1, self.workers * in_flight)
+        self.batch = max(1, batch)
+        self.rng_service = rng_service if rng_service is not None else get_rng_service()
+
+        self.genetic_algorithm = None
+        self.evaluator = None
+        self.free_rows = []
+        self.evaluated = np.zeros(population_size, dtype=bool)
+        self.fitness = np.full(population_size, -np.inf)
+
+        # Evaluations started so far (initial population + births)
+        self.tasks_started = 0
+        self.births = 0
+        self.replacements = 0
+        self.best_score = 0
+
+    def init_ai_training(self):
+        from src.ai.genetic_algorithm import GeneticAlgorithm
+
+        if self.genetic_algorithm is None:
+            print(f"🧬 Initializing Genetic Algorithm with population size: {self.population_size}")
+            self.genetic_algorithm = GeneticAlgorithm(population_size=self.population_size,
+                                                      rng_service=self.rng_service)
+            self.genetic_algorithm.open_stats_log()
+
+    def course_seed(self, task):
+        """Course of evaluation number task: the course of its epoch"""
+        return self.rng_service.course_seed(1 + task // self.population_size)
+
+    def breed(self, birth):
+        """One child genome from two parents picked among the evaluated individuals"""
+        genetic_algorithm = self.genetic_algorithm
+        rng = self.rng_service.stream("birth", birth)
+        candidates = np.flatnonzero(self.evaluated)
+
+        parents = candidates[Selection.select_indices(
+            self.fitness[candidates], 2, genetic_algorithm.selection_method,
+            tournament_size=TOURNAMENT_SIZE, rng=rng)]
+        genomes = genetic_algorithm.population.genomes
+        child, _ = Crossover.batch_crossover(genomes[parents[:1]], genomes[parents[1:]],
+                                             genetic_algorithm.crossover_method, rng=rng)
+        child = np.ascontiguousarray(child, dtype=genomes.dtype)
+        Mutation.batch_mutation(child, genetic_algorithm.mutation_method,
+                                genetic_algorithm.mutation_rate,
+                                birth // self.population_size, genetic_algorithm.generations,
+                                rng=rng)
+        return child[0]
+
+    def replacement_row(self, birth):
+        """Row a finished child competes for"""
+        candidates = np.flatnonzero(self.evaluated)
+        if self.replacement == "worst":
+            return candidates[np.argmin(self.fitness[candidates])]
+
+        rng = self.rng_service.stream("replacement", birth)
+        contestants = rng.choice(candidates, min(TOURNAMENT_SIZE, len(candidates)), replace=False)
+        return contestants[np.argmin(self.fitness[contestants])]
+
+    def insert(self, birth, genome, fitness):
+        """Steady-state insertion of a finished child; True if it entered the pool"""
+        row = self.replacement_row(birth)
+        if fitness < self.fitness[row]:
+            return False
+
+        population = self.genetic_algorithm.population
+        population.genomes[row] = genome
+        self.fitness[row] = fitness
+        population.fitness_scores[row] = fitness
+        self.replacements += 1
+        return True
+
+    def start_evaluator(self):
+        """Shared-memory worker pool with batch rows per task in flight (workers > 1)"""
+        if self.workers > 1:
+            self.evaluator = ProcessPoolEvaluator(self.workers, self.max_frames,
+                                                  self.collision_mode)
+            self.evaluator.start(self.capacity * self.batch,
+                                 self.genetic_algorithm.population.layer_sizes)
+            self.free_rows = [slot * self.batch for slot in range(self.capacity)]
+            return self.evaluator.executor
+        return InlineExecutor()
+
+    def start_task(self, executor, genomes, task):
+        """
+        Start evaluating genomes as evaluations task, task + 1, ...
+
+        Returns:
+            (future, row) where row is the task's first shared-buffer row
+            (None when evaluating in-process)
+        """
+        if self.evaluator is None:
+            future = executor.submit(evaluate_shard, genomes,
+                                     np.arange(task, task + len(genomes)),
+                                     self.genetic_algorithm.population.layer_sizes,
+                                     self.course_seed(task), self.max_frames, self.collision_mode)
+            return future, None
+
+        row = self.free_rows.pop()
+        return self.evaluator.submit_rows(row, genomes, task, self.course_seed(task)), row
+
+    def task_results(self, future, row, count):
+        """Results of a finished task; frees its shared rows"""
+        results = future.result()
+        if row is None:
+            return results
+        self.free_rows.append(row)
+        return self.evaluator.read_rows(row, count)
+
+    def submit_next(self, executor, pending, births_wanted):
+        """Start the next task if one is ready; False when nothing can start"""
+        population = self.genetic_algorithm.population
+        task = self.tasks_started
+        # A task stays within one epoch, so all of its genomes share a course
+        count = min(self.batch, self.population_size - task % self.population_size)
+
+        if task < self.population_size:
+            keys = list(range(task, task + count))
+            genomes, kind = population.genomes[task:task + count].copy(), 'initial'
+        elif self.births < births_wanted and np.count_nonzero(self.evaluated) >= 2:
+            keys = list(range(self.births, min(self.births + count, births_wanted)))
+            genomes, kind = np.stack([self.breed(birth) for birth in keys]), 'birth'
+            self.births += len(keys)
+        else:
+            return False
+
+        future, row = self.start_task(executor, genomes, task)
+        pending[future] = (kind, keys, genomes, row)
+        self.tasks_started += len(keys)
+        return True
+
+    def complete(self, kind, key, genome, fitness, score):
+        self.best_score = max(self.best_score, score)
+        if kind == 'initial':
+            self.evaluated[key] = True
+            self.fitness[key] = fitness
+            self.genetic_algorithm.population.fitness_scores[key] = fitness
+            return False
+        return self.insert(key, genome, fitness)
+
+    def report_epoch(self, epoch, epoch_start, evaluations):
+        """Print an epoch and append it to the statistics log, like a generation"""
+        genetic_algorithm = self.genetic_algorithm
+        elapsed = time.time() - epoch_start
+        evaluated = self.fitness[self.evaluated]
+        best = float(evaluated.max()) if len(evaluated) else 0.0
+        average = float(evaluated.mean()) if len(evaluated) else 0.0
+        print(f"🧬 Epoch {epoch}: best fitness {best:.1f}, average {average:.1f}, "
+              f"best score {self.best_score}, {self.replacements} replacements, "
+              f"{evaluations / max(elapsed, 1e-9):.0f} evaluations/s")
+
+        diversity_stats = genetic_algorithm.population.get_diversity_statistics(
+            rng=self.rng_service.stream("diversity", epoch))
+        record = {
+            'generation': epoch,
+            'best_fitness': best,
+            'average_fitness': average,
+            'worst_fitness': float(evaluated.min()) if len(evaluated) else 0.0,
+            'fitness_std': float(evaluated.std()) if len(evaluated) else 0.0,
+            'diversity': diversity_stats['mean_l1'],
+            'distance_mean': diversity_stats['distance_mean'],
+            'distance_error': diversity_stats['distance_error'],
+            'mean_gene_variance': diversity_stats['mean_gene_variance'],
+            'mutation_rate': genetic_algorithm.mutation_rate,
+            'evolution_time': elapsed,
+            'elite_count': 0,
+            'epoch': epoch,
+            'best_score': self.best_score,
+            'replacements': self.replacements
+        }
+        genetic_algorithm.generation_stats.append(record)
+        if genetic_algorithm.stats_log is not None:
+            genetic_algorithm.stats_log.append(record)
+        return record
+
+    def run(self, epochs=GENERATIONS):
+        """
+        Evolve for epochs * population_size evaluations (initial population included)
+
+        Returns:
+            List of per-epoch statistics records
+        """
+        print(f"🚀 Starting steady-state training for {epochs} epochs on {self.workers} "
+              f"worker(s), {self.replacement} replacement")
+        self.init_ai_training()
+        births_wanted = max(0, epochs - 1) * self.population_size
+        self.genetic_algorithm.population.fitness_scores = [-np.inf] * self.population_size
+
+        executor = self.start_evaluator()
+        pending = {}
+        summaries = []
+        completed = 0
+        epoch_start = time.time()
+
+        try:
+            while True:
+                while len(pending) < self.capacity and self.submit_next(executor, pending,
+                                                                        births_wanted):
+                    pass
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                # Submission order, so an in-process run is reproducible
+                for future in [future for future in pending if future in done]:
+                    kind, keys, genomes, buffer_row = pending.pop(future)
+                    results = self.task_results(future, buffer_row, len(keys))
+                    for row, key in enumerate(keys):
+                        self.complete(kind, key, genomes[row], float(results['fitness'][row]),
+                                      int(results['score'][row]))
+                        completed += 1
+                        if completed % self.population_size != 0:
+                            continue
+
+                        summaries.append(self.report_epoch(completed // self.population_size,
+                                                           epoch_start, self.population_size))
+                        epoch_start = time.time()
+                        self.replacements = 0
+                        self.best_score = 0
+                        self.genetic_algorithm.save_best_individual()
+                        self.genetic_algorithm.save_top_individuals()
+        finally:
+            if self.evaluator is not None:
+                self.evaluator.close()
+                self.evaluator = None
+            else:
+                executor.shutdown()
+            if self.genetic_algorithm.stats_log is not None:
+                self.genetic_algorithm.save_generation_stats()
+                self.genetic_algorithm.close_stats_log()
+
+        return summaries
+
+    def __str__(self):
+        return (f"SteadyStateEngine(pop={self.population_size}, workers={self.workers}, "
+                f"replacement={self.replacement}, births={self.births})")
@@ -0,0 +1,123 @@
+import numpy as np
+from src.utils.constants import *
+
+
+class BirdSwarm:
+    """
+    Structure-of-arrays store for a whole population of headless birds.
+
+    Every per-bird attribute of the game's Bird lives in a NumPy array indexed
+    by bird, so one step() call advances the physics of every bird at once.
+    """
+
+    def __init__(self, x, y, bird_types=None):
+        """
+        Args:
+            x: Start x (center) of every bird
+            y: Start y (center) of every bird
+            bird_types: Optional list of bird type names, one per bird
+        """
+        self.size = len(x)
+        self.x = np.asarray(x, dtype=np.int64).copy()
+        self.y = np.asarray(y, dtype=np.float64).copy()
+        self.bird_types = list(bird_types) if bird_types is not None else ["BLUE"] * self.size
+
+        # Fixed, unrotated sprite box. The game's Bird re-centers its rect on
+        # the rotated sprite every frame (24x34 nose down, up to 40x36 while
+        # climbing), so ground, ceiling and pipe contacts can be a few pixels
+        # off from the pygame game. Spriteless Birds match exactly.
+        self.width = BIRD_WIDTH
+        self.height = BIRD_HEIGHT
+
+        # Physics
+        self.gravity = GRAVITY
+        self.jump_strength = JUMP_STRENGTH
+        self.max_velocity = 10
+        self.velocity = np.zeros(self.size, dtype=np.float64)
+
+        # Status
+        self.alive = np.ones(self.size, dtype=bool)
+        self.score = np.zeros(self.size, dtype=np.int64)
+        self.fitness = np.zeros(self.size, dtype=np.float64)
+        self.frames_survived = np.zeros(self.size, dtype=np.int64)
+
+        # Sequence number of the next pipe pair each bird has to pass
+        self.next_pipe = np.zeros(self.size, dtype=np.int64)
+
+    @classmethod
+    def spawn(cls, population_size, indices=None):
+        """
+        Create a swarm at the start positions GameEngine uses
+
+        Args:
+            population_size: Number of birds
+            indices: Population index of each bird (default 0..size-1); a
+                     shard of the population starts where the full swarm would
+        """
+        idx = np.arange(population_size) if indices is None else np.asarray(indices)
+        bird_types = ["BLUE", "RED", "YELLOW"]
+        return cls(80 + (idx % 10) * 2,
+                   200 + (idx % 20) * 10,
+                   [bird_types[i % len(bird_types)] for i in idx])
+
+    @property
+    def left(self):
+        return self.x - self.width // 2
+
+    @property
+    def right(self):
+        return self.left + self.width
+
+    @property
+    def top(self):
+        return self.y - self.height // 2
+
+    @property
+    def bottom(self):
+        return self.top + self.height
+
+    def step(self, jump_mask=None):
+        """
+        Advance every alive bird by one frame.
+
+        Applies jumps, gravity, the max_velocity clamp and position
+        integration exactly like Bird.update (src/game/bird.py), then kills birds that hit
+        the ground or the ceiling.
+
+        Args:
+            jump_mask: Boolean array, True where the bird jumps this frame
+
+        Returns:
+            Boolean array of birds that died on this step
+        """
+        alive = self.alive
+        if jump_mask is not None:
+            self.velocity[alive & jump_mask] = self.jump_strength
+
+        self.velocity[alive] = np.minimum(
+            self.velocity[alive] + self.gravity, self.max_velocity)
+        self.y[alive] += np.trunc(self.velocity[alive])
+
+        self.frames_survived[alive] += 1
+        self.fitness[alive] += 0.1
+
+        died = alive & ((self.bottom >= GROUND_Y - COLLISION_BUFFER) |
+                        (self.top <= COLLISION_BUFFER))
+        self.alive[died] = False
+        return died
+
+    def kill(self, mask):
+        """Mark the birds in mask as dead"""
+        self.alive[mask] = False
+
+    def alive_count(self):
+        return int(np.count_nonzero(self.alive))
+
+    def any_alive(self):
+        return bool(self.alive.any())
+
+    def __len__(self):
+        return self.size
+
+    def __str__(self):
+        return f"BirdSwarm(size={self.size}, alive={self.alive_count()}, best score={int(self.score.max(initial=0))})"
@@ -1,15 +1,19 @@
 import pygame
 import os
 from src.utils.constants import *
+from src.utils.sprite_atlas import SpriteAtlas
 
 class AssetLoader:
     def __init__(self):
         self.images = {}
         self.sounds = {}
         self.fonts = {}
+        self.bird_atlases = {}
+        self.pipe_masks = {}
         
     def load_all_assets(self):
         self.load_images()
+        self.build_sprite_atlas()
         self.load_sounds()
         self.load_fonts()
         
@@ -54,6 +58,22 @@ class AssetLoader:
         except pygame.error as e:
             print(f"❌ Error loading images: {e}")
             
+    def build_sprite_atlas(self):
+        """Pre-rotate bird sprites and build bird/pipe collision masks once"""
+        for type_key, bird_type in BIRD_TYPES.items():
+            sprites = self.images.get(f"{bird_type}_sprites")
+            if sprites:
+                self.bird_atlases[type_key] = SpriteAtlas(sprites)
+
+        # Pipes come in two orientations: bottom (as loaded) and top (flipped)
+        for pipe_name in PIPE_TYPES:
+            pipe_img = self.images.get(f"pipe_{pipe_name.lower()}")
+            if pipe_img:
+                top_img = pygame.transform.flip(pipe_img, False, True)
+                self.images[f"pipe_{pipe_name.lower()}_top"] = top_img
+                self.pipe_masks[(pipe_name, False)] = pygame.mask.from_surface(pipe_img)
+                self.pipe_masks[(pipe_name, True)] = pygame.mask.from_surface(top_img)
+
     def load_sounds(self):
         try:
             pygame.mixer.init()
@@ -88,8 +108,15 @@ class AssetLoader:
     def get_bird_sprites(self, bird_type="BLUE"):
         return self.images.get(f"{BIRD_TYPES[bird_type]}_sprites", [])
         
-    def get_pipe_sprite(self, pipe_type="GREEN"):
-        return self.images.get(f"pipe_{pipe_type.lower()}")
+    def get_pipe_sprite(self, pipe_type="GREEN", is_top=False):
+        suffix = "_top" if is_top else ""
+        return self.images.get(f"pipe_{pipe_type.lower()}{suffix}")
+
+    def get_bird_atlas(self, bird_type="BLUE"):
+        return self.bird_atlases.get(bird_type)
+
+    def get_pipe_mask(self, pipe_type="GREEN", is_top=False):
+        return self.pipe_masks.get((pipe_type, is_top))
         
     def get_background(self, bg_type="DAY"):
         return self.images.get(f"background_{bg_type.lower()}")
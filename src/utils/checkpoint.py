@@ -0,0 +1,168 @@
+import glob
+import io
+import json
+import os
+import queue
+import threading
+import numpy as np
+from src.utils.constants import *
+
+CHECKPOINT_VERSION = 1
+CHECKPOINT_PATTERN = "checkpoint_gen{generation:06d}.npz"
+
+
+def split_arrays(state, arrays, path="state"):
+    """Copy of a nested state with every ndarray moved into arrays (JSON-safe remainder)"""
+    if isinstance(state, np.ndarray):
+        arrays[path] = state
+        return {'__array__': path}
+    if isinstance(state, dict):
+        return {key: split_arrays(value, arrays, f"{path}.{key}") for key, value in state.items()}
+    if isinstance(state, (list, tuple)):
+        return [split_arrays(value, arrays, f"{path}.{i}") for i, value in enumerate(state)]
+    if isinstance(state, np.generic):
+        return state.item()
+    return state
+
+
+def join_arrays(state, arrays):
+    """Inverse of split_arrays"""
+    if isinstance(state, dict):
+        if set(state) == {'__array__'}:
+            return arrays[state['__array__']]
+        return {key: join_arrays(value, arrays) for key, value in state.items()}
+    if isinstance(state, list):
+        return [join_arrays(value, arrays) for value in state]
+    return state
+
+
+def write_checkpoint(filename, state):
+    """
+    Atomically write a training state (nested dicts, lists, scalars, ndarrays)
+
+    The file is an .npz of the arrays plus the rest of the state as JSON. It
+    is written and fsynced under a temporary name and renamed into place, so
+    a crash mid-write leaves the previous checkpoints untouched.
+    """
+    arrays = {}
+    meta = split_arrays(state, arrays)
+    document = json.dumps({'version': CHECKPOINT_VERSION, 'state': meta})
+
+    buffer = io.BytesIO()
+    np.savez(buffer, __meta__=np.frombuffer(document.encode("utf-8"), dtype=np.uint8), **arrays)
+
+    directory = os.path.dirname(filename) or "."
+    os.makedirs(directory, exist_ok=True)
+    temporary = f"{filename}.tmp"
+    with open(temporary, 'wb') as f:
+        f.write(buffer.getbuffer())
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporary, filename)
+
+    # Make the rename itself durable
+    try:
+        descriptor = os.open(directory, os.O_RDONLY)
+        try:
+            os.fsync(descriptor)
+        finally:
+            os.close(descriptor)
+    except OSError:
+        pass
+
+
+def list_checkpoints(directory=CHECKPOINT_DIR):
+    """Checkpoint files in a directory, oldest first"""
+    return sorted(glob.glob(os.path.join(directory, CHECKPOINT_PATTERN.replace("{generation:06d}", "*"))))
+
+
+def load_checkpoint(path):
+    """
+    Read a checkpoint file, or the newest checkpoint of a directory
+
+    Returns:
+        The state passed to write_checkpoint
+    """
+    if os.path.isdir(path):
+        checkpoints = list_checkpoints(path)
+        if not checkpoints:
+            raise FileNotFoundError(f"No checkpoints in {path}")
+        path = checkpoints[-1]
+
+    with np.load(path) as data:
+        document = json.loads(data['__meta__'].tobytes().decode("utf-8"))
+        if document['version'] > CHECKPOINT_VERSION:
+            raise ValueError(f"Checkpoint version {document['version']} is newer than "
+                             f"{CHECKPOINT_VERSION}")
+        arrays = {key: data[key] for key in data.files if key != '__meta__'}
+
+    state = join_arrays(document['state'], arrays)
+    state['path'] = path
+    return state
+
+
+class Checkpointer:
+    """
+    Writes training checkpoints on a background thread and keeps the last few.
+
+    submit() only hands over a snapshot (the caller copies its arrays), so
+    the training loop never waits on the disk unless the previous checkpoint
+    is still being written.
+    """
+
+    def __init__(self, directory=CHECKPOINT_DIR, interval=BACKUP_INTERVAL, keep=BACKUP_COUNT):
+        """
+        Args:
+            directory: Where checkpoint_genNNNNNN.npz files go
+            interval: Generations between checkpoints
+            keep: Checkpoints kept (older ones are deleted)
+        """
+        self.directory = directory
+        self.interval = max(1, interval)
+        self.keep = max(1, keep)
+        self.queue = queue.Queue(maxsize=1)
+        self.last_error = None
+        self.thread = threading.Thread(target=self.write_loop, daemon=True)
+        self.thread.start()
+
+    def due(self, generation):
+        return generation % self.interval == 0
+
+    def submit(self, generation, state):
+        """Queue a snapshot of the state after the given generation"""
+        self.queue.put((generation, state))
+
+    def write_loop(self):
+        while True:
+            item = self.queue.get()
+            try:
+                if item is None:
+                    return
+                generation, state = item
+                filename = os.path.join(self.directory,
+                                        CHECKPOINT_PATTERN.format(generation=generation))
+                write_checkpoint(filename, state)
+                self.rotate()
+            except Exception as e:
+                self.last_error = e
+                print(f"⚠️ Could not write checkpoint: {e}")
+            finally:
+                self.queue.task_done()
+
+    def rotate(self):
+        for old in list_checkpoints(self.directory)[:-self.keep]:
+            try:
+                os.remove(old)
+            except OSError:
+                pass
+
+    def flush(self):
+        """Wait until every submitted checkpoint is on disk"""
+        self.queue.join()
+
+    def close(self):
+        self.queue.put(None)
+        self.thread.join()
+
+    def __str__(self):
+        return f"Checkpointer({self.directory}, every={self.interval}, keep={self.keep})"
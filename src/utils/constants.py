@@ -21,6 +21,11 @@ GRAVITY = 0.5
 JUMP_STRENGTH = -9
 BIRD_SIZE = 34
 
+# Bird tilt limits (degrees) and the rotation step of the cached sprite atlas
+BIRD_MIN_ROTATION = -90
+BIRD_MAX_ROTATION = 25
+SPRITE_ROTATION_STEP = 1.5    # velocity moves in 0.5 steps, tilt = -3 * velocity
+
 # =============================================================================
 # PIPE SETTINGS
 # =============================================================================
@@ -95,6 +100,7 @@ MUSIC_VOLUME = 0.3
 POPULATION_SIZE = 150          # INCREASED: More birds = higher chance of good mutation
 GENERATIONS = 1000
 ELITE_COUNT = 10               # Keep top 10 to ensure best traits persist
+IMMIGRANT_RATE = 0.1           # Fraction of each generation replaced by random networks
 
 # Evolution Rates
 MUTATION_RATE = 0.2            # Increased to 20% to prevent stagnation
@@ -107,8 +113,34 @@ SELECTION_PRESSURE = 1.5      # Pressure for rank-based selection
 # Mutation Parameters
 MUTATION_STRENGTH = 0.2       # Standard deviation for Gaussian mutation
 MUTATION_RANGE = 0.5          # Range for uniform mutation
+CREEP_STEP = 0.05             # Max step for creep mutation
+BOUNDARY_LIMIT = 1.0          # Genes are set to +/- this by boundary mutation
+ADAPTIVE_INITIAL_RATE = 0.3   # Adaptive mutation rate at generation 0
+ADAPTIVE_FINAL_RATE = 0.05    # Adaptive mutation rate at the last generation
 ADAPTIVE_MUTATION = True      # Enable adaptive mutation rates
 
+# Island Model (--islands)
+ISLAND_COUNT = 4                  # Independent populations, one process each
+ISLAND_MIGRATION_INTERVAL = 10    # Generations between migrations
+ISLAND_MIGRANTS = 2               # Top-k individuals each island sends per migration
+ISLAND_TOPOLOGY = "ring"          # Key of MIGRATION_TOPOLOGIES
+# Operator settings, cycled over the islands; migration replaces random immigrants
+ISLAND_SETTINGS = [
+    {'selection_method': "tournament", 'crossover_method': "uniform",
+     'mutation_method': "gaussian", 'immigrant_rate': 0.0},
+    {'selection_method': "rank", 'crossover_method': "two_point",
+     'mutation_method': "creep", 'immigrant_rate': 0.0},
+    {'selection_method': "roulette", 'crossover_method': "arithmetic",
+     'mutation_method': "gaussian", 'immigrant_rate': 0.0},
+    {'selection_method': "sus", 'crossover_method': "single_point",
+     'mutation_method': "adaptive", 'immigrant_rate': 0.0}
+]
+
+# Diversity Measurement
+DIVERSITY_EXACT_LIMIT = 2000      # Measure all pairs up to this population size
+DIVERSITY_SAMPLE_PAIRS = 20000    # Random pairs measured above the limit
+DIVERSITY_PROJECTION_DIM = 256    # Genomes with more genes are projected first
+
 # =============================================================================
 # NEURAL NETWORK ARCHITECTURE
 # =============================================================================
@@ -163,8 +195,52 @@ CONVERGENCE_THRESHOLD = 0.01  # Fitness improvement threshold for convergence
 # Performance Settings
 MAX_VISIBLE_BIRDS = 10        # Limit birds shown for performance
 SPEED_MULTIPLIER = 1.0        # Game speed during training (1.0 = normal)
+MIN_SPEED_MULTIPLIER = 0.25   # Slowest speed reachable with the speed hotkeys
+MAX_SPEED_MULTIPLIER = 64     # Fastest real-time speed (sim ticks per frame)
+RENDER_INTERVAL = 100         # Unthrottled mode renders once every N sim ticks
 HEADLESS_TRAINING = False     # Run without graphics for faster training
 
+# =============================================================================
+# HEADLESS SIMULATION
+# =============================================================================
+
+# Sprite dimensions used by the headless physics (match the PNG assets)
+BIRD_WIDTH = 34
+BIRD_HEIGHT = 24
+PIPE_SPRITE_WIDTH = 52
+PIPE_SPRITE_HEIGHT = 320
+
+# Pipe spawning (frames between spawns and gap center limits)
+PIPE_SPAWN_DELAY = 90
+PIPE_GAP_MARGIN = 150         # Gap centers stay this far from top/bottom
+PIPE_COURSE_LENGTH = 256      # Gap centers drawn per PipeCourse schedule chunk
+PIPE_COURSE_CAPACITY = 8      # Max pipe pairs on screen (ring buffer size)
+
+# Playfield limits used for ground/ceiling kills
+GROUND_Y = SCREEN_HEIGHT - GROUND_HEIGHT
+COLLISION_BUFFER = 5          # Pixel buffer above ground / below ceiling
+
+# Frame cap per headless generation (MAX_GAME_TIME at the nominal FPS)
+HEADLESS_MAX_FRAMES = MAX_GAME_TIME * FPS // 1000
+
+# Parallel evaluation (headless only)
+EVALUATION_WORKERS = 1              # Worker processes (1 = evaluate in-process)
+EVALUATION_CHUNKS_PER_WORKER = 4    # Shards per worker, evens out episode lengths
+
+# Steady-state evolution (--steady-state)
+STEADY_STATE_REPLACEMENT = "worst"  # Key of REPLACEMENT_METHODS
+STEADY_STATE_IN_FLIGHT = 2          # Tasks queued per worker (no idle gaps)
+STEADY_STATE_BATCH = 8              # Births flown together per task (one engine setup each)
+
+# Distributed evaluation over TCP (--listen / src.sim.distributed workers)
+DISTRIBUTED_HOST = "127.0.0.1"
+DISTRIBUTED_PORT = 5757
+DISTRIBUTED_TASK_SIZE = 64              # Genome rows per task
+DISTRIBUTED_TASKS_PER_WORKER = 2        # Tasks in flight per worker (hides latency)
+DISTRIBUTED_HEARTBEAT_INTERVAL = 1.0    # Seconds between worker heartbeats
+DISTRIBUTED_HEARTBEAT_TIMEOUT = 5.0     # Silent workers are dropped after this
+DISTRIBUTED_WORKER_TIMEOUT = 60.0       # Seconds to wait with no worker connected
+
 # =============================================================================
 # DATA PATHS
 # =============================================================================
@@ -173,15 +249,22 @@ HEADLESS_TRAINING = False     # Run without graphics for faster training
 DATA_DIR = "data"
 MODELS_DIR = os.path.join(DATA_DIR, "models")
 STATS_DIR = os.path.join(DATA_DIR, "statistics")
+CHECKPOINT_DIR = os.path.join(DATA_DIR, "checkpoints")
 LOGS_DIR = "logs"
 
 # File Names
-BEST_BIRD_FILE = os.path.join(MODELS_DIR, "best_bird.json")
+MODEL_EXTENSION = ".model"      # Binary model format (src/ai/model_io.py)
+MODEL_FORMAT_VERSION = 1
+BEST_BIRD_FILE = os.path.join(MODELS_DIR, "best_bird" + MODEL_EXTENSION)
+BEST_BIRD_JSON_FILE = os.path.join(MODELS_DIR, "best_bird.json")   # Legacy format
+TOP_BIRDS_FILE = os.path.join(MODELS_DIR, "top_birds" + MODEL_EXTENSION)
+TOP_BIRDS_COUNT = 10          # Models saved to TOP_BIRDS_FILE with the best bird
 GENERATION_STATS_FILE = os.path.join(STATS_DIR, "generation_stats.csv")
+GENERATION_STATS_LOG = os.path.join(STATS_DIR, "generation_stats.jsonl")   # Append-only
 EVOLUTION_STATS_FILE = os.path.join(STATS_DIR, "evolution_stats.json")
 TRAINING_LOG_FILE = os.path.join(LOGS_DIR, "training.log")
 
-# Backup Files
+# Backup Files (training checkpoints in CHECKPOINT_DIR, see --resume)
 BACKUP_INTERVAL = 20          # Backup every N generations
 BACKUP_COUNT = 5              # Keep last N backups
 
@@ -194,6 +277,7 @@ SELECTION_METHODS = {
     "tournament": "Tournament Selection",
     "roulette": "Roulette Wheel Selection",
     "rank": "Rank-Based Selection",
+    "sus": "Stochastic Universal Sampling",
     "elite": "Elite Selection"
 }
 
@@ -214,10 +298,34 @@ MUTATION_METHODS = {
     "adaptive": "Adaptive Mutation"
 }
 
+# Collision Modes
+COLLISION_MODES = {
+    "pixel": "Pixel-Perfect Mask Collision",
+    "hitbox": "Inflated Hitbox Collision",
+    "analytic": "Analytic Gap-Bounds Collision"
+}
+
+# Steady-State Replacement
+REPLACEMENT_METHODS = {
+    "worst": "Replace the Worst Individual",
+    "tournament": "Replace the Loser of a Tournament"
+}
+
+# Island Migration Topologies
+MIGRATION_TOPOLOGIES = {
+    "ring": "Fixed Ring (island i sends to i + 1)",
+    "random": "Random Ring (reshuffled every migration)"
+}
+
 # Default Algorithm Configuration
 DEFAULT_SELECTION = "tournament"
 DEFAULT_CROSSOVER = "single_point"
 DEFAULT_MUTATION = "gaussian"
+DEFAULT_COLLISION_MODE = "pixel"
+
+# Hitbox shrink per side in pixels (Bird.check_collision inflates by -8 / -4)
+HITBOX_BIRD_SHRINK = 4
+HITBOX_PIPE_SHRINK = 2
 
 # =============================================================================
 # DEBUGGING & VISUALIZATION
@@ -235,6 +343,18 @@ SHOW_FITNESS_GRAPH = True     # Show real-time fitness graph
 SHOW_DIVERSITY_GRAPH = True   # Show genetic diversity graph
 UPDATE_FREQUENCY = 60         # Update display every N frames
 
+# Telemetry (buffered logging from the frame loop to TRAINING_LOG_FILE)
+TELEMETRY_LEVEL = "DEBUG" if VERBOSE_LOGGING else "INFO"
+TELEMETRY_ECHO_LEVEL = "WARNING"    # Records at or above this are also printed
+TELEMETRY_BUFFER_SIZE = 10000       # Ring buffer size (oldest records dropped)
+TELEMETRY_FLUSH_INTERVAL = 1.0      # Seconds between background flushes
+TELEMETRY_HISTORY_SIZE = 1000       # Entries kept in GameEngine's debug logs
+TELEMETRY_SAMPLE_RATES = {          # Record one frame in N per channel
+    "game_state": 10,
+    "decision": 15,
+    "decision_summary": 30
+}
+
 # Performance Monitoring
 MONITOR_PERFORMANCE = True    # Track performance metrics
 MEMORY_MONITORING = False     # Monitor memory usage
@@ -0,0 +1,142 @@
+import random
+import numpy as np
+
+# Stream families; a stream is (family, *counters) under the run seed
+STREAM_IDS = {
+    "init": 0,          # (index,) networks created outside a population
+    "individual": 1,    # (generation, index) initialization of one individual
+    "selection": 2,     # (generation,)
+    "crossover": 3,     # (generation,)
+    "mutation": 4,      # (generation,)
+    "diversity": 5,     # (generation,)
+    "course": 6,        # (generation,) pipe course seed
+    "game": 7,          # () legacy `random` / `np.random` state of the game loop
+    "migration": 8,     # (generation,) island migration topology, shared by all islands
+    "island": 9,        # (island, family, *counters) prefix of every stream of an island
+    "birth": 10,        # (birth,) parents, crossover and mutation of one steady-state child
+    "replacement": 11,  # (birth,) steady-state replacement tournament
+    "ad_hoc": 12        # (family, index) operator calls without an explicit rng (next_stream)
+}
+
+
+class RNGService:
+    """
+    Central source of randomness for a run.
+
+    Every stream is a counter-based Philox generator keyed by the run seed
+    plus a (family, *counters) spawn key, e.g. ("individual", generation,
+    index). A stream depends only on its key, never on how many other
+    streams were drawn before it or on which process asks for it, so a
+    seeded run is reproducible with any number of workers.
+
+    An island of an island-model run gets its own service (for_island) whose
+    keys are prefixed with ("island", island), so islands never share draws.
+    """
+
+    def __init__(self, seed=None, island=None):
+        """
+        Args:
+            seed: Run seed (None draws fresh entropy, reported as self.seed)
+            island: Island index, or None for the run's main streams
+        """
+        self.seed = np.random.SeedSequence(seed).entropy
+        self.island = island
+        self.counters = {}
+
+    def for_island(self, island):
+        """Service for one island of this run"""
+        return RNGService(self.seed, island)
+
+    def seed_sequence(self, family, *counters):
+        if family not in STREAM_IDS:
+            raise ValueError(f"Unknown RNG stream: {family}")
+        spawn_key = (STREAM_IDS[family],) + tuple(int(c) for c in counters)
+        if self.island is not None:
+            spawn_key = (STREAM_IDS["island"], int(self.island)) + spawn_key
+        return np.random.SeedSequence(self.seed, spawn_key=spawn_key)
+
+    def stream(self, family, *counters):
+        """Independent numpy Generator for one stream key"""
+        return np.random.Generator(np.random.Philox(self.seed_sequence(family, *counters)))
+
+    def next_stream(self, family):
+        """
+        Stream keyed by a per-family call counter (for objects created ad hoc)
+
+        "init" has no other streams; the other families key theirs by
+        generation, so their ad hoc streams live under ("ad_hoc", family,
+        index) and never repeat a generation's stream.
+        """
+        index = self.counters.get(family, 0)
+        self.counters[family] = index + 1
+        if family == "init":
+            return self.stream(family, index)
+        return self.stream("ad_hoc", STREAM_IDS[family], index)
+
+    def individual(self, generation, index):
+        return self.stream("individual", generation, index)
+
+    def int_seed(self, family, *counters):
+        """32-bit integer seed for APIs that take one (PipeCourse, `random`)"""
+        return int(self.seed_sequence(family, *counters).generate_state(1)[0])
+
+    def course_seed(self, generation):
+        return self.int_seed("course", generation)
+
+    def seed_legacy(self):
+        """Seed the global `random` and `np.random` states used by the pygame loop"""
+        seed = self.int_seed("game")
+        random.seed(seed)
+        np.random.seed(seed)
+
+    def get_state(self):
+        """Seed, ad hoc stream counters and the legacy global states (for checkpoints)"""
+        version, internal, gauss = random.getstate()
+        return {
+            'seed': self.seed,
+            'island': self.island,
+            'counters': dict(self.counters),
+            'legacy_random': [version, list(internal), gauss],
+            'legacy_numpy': np.random.get_state(legacy=False)
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        """Service continuing the streams of get_state()"""
+        service = cls(state['seed'], state['island'])
+        service.counters = dict(state['counters'])
+        return service
+
+    def __str__(self):
+        if self.island is not None:
+            return f"RNGService(seed={self.seed}, island={self.island})"
+        return f"RNGService(seed={self.seed})"
+
+
+_service = None
+
+
+def seed_run(seed=None):
+    """Start a run: replace the process-wide RNG service with one for seed"""
+    global _service
+    _service = RNGService(seed)
+    _service.seed_legacy()
+    return _service
+
+
+def restore_run(state):
+    """Resume a run: the process-wide service and legacy states of RNGService.get_state()"""
+    global _service
+    _service = RNGService.from_state(state)
+    version, internal, gauss = state['legacy_random']
+    random.setstate((version, tuple(internal), gauss))
+    np.random.set_state(state['legacy_numpy'])
+    return _service
+
+
+def get_rng_service():
+    """The process-wide RNG service (created from fresh entropy on first use)"""
+    global _service
+    if _service is None:
+        _service = RNGService()
+    return _service
@@ -0,0 +1,45 @@
+import pygame
+from src.utils.constants import *
+
+
+class SpriteAtlas:
+    """
+    Pre-rotated bird sprites and their collision masks.
+
+    Every (flap frame, quantized rotation) image is built once with
+    pygame.transform.rotate and pygame.mask.from_surface, so birds only have
+    to look up their current image and mask each frame.
+    """
+
+    def __init__(self, sprites, rotation_step=SPRITE_ROTATION_STEP,
+                 min_rotation=BIRD_MIN_ROTATION, max_rotation=BIRD_MAX_ROTATION):
+        self.rotation_step = rotation_step
+        self.min_key = round(min_rotation / rotation_step)
+        self.max_key = round(max_rotation / rotation_step)
+        self.frames = {}
+
+        for frame, sprite in enumerate(sprites):
+            for key in range(self.min_key, self.max_key + 1):
+                # The end keys hold the exact clamp angles birds rest at
+                rotation = min(max_rotation, max(min_rotation, key * rotation_step))
+                image = pygame.transform.rotate(sprite, rotation)
+                self.frames[(frame, key)] = (image, pygame.mask.from_surface(image))
+
+    def rotation_key(self, rotation):
+        """Quantize a rotation in degrees to an atlas key"""
+        key = round(rotation / self.rotation_step)
+        return min(self.max_key, max(self.min_key, key))
+
+    def get(self, frame, rotation):
+        """
+        Args:
+            frame: Flap animation frame index
+            rotation: Rotation in degrees
+
+        Returns:
+            (image, mask) tuple for the closest cached rotation
+        """
+        return self.frames[(frame, self.rotation_key(rotation))]
+
+    def __len__(self):
+        return len(self.frames)
@@ -0,0 +1,191 @@
+import argparse
+import csv
+import json
+import os
+import time
+from src.utils.constants import *
+
+# CSV columns, in GeneticAlgorithm.evolve_generation's gen_stats order
+GENERATION_STATS_FIELDS = [
+    'generation', 'best_fitness', 'average_fitness', 'worst_fitness', 'fitness_std',
+    'diversity', 'distance_mean', 'distance_error', 'mean_gene_variance',
+    'mutation_rate', 'evolution_time', 'elite_count'
+]
+
+
+class StatsLog:
+    """
+    Append-only generation statistics.
+
+    Every generation adds one JSON line to the record log and one row to the
+    CSV, flushed immediately, so the cost of a save does not grow with the
+    run and a crash loses at most the generation being written. The first
+    log line of a run holds its algorithm parameters. compact() turns the
+    log into the legacy evolution_stats.json summary when one is needed.
+    """
+
+    def __init__(self, log_file=GENERATION_STATS_LOG, csv_file=GENERATION_STATS_FILE,
+                 offsets=None):
+        """
+        Args:
+            log_file: JSON Lines record log
+            csv_file: CSV table (None to skip)
+            offsets: offsets() of an earlier writer to continue from (the
+                     files are cut back to them); None starts new files
+        """
+        self.log_file = log_file
+        self.csv_file = csv_file
+
+        self.log = self._open(log_file, offsets and offsets.get('log'))
+        self.csv = None
+        self.csv_writer = None
+        if csv_file:
+            self.csv = self._open(csv_file, offsets and offsets.get('csv'), newline='')
+            self.csv_writer = csv.DictWriter(self.csv, GENERATION_STATS_FIELDS,
+                                             extrasaction='ignore')
+            if self.csv.tell() == 0:
+                self.csv_writer.writeheader()
+                self.csv.flush()
+
+    def _open(self, filename, offset, newline=None):
+        directory = os.path.dirname(filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if offset is None:
+            return open(filename, 'w', newline=newline)
+
+        # Drop anything written after the offset (e.g. after a checkpoint)
+        with open(filename, 'a'):
+            pass
+        os.truncate(filename, offset)
+        return open(filename, 'a', newline=newline)
+
+    def write_parameters(self, parameters):
+        """Start a run: record its algorithm parameters"""
+        self._write_line({'algorithm_parameters': parameters})
+
+    def append(self, record):
+        """Add one generation's statistics"""
+        self._write_line(record)
+        if self.csv_writer is not None:
+            self.csv_writer.writerow(record)
+            self.csv.flush()
+
+    def _write_line(self, entry):
+        self.log.write(json.dumps(entry) + "\n")
+        self.log.flush()
+
+    def offsets(self):
+        """Current end of each file, to continue the log from later"""
+        return {
+            'log': self.log.tell(),
+            'csv': self.csv.tell() if self.csv is not None else None
+        }
+
+    def close(self):
+        self.log.close()
+        if self.csv is not None:
+            self.csv.close()
+
+    def __str__(self):
+        return f"StatsLog({self.log_file}, {self.csv_file})"
+
+
+def read_log(log_file=GENERATION_STATS_LOG, offset=0):
+    """
+    Complete entries of a record log from a byte offset
+
+    A line still being written (no newline yet) is left for the next call.
+
+    Returns:
+        (list of entries, offset to continue from)
+    """
+    entries = []
+    if not os.path.exists(log_file):
+        return entries, offset
+
+    with open(log_file, 'rb') as f:
+        f.seek(offset)
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            offset += len(line)
+            if line.strip():
+                entries.append(json.loads(line))
+    return entries, offset
+
+
+def follow_log(log_file=GENERATION_STATS_LOG, offset=0, poll_interval=1.0):
+    """Yield entries as they are appended (like tail -f); runs until the caller stops"""
+    while True:
+        entries, offset = read_log(log_file, offset)
+        yield from entries
+        if not entries:
+            time.sleep(poll_interval)
+
+
+def compact(log_file=GENERATION_STATS_LOG, output=EVOLUTION_STATS_FILE):
+    """
+    Write the legacy summary JSON (parameters, statistics, fitness history) from a log
+
+    Returns:
+        The summary dict
+    """
+    entries, _ = read_log(log_file)
+    parameters = {}
+    records = []
+    for entry in entries:
+        if 'algorithm_parameters' in entry:
+            parameters = entry['algorithm_parameters']
+        else:
+            records.append(entry)
+
+    stats_data = {
+        'algorithm_parameters': parameters,
+        'generation_statistics': records,
+        'fitness_history': {
+            'best': [record['best_fitness'] for record in records],
+            'average': [record['average_fitness'] for record in records],
+            'diversity': [record['diversity'] for record in records]
+        }
+    }
+
+    directory = os.path.dirname(output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(stats_data, f, indent=2)
+    return stats_data
+
+
+def format_record(record):
+    return (f"Generation {record['generation']}: best {record['best_fitness']:.1f}, "
+            f"average {record['average_fitness']:.1f}, diversity {record['diversity']:.3f}, "
+            f"mutation {record['mutation_rate']:.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generation statistics log tools")
+    parser.add_argument('command', choices=['tail', 'compact'],
+                        help='tail: print records as they arrive, compact: write the summary JSON')
+    parser.add_argument('--log', default=GENERATION_STATS_LOG, help='Record log')
+    parser.add_argument('--output', default=EVOLUTION_STATS_FILE, help='Summary JSON (compact)')
+    args = parser.parse_args()
+
+    if args.command == 'compact':
+        stats = compact(args.log, args.output)
+        print(f"📊 Wrote {len(stats['generation_statistics'])} generations to {args.output}")
+        return
+
+    try:
+        for entry in follow_log(args.log):
+            if 'algorithm_parameters' in entry:
+                print(f"📊 New run: {entry['algorithm_parameters']}")
+            else:
+                print(f"📊 {format_record(entry)}")
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+import atexit
+import os
+import sys
+import threading
+import time
+from collections import deque
+from src.utils.constants import *
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+
+LEVEL_NAMES = {DEBUG: "DEBUG", INFO: "INFO", WARNING: "WARNING", ERROR: "ERROR"}
+LEVELS = {name: level for level, name in LEVEL_NAMES.items()}
+
+
+class Telemetry:
+    """
+    Level-gated, sampled and buffered event sink for the frame loop.
+
+    log() only appends a record (with unformatted message arguments) to a
+    bounded ring buffer; a background thread formats the records, appends
+    them to the log file and echoes the important ones to the console. When
+    the buffer is full the oldest records are dropped and counted, so the
+    simulation never waits on I/O.
+    """
+
+    def __init__(self, log_file=TRAINING_LOG_FILE, level=TELEMETRY_LEVEL,
+                 echo_level=TELEMETRY_ECHO_LEVEL, capacity=TELEMETRY_BUFFER_SIZE,
+                 flush_interval=TELEMETRY_FLUSH_INTERVAL, sample_rates=None):
+        """
+        Args:
+            log_file: File the background thread appends to (None for no file)
+            level: Minimum level that is recorded at all
+            echo_level: Minimum level that is also printed to the console
+            capacity: Ring buffer size in records
+            flush_interval: Seconds between background flushes
+            sample_rates: {channel: N} keeps one frame in N for that channel
+        """
+        self.log_file = log_file
+        self.level = LEVELS.get(level, level)
+        self.echo_level = LEVELS.get(echo_level, echo_level)
+        self.flush_interval = flush_interval
+        self.sample_rates = dict(TELEMETRY_SAMPLE_RATES if sample_rates is None else sample_rates)
+
+        self.buffer = deque(maxlen=capacity)
+        self.dropped = 0
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def enabled(self, channel, level=INFO, frame=None):
+        """
+        Cheap check for the hot loop: is this channel recorded at this frame?
+
+        Call it before building expensive messages.
+        """
+        if level < self.level:
+            return False
+        if frame is not None:
+            rate = self.sample_rates.get(channel, 1)
+            if rate > 1 and frame % rate != 0:
+                return False
+        return True
+
+    def log(self, channel, message, *args, level=INFO, frame=None):
+        """
+        Record an event; message is %-formatted with args on the flush thread
+
+        Args:
+            channel: Event category, used for sampling and in the log line
+            message: Message or %-format string
+            level: DEBUG, INFO, WARNING or ERROR
+            frame: Frame number, used for per-channel sampling
+        """
+        if not self.enabled(channel, level, frame):
+            return
+        with self.lock:
+            if len(self.buffer) == self.buffer.maxlen:
+                self.dropped += 1
+            self.buffer.append((time.time(), level, channel, frame, message, args))
+
+    def debug(self, channel, message, *args, frame=None):
+        self.log(channel, message, *args, level=DEBUG, frame=frame)
+
+    def info(self, channel, message, *args, frame=None):
+        self.log(channel, message, *args, level=INFO, frame=frame)
+
+    def warning(self, channel, message, *args, frame=None):
+        self.log(channel, message, *args, level=WARNING, frame=frame)
+
+    def start(self):
+        """Start the background flush thread"""
+        if self.thread is not None:
+            return
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._flush_loop, name="telemetry", daemon=True)
+        self.thread.start()
+        atexit.register(self.close)
+
+    def _flush_loop(self):
+        while not self.stop_event.wait(self.flush_interval):
+            self.flush()
+
+    def drain(self):
+        """Take every buffered record (and the dropped count) out of the buffer"""
+        with self.lock:
+            records = list(self.buffer)
+            self.buffer.clear()
+            dropped, self.dropped = self.dropped, 0
+        return records, dropped
+
+    @staticmethod
+    def format_record(record):
+        timestamp, level, channel, frame, message, args = record
+        if args:
+            try:
+                message = message % args
+            except (TypeError, ValueError):
+                message = f"{message} {args}"
+        frame_text = f" frame={frame}" if frame is not None else ""
+        clock = time.strftime("%H:%M:%S", time.localtime(timestamp))
+        return f"{clock} {LEVEL_NAMES.get(level, level)} [{channel}]{frame_text} {message}"
+
+    def flush(self):
+        """Write buffered records to the log file and echo the important ones"""
+        records, dropped = self.drain()
+        if not records and not dropped:
+            return
+
+        lines = [self.format_record(record) for record in records]
+        if dropped:
+            lines.append(f"{time.strftime('%H:%M:%S')} WARNING [telemetry] "
+                         f"dropped {dropped} records (buffer full)")
+
+        if self.log_file:
+            try:
+                os.makedirs(os.path.dirname(self.log_file) or ".", exist_ok=True)
+                with open(self.log_file, "a", encoding="utf-8") as f:
+                    f.write("\n".join(lines) + "\n")
+            except OSError as e:
+                print(f"⚠️ Could not write telemetry log: {e}", file=sys.stderr)
+
+        echo = [line for record, line in zip(records, lines) if record[1] >= self.echo_level]
+        if echo:
+            print("\n".join(echo))
+
+    def close(self):
+        """Stop the background thread and flush what is left"""
+        if self.thread is not None:
+            self.stop_event.set()
+            self.thread.join()
+            self.thread = None
+        self.flush()
+
+    def __str__(self):
+        return (f"Telemetry(level={LEVEL_NAMES.get(self.level, self.level)}, "
+                f"buffered={len(self.buffer)}, file={self.log_file})")
@@ -0,0 +1,113 @@
+import csv
+import os
+import numpy as np
+import pytest
+from src.sim.engine import HeadlessEngine
+from src.utils.checkpoint import Checkpointer, list_checkpoints, load_checkpoint
+from src.utils.constants import *
+from src.utils.rng import restore_run, seed_run
+from src.utils.stats_log import read_log
+
+POPULATION = 40
+MAX_FRAMES = 600
+
+
+def without_times(records):
+    """Statistics records minus the wall-clock evolution_time"""
+    return [{key: value for key, value in record.items() if key != 'evolution_time'}
+            for record in records]
+
+
+def read_csv(filename=GENERATION_STATS_FILE):
+    with open(filename, newline='') as f:
+        return without_times(csv.DictReader(f))
+
+
+def train(generations, checkpoint_dir, seed=42):
+    seed_run(seed)
+    checkpointer = Checkpointer(checkpoint_dir, interval=2)
+    try:
+        engine = HeadlessEngine(population_size=POPULATION, max_frames=MAX_FRAMES,
+                                checkpointer=checkpointer)
+        engine.run(generations)
+    finally:
+        checkpointer.close()
+    return engine
+
+
+def resume(checkpoint, generations, checkpoint_dir):
+    state = load_checkpoint(checkpoint)
+    restore_run(state['rng'])
+    checkpointer = Checkpointer(checkpoint_dir, interval=2)
+    try:
+        engine = HeadlessEngine(population_size=state['engine']['population_size'],
+                                max_frames=state['engine']['max_frames'],
+                                checkpointer=checkpointer)
+        engine.restore_checkpoint(state)
+        engine.run(generations)
+    finally:
+        checkpointer.close()
+    return engine
+
+
+@pytest.fixture(autouse=True)
+def run_in_tmp(tmp_path, monkeypatch):
+    # Runs write models, statistics and checkpoints under ./data
+    monkeypatch.chdir(tmp_path)
+
+
+def test_checkpoints_rotate(tmp_path):
+    checkpoint_dir = str(tmp_path / "checkpoints")
+    checkpointer = Checkpointer(checkpoint_dir, interval=1, keep=2)
+    for generation in range(1, 6):
+        checkpointer.submit(generation, {'genomes': np.full((2, 3), generation),
+                                         'history': [np.float64(generation), None]})
+    checkpointer.close()
+
+    assert [os.path.basename(name) for name in list_checkpoints(checkpoint_dir)] == [
+        "checkpoint_gen000004.npz", "checkpoint_gen000005.npz"]
+    assert not [name for name in os.listdir(checkpoint_dir) if name.endswith(".tmp")]
+
+    state = load_checkpoint(checkpoint_dir)
+    assert np.array_equal(state['genomes'], np.full((2, 3), 5))
+    assert state['history'] == [5.0, None]
+
+
+def test_resume_matches_uninterrupted_run(tmp_path):
+    checkpoint_dir = str(tmp_path / "checkpoints")
+    full = train(8, checkpoint_dir)
+    full_genomes = full.genetic_algorithm.population.genomes.copy()
+    full_log = without_times(read_log(GENERATION_STATS_LOG)[0][1:])
+    full_csv = read_csv()
+    assert len(full_log) == len(full_csv) == 8
+
+    resumed = resume(os.path.join(checkpoint_dir, "checkpoint_gen000004.npz"), 4,
+                     str(tmp_path / "resumed"))
+
+    genetic_algorithm = resumed.genetic_algorithm
+    assert resumed.generation == full.generation == 9
+    assert np.array_equal(genetic_algorithm.population.genomes, full_genomes)
+    assert genetic_algorithm.mutation_rate == full.genetic_algorithm.mutation_rate
+    assert (without_times(genetic_algorithm.generation_stats)
+            == without_times(full.genetic_algorithm.generation_stats))
+
+    # The resumed run rewrote generations 5-8 of the same log and CSV
+    assert without_times(read_log(GENERATION_STATS_LOG)[0][1:]) == full_log
+    assert read_csv() == full_csv
+
+
+def test_resume_cuts_stats_log_back_to_checkpoint(tmp_path):
+    checkpoint_dir = str(tmp_path / "checkpoints")
+    train(6, checkpoint_dir)
+    assert len(read_log(GENERATION_STATS_LOG)[0]) == 1 + 6
+
+    state = load_checkpoint(os.path.join(checkpoint_dir, "checkpoint_gen000002.npz"))
+    offsets = state['genetic_algorithm']['stats_log']
+    resumed = resume(state['path'], 0, str(tmp_path / "resumed"))
+
+    assert os.path.getsize(GENERATION_STATS_LOG) == offsets['log']
+    assert os.path.getsize(GENERATION_STATS_FILE) == offsets['csv']
+    entries, _ = read_log(GENERATION_STATS_LOG)
+    assert 'algorithm_parameters' in entries[0]
+    assert [entry['generation'] for entry in entries[1:]] == [1, 2]
+    assert len(resumed.genetic_algorithm.generation_stats) == 2
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+from src.sim.collision import analytic_collisions, pipe_pair_arrays
+from src.sim.course import PipeCourse
+from src.utils.constants import *
+
+pygame = pytest.importorskip("pygame")
+
+
+def pipe_pair(x, gap_center):
+    from src.game.pipe import Pipe
+    sprite = pygame.Surface((PIPE_SPRITE_WIDTH, PIPE_SPRITE_HEIGHT))
+    return [Pipe(x, sprite, PIPE_GAP, is_top=True, gap_center=gap_center),
+            Pipe(x, sprite, PIPE_GAP, is_top=False, gap_center=gap_center)]
+
+
+@pytest.mark.parametrize("gap_center", [PIPE_GAP_MARGIN, 300, SCREEN_HEIGHT - PIPE_GAP_MARGIN])
+def test_matches_rect_overlap(gap_center):
+    pipes = pipe_pair(100, gap_center)
+    rng = np.random.default_rng(gap_center)
+    x = rng.integers(40, 190, 2000)
+    # Birds never get below the ground, where a high bottom pipe ends
+    y = rng.integers(-40, GROUND_Y - BIRD_HEIGHT, 2000)
+
+    hit = analytic_collisions(x, x + BIRD_WIDTH, y, y + BIRD_HEIGHT, *pipe_pair_arrays(pipes))
+    expected = [any(pygame.Rect(int(left), int(top), BIRD_WIDTH, BIRD_HEIGHT).colliderect(pipe.rect)
+                    for pipe in pipes)
+                for left, top in zip(x, y)]
+    assert hit.tolist() == expected
+
+
+def test_open_sky_above_low_top_pipe():
+    # The lowest gap leaves 55 px of sky above the top pipe
+    gap_center = SCREEN_HEIGHT - PIPE_GAP_MARGIN
+    top_pipe_top = gap_center - PIPE_GAP // 2 - PIPE_SPRITE_HEIGHT
+    assert top_pipe_top > BIRD_HEIGHT
+
+    pipes = pipe_pair(100, gap_center)
+    hit = analytic_collisions([110, 110], [110 + BIRD_WIDTH] * 2,
+                              [top_pipe_top - BIRD_HEIGHT - 1, top_pipe_top - 5],
+                              [top_pipe_top - 1, top_pipe_top - 5 + BIRD_HEIGHT],
+                              *pipe_pair_arrays(pipes))
+    assert hit.tolist() == [False, True]
+
+
+def test_course_pair_arrays_match_pipes():
+    course = PipeCourse(seed=3)
+    course.spawn_pipes()
+    left, right, gap_top, gap_bottom, top_pipe_top = course.pair_arrays()
+
+    pipes = pipe_pair(int(left[0]), int(course.gap_center[course.head]))
+    expected = pipe_pair_arrays(pipes)
+    for actual, wanted in zip((left, right, gap_top, gap_bottom, top_pipe_top), expected):
+        assert np.array_equal(actual, wanted)
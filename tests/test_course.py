@@ -0,0 +1,29 @@
+import numpy as np
+from src.sim.course import PipeCourse
+from src.utils.constants import *
+
+
+def test_seed_replays_course():
+    first, second = PipeCourse(seed=11), PipeCourse(seed=11)
+    for _ in range(PIPE_SPAWN_DELAY * 5):
+        first.update()
+        second.update()
+    assert np.array_equal(first.schedule, second.schedule)
+    assert np.array_equal(first.bottom_arrays()[2], second.bottom_arrays()[2])
+    assert not np.array_equal(first.schedule, PipeCourse(seed=12).schedule)
+
+
+def test_right_edge_follows_ring_buffer():
+    course = PipeCourse(seed=3, capacity=4)
+    # Long enough for the ring buffer to wrap several times
+    for _ in range(PIPE_SPAWN_DELAY * 20):
+        course.update()
+        _, right, _ = course.bottom_arrays()
+        seqs = course.sequence_numbers()
+        if len(seqs):
+            assert course.oldest_seq() == seqs[0]
+        for seq, edge in zip(seqs, right):
+            assert course.right_edge(seq) == edge
+        assert course.right_edge(course.oldest_seq() - 1) is None
+        assert course.right_edge(course.next_seq) is None
+    assert course.next_seq > course.capacity * 2
@@ -0,0 +1,107 @@
+import numpy as np
+import pytest
+from src.ai.crossover import Crossover
+from src.ai.neural_network import NeuralNetwork
+from src.utils.rng import seed_run
+
+PAIRS = 40
+GENES = 57
+
+
+def parents(count=PAIRS, genes=GENES, seed=0):
+    rng = np.random.default_rng(seed)
+    return (rng.normal(0, 1, (count, genes)).astype(np.float32),
+            rng.normal(0, 1, (count, genes)).astype(np.float32))
+
+
+def test_single_point_matches_per_pair_loop():
+    parents_a, parents_b = parents()
+    children_a, children_b = Crossover.batch_single_point(parents_a, parents_b,
+                                                          np.random.default_rng(1))
+
+    cuts = np.random.default_rng(1).integers(1, GENES, size=PAIRS)
+    for i, cut in enumerate(cuts):
+        a, b = parents_a[i].tolist(), parents_b[i].tolist()
+        assert children_a[i].tolist() == a[:cut] + b[cut:]
+        assert children_b[i].tolist() == b[:cut] + a[cut:]
+
+
+def test_two_point_matches_per_pair_loop():
+    parents_a, parents_b = parents()
+    children_a, children_b = Crossover.batch_two_point(parents_a, parents_b,
+                                                       np.random.default_rng(2))
+
+    rng = np.random.default_rng(2)
+    first = rng.integers(1, GENES - 1, size=PAIRS)
+    second = rng.integers(first + 1, GENES)
+    for i in range(PAIRS):
+        f, s = first[i], second[i]
+        assert 1 <= f < s < GENES
+        a, b = parents_a[i].tolist(), parents_b[i].tolist()
+        assert children_a[i].tolist() == a[:f] + b[f:s] + a[s:]
+        assert children_b[i].tolist() == b[:f] + a[f:s] + b[s:]
+
+
+def test_uniform_matches_per_gene_choice():
+    parents_a, parents_b = parents()
+    children_a, children_b = Crossover.batch_uniform(parents_a, parents_b, 0.3,
+                                                     np.random.default_rng(3))
+
+    keep = np.random.default_rng(3).random((PAIRS, GENES)) < 0.3
+    for i in range(PAIRS):
+        for j in range(GENES):
+            first, second = ((parents_a[i, j], parents_b[i, j]) if keep[i, j]
+                             else (parents_b[i, j], parents_a[i, j]))
+            assert children_a[i, j] == first and children_b[i, j] == second
+    assert abs(keep.mean() - 0.3) < 0.05
+
+
+def test_arithmetic_blends_each_pair():
+    parents_a, parents_b = parents()
+    alpha = np.linspace(0, 1, PAIRS).astype(np.float32)
+    children_a, children_b = Crossover.batch_arithmetic(parents_a, parents_b, alpha)
+    for i in range(PAIRS):
+        assert np.allclose(children_a[i], alpha[i] * parents_a[i] + (1 - alpha[i]) * parents_b[i])
+        assert np.allclose(children_b[i], alpha[i] * parents_b[i] + (1 - alpha[i]) * parents_a[i])
+    assert children_a.dtype == np.float32
+
+
+@pytest.mark.parametrize("method", ["single_point", "two_point", "uniform", "arithmetic"])
+def test_genes_are_conserved(method):
+    parents_a, parents_b = parents()
+    children_a, children_b = Crossover.batch_crossover(parents_a, parents_b, method,
+                                                       rng=np.random.default_rng(4))
+    assert children_a.shape == parents_a.shape
+    assert np.allclose(children_a + children_b, parents_a + parents_b, atol=1e-5)
+
+
+@pytest.mark.parametrize("genes", [1, 2])
+def test_short_genomes(genes):
+    parents_a, parents_b = parents(genes=genes)
+    for operator in (Crossover.batch_single_point, Crossover.batch_two_point):
+        children_a, children_b = operator(parents_a, parents_b, np.random.default_rng(5))
+        if genes == 1:
+            assert np.array_equal(children_a, parents_a)
+            assert children_a is not parents_a
+        else:
+            assert np.array_equal(children_a[:, 0], parents_a[:, 0])
+            assert np.array_equal(children_a[:, 1], parents_b[:, 1])
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        Crossover.batch_crossover(*parents(), method="three_point")
+
+
+def test_network_operators_wrap_a_batch_of_one():
+    seed_run(6)
+    parent1, parent2 = NeuralNetwork(seed=1), NeuralNetwork(seed=2)
+    before = parent1.params.copy(), parent2.params.copy()
+    for operator in (Crossover.single_point_crossover, Crossover.two_point_crossover,
+                     Crossover.uniform_crossover, Crossover.arithmetic_crossover):
+        child1, child2 = operator(parent1, parent2)
+        assert child1.layer_sizes == parent1.layer_sizes
+        assert not np.shares_memory(child1.params, parent1.params)
+        assert np.allclose(child1.params + child2.params, parent1.params + parent2.params,
+                           atol=1e-5)
+    assert np.array_equal(parent1.params, before[0]) and np.array_equal(parent2.params, before[1])
@@ -0,0 +1,117 @@
+import multiprocessing
+import os
+import signal
+import socket
+import time
+import numpy as np
+import pytest
+from src.ai.neural_network import NeuralNetwork
+from src.sim.distributed import (HELLO, TASK, RESULT, HEARTBEAT, SHUTDOWN, HEADER,
+                                 DistributedEvaluator, decode_result, decode_task,
+                                 encode_result, encode_task, recv_frame, run_worker, send_frame)
+from src.sim.evaluator import SerialEvaluator
+from src.utils.constants import *
+
+LAYER_SIZES = [NN_INPUT_NODES] + NN_HIDDEN_NODES + [NN_OUTPUT_NODES]
+MAX_FRAMES = 300
+
+
+def random_genomes(count, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.normal(0, 1, (count, NeuralNetwork.count_params(LAYER_SIZES))).astype(np.float32)
+
+
+def round_trip(kind, payload=b""):
+    left, right = socket.socketpair()
+    try:
+        send_frame(left, kind, payload)
+        return recv_frame(right)
+    finally:
+        left.close()
+        right.close()
+
+
+@pytest.mark.parametrize("kind, payload", [
+    (HELLO, "worker-1/42".encode("utf-8")),
+    (HEARTBEAT, b""),
+    (SHUTDOWN, b"")
+])
+def test_control_frames_round_trip(kind, payload):
+    assert round_trip(kind, payload) == (kind, payload)
+
+
+def test_task_frame_round_trip():
+    genomes = random_genomes(5)
+    payload = encode_task(7, 2 ** 40 + 3, 16, genomes, LAYER_SIZES, MAX_FRAMES, "hitbox")
+    kind, received = round_trip(TASK, payload)
+    task = decode_task(received)
+
+    assert kind == TASK
+    assert task['task_id'] == 7
+    assert task['course_seed'] == 2 ** 40 + 3
+    assert task['start'] == 16
+    assert task['layer_sizes'] == LAYER_SIZES
+    assert task['max_frames'] == MAX_FRAMES
+    assert task['collision_mode'] == "hitbox"
+    assert np.array_equal(task['genomes'], genomes)
+
+
+def test_result_frame_round_trip():
+    results = {
+        'fitness': np.array([1.5, -2.25, 1e6]),
+        'score': np.array([0, 3, 120]),
+        'frames': np.array([10, 200, 1800])
+    }
+    kind, received = round_trip(RESULT, encode_result(99, results))
+    task_id, decoded = decode_result(received)
+
+    assert kind == RESULT
+    assert task_id == 99
+    for field, values in results.items():
+        assert np.array_equal(decoded[field], values)
+
+
+def test_bad_magic_is_rejected():
+    left, right = socket.socketpair()
+    try:
+        left.sendall(HEADER.pack(b"XXXX", HEARTBEAT, 0))
+        with pytest.raises(ConnectionError):
+            recv_frame(right)
+    finally:
+        left.close()
+        right.close()
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGSTOP"), reason="needs SIGSTOP")
+def test_stalled_worker_tasks_are_requeued():
+    genomes = random_genomes(64, seed=1)
+    expected = SerialEvaluator(MAX_FRAMES).evaluate(genomes, LAYER_SIZES, 123)
+
+    evaluator = DistributedEvaluator("127.0.0.1", 0, max_frames=MAX_FRAMES, task_size=8,
+                                     tasks_per_worker=2, heartbeat_timeout=1.0,
+                                     worker_timeout=10.0)
+    workers = [multiprocessing.Process(target=run_worker, args=("127.0.0.1", evaluator.port),
+                                       kwargs={'heartbeat_interval': 0.2}, daemon=True)
+               for _ in range(2)]
+    try:
+        for worker in workers:
+            worker.start()
+        deadline = time.time() + 10
+        while len(evaluator.live_workers()) < 2:
+            assert time.time() < deadline, "workers did not connect"
+            time.sleep(0.05)
+
+        # The stopped worker still looks alive, gets tasks, and stops heartbeating
+        os.kill(workers[0].pid, signal.SIGSTOP)
+        results = evaluator.evaluate(genomes, LAYER_SIZES, 123)
+    finally:
+        os.kill(workers[0].pid, signal.SIGCONT)
+        evaluator.close()
+        for worker in workers:
+            worker.join(timeout=5)
+            if worker.is_alive():
+                worker.terminate()
+
+    assert evaluator.requeued > 0
+    for field in expected:
+        assert np.array_equal(results[field], expected[field])
@@ -0,0 +1,104 @@
+import itertools
+import numpy as np
+import pytest
+from src.ai.diversity import Diversity
+
+
+def genomes(count=30, genes=12, seed=0):
+    return np.random.default_rng(seed).normal(0, 1, (count, genes)).astype(np.float32)
+
+
+def pairwise(population, norm):
+    """Brute-force distances over all N*(N-1)/2 pairs"""
+    population = np.asarray(population, dtype=np.float64)
+    return np.array([norm(a - b) for a, b in itertools.combinations(population, 2)])
+
+
+def l1(v):
+    return np.abs(v).sum()
+
+
+def test_mean_pairwise_l1_matches_brute_force():
+    population = genomes()
+    expected = pairwise(population, l1).mean()
+    assert Diversity.mean_pairwise_l1(population) == pytest.approx(expected, rel=1e-9)
+
+
+def test_mean_pairwise_l1_with_duplicate_rows():
+    population = genomes(10)
+    population[5:] = population[0]
+    expected = pairwise(population, l1).mean()
+    assert Diversity.mean_pairwise_l1(population) == pytest.approx(expected, rel=1e-9)
+
+
+def test_mean_squared_distance_matches_brute_force():
+    population = genomes()
+    expected = (pairwise(population, np.linalg.norm) ** 2).mean()
+    variance = Diversity.gene_variance(population)
+    assert Diversity.mean_squared_distance(variance, len(population)) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("block_size", [1, 7, 1024])
+def test_exact_distance_stats_match_brute_force(block_size):
+    population = genomes()
+    distances = pairwise(population, np.linalg.norm)
+    stats = Diversity.exact_distance_stats(population, block_size)
+
+    assert stats['mean'] == pytest.approx(distances.mean())
+    assert stats['std'] == pytest.approx(distances.std(), rel=1e-6)
+    assert stats['min'] == pytest.approx(distances.min(), rel=1e-6)
+    assert stats['max'] == pytest.approx(distances.max())
+
+
+def test_sampled_stats_never_pair_a_genome_with_itself():
+    # Two distinct points: every distinct pair is at distance 5
+    population = np.array([[0.0, 0.0], [3.0, 4.0]])
+    stats = Diversity.sampled_distance_stats(population, 500, np.random.default_rng(0))
+    assert stats['min'] == stats['max'] == pytest.approx(5.0)
+    assert stats['error'] == 0.0
+
+
+def test_sampled_report_brackets_exact_mean():
+    population = genomes(400, 8)
+    exact = pairwise(population, np.linalg.norm).mean()
+    report = Diversity.population_diversity(population, exact_limit=100,
+                                            sample_pairs=20000, rng=np.random.default_rng(3))
+
+    assert report['method'] == 'sampled'
+    assert 0 < report['distance_error'] < 0.05 * exact
+    # 95% interval; allow a little slack so the test is not a coin flip
+    assert abs(report['distance_mean'] - exact) < 2 * report['distance_error']
+    # L1 and variance statistics stay exact above the limit
+    assert report['mean_l1'] == pytest.approx(pairwise(population, l1).mean())
+
+
+def test_projected_report_within_bound():
+    population = genomes(40, 300)
+    exact = pairwise(population, np.linalg.norm).mean()
+    report = Diversity.population_diversity(population, projection_dim=64,
+                                            rng=np.random.default_rng(4))
+
+    assert report['method'] == 'projected'
+    assert abs(report['distance_mean'] - exact) <= report['distance_error']
+
+
+def test_exact_report_fields():
+    population = genomes()
+    report = Diversity.population_diversity(population)
+    distances = pairwise(population, np.linalg.norm)
+
+    assert report['method'] == 'exact'
+    assert report['size'] == len(population)
+    assert report['distance_error'] == 0.0
+    assert report['distance_mean'] == pytest.approx(distances.mean())
+    assert report['mean_l1'] == pytest.approx(pairwise(population, l1).mean())
+    assert report['mean_gene_variance'] == pytest.approx(
+        np.var(population.astype(np.float64), axis=0).mean())
+
+
+@pytest.mark.parametrize("count", [0, 1])
+def test_report_for_tiny_population(count):
+    report = Diversity.population_diversity(genomes(count))
+    assert report['size'] == count
+    assert report['mean_l1'] == report['distance_mean'] == 0.0
+    assert report['gene_variance'].shape == (12,)
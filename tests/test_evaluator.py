@@ -0,0 +1,116 @@
+import numpy as np
+import pytest
+from src.ai.neural_network import NeuralNetwork
+from src.sim.evaluator import ProcessPoolEvaluator, SerialEvaluator, evaluate_shard
+from src.sim.shared import SharedPopulationBuffer
+from src.utils.constants import *
+
+LAYER_SIZES = [NN_INPUT_NODES] + NN_HIDDEN_NODES + [NN_OUTPUT_NODES]
+MAX_FRAMES = 400
+COURSE_SEED = 1234
+
+
+def random_genomes(count, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.normal(0, 1, (count, NeuralNetwork.count_params(LAYER_SIZES))).astype(np.float32)
+
+
+def assert_same_results(actual, expected):
+    assert actual.keys() == expected.keys()
+    for field in expected:
+        assert np.array_equal(actual[field], expected[field]), field
+
+
+@pytest.fixture(scope="module")
+def genomes():
+    return random_genomes(37)
+
+
+@pytest.fixture(scope="module")
+def serial_results(genomes):
+    return SerialEvaluator(MAX_FRAMES).evaluate(genomes, LAYER_SIZES, COURSE_SEED)
+
+
+@pytest.mark.parametrize("count, workers, chunks", [
+    (1, 4, 4), (7, 2, 4), (37, 3, 4), (100, 8, 1), (5, 16, 4)
+])
+def test_shards_cover_every_row_once(count, workers, chunks):
+    shards = ProcessPoolEvaluator(workers, chunks_per_worker=chunks).shards(count)
+
+    assert shards[0][0] == 0 and shards[-1][1] == count
+    assert all(stop == start for (_, stop), (start, _) in zip(shards, shards[1:]))
+    assert all(stop > start for start, stop in shards)
+    assert len(shards) == min(count, workers * chunks)
+
+
+@pytest.mark.parametrize("cuts", [[], [1], [10, 11, 30], list(range(1, 37))])
+def test_results_do_not_depend_on_sharding(genomes, serial_results, cuts):
+    bounds = [0] + cuts + [len(genomes)]
+    parts = [evaluate_shard(genomes[start:stop], np.arange(start, stop), LAYER_SIZES,
+                            COURSE_SEED, MAX_FRAMES)
+             for start, stop in zip(bounds, bounds[1:])]
+    merged = {field: np.concatenate([part[field] for part in parts]) for field in parts[0]}
+    assert_same_results(merged, serial_results)
+
+
+def test_population_index_sets_start_position(genomes):
+    # The same genome started at another index flies a different episode
+    moved = evaluate_shard(genomes[:5], np.arange(5) + 1, LAYER_SIZES, COURSE_SEED, MAX_FRAMES)
+    same = evaluate_shard(genomes[:5], np.arange(5), LAYER_SIZES, COURSE_SEED, MAX_FRAMES)
+    assert not all(np.array_equal(moved[field], same[field]) for field in same)
+
+
+def test_pool_matches_serial(genomes, serial_results):
+    evaluator = ProcessPoolEvaluator(2, MAX_FRAMES)
+    try:
+        assert_same_results(evaluator.evaluate(genomes, LAYER_SIZES, COURSE_SEED),
+                            serial_results)
+
+        # A smaller population reuses the pool and its buffer
+        buffer = evaluator.buffer
+        assert_same_results(evaluator.evaluate(genomes[:10], LAYER_SIZES, COURSE_SEED),
+                            {field: values[:10] for field, values in serial_results.items()})
+        assert evaluator.buffer is buffer
+    finally:
+        evaluator.close()
+    assert evaluator.executor is None and evaluator.buffer is None
+
+
+def test_submitted_rows_use_their_population_index(genomes, serial_results):
+    evaluator = ProcessPoolEvaluator(2, MAX_FRAMES)
+    try:
+        evaluator.start(8, LAYER_SIZES)
+        # Population indices 20..23 flown from shared rows 4..7
+        evaluator.submit_rows(4, genomes[20:24], 20, COURSE_SEED).result()
+        assert_same_results(evaluator.read_rows(4, 4),
+                            {field: values[20:24] for field, values in serial_results.items()})
+    finally:
+        evaluator.close()
+
+
+@pytest.mark.parametrize("evaluator_class", [SerialEvaluator, ProcessPoolEvaluator])
+def test_empty_population(evaluator_class):
+    results = evaluator_class(max_frames=MAX_FRAMES).evaluate(
+        random_genomes(0), LAYER_SIZES, COURSE_SEED)
+    assert all(len(values) == 0 for values in results.values())
+
+
+def test_shared_buffer_round_trip():
+    buffer = SharedPopulationBuffer(6, 3)
+    try:
+        attached = SharedPopulationBuffer.attach(buffer.descriptor())
+        genomes = np.arange(9, dtype=np.float32).reshape(3, 3)
+        buffer.load(genomes, start=2)
+        assert np.array_equal(attached.genomes[2:5], genomes)
+
+        attached.results['score'][2:5] = [7, 8, 9]
+        results = buffer.read_results(3, start=2)
+        assert results['score'].tolist() == [7, 8, 9]
+
+        # Reads are copies, not views of the shared block
+        results['score'][:] = 0
+        assert buffer.results['score'][2:5].tolist() == [7, 8, 9]
+        assert buffer.fits(6, 3) and not buffer.fits(7, 3) and not buffer.fits(6, 4)
+        attached.close()
+    finally:
+        buffer.close()
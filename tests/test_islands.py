@@ -0,0 +1,111 @@
+import numpy as np
+import pytest
+from src.ai.genetic_algorithm import GeneticAlgorithm
+from src.sim.islands import IslandModel, configure_island, migration_targets
+from src.utils.rng import RNGService
+
+
+@pytest.fixture(autouse=True)
+def run_in_tmp(tmp_path, monkeypatch):
+    # Island runs write statistics under ./data
+    monkeypatch.chdir(tmp_path)
+
+
+def assert_single_cycle(targets):
+    """Every island sends to one other island and receives exactly one packet"""
+    count = len(targets)
+    assert sorted(targets.tolist()) == list(range(count))
+    island, visited = 0, set()
+    while island not in visited:
+        visited.add(island)
+        island = targets[island]
+    assert len(visited) == count
+
+
+@pytest.mark.parametrize("count", [1, 2, 5])
+def test_ring_sends_to_next_island(count):
+    targets = migration_targets("ring", count, 0, RNGService(1))
+    assert targets.tolist() == [(i + 1) % count for i in range(count)]
+
+
+def test_random_topology_is_a_seeded_ring():
+    service = RNGService(1)
+    rings = [migration_targets("random", 6, generation, service) for generation in range(10)]
+    for targets in rings:
+        assert_single_cycle(targets)
+
+    # Every island derives the same ring; it changes between migrations
+    assert np.array_equal(rings[3], migration_targets("random", 6, 3, RNGService(1)))
+    assert len({tuple(targets) for targets in rings}) > 1
+
+
+def test_unknown_topology():
+    with pytest.raises(ValueError):
+        migration_targets("star", 3, 0, RNGService(1))
+    with pytest.raises(ValueError):
+        IslandModel(topology="star")
+
+
+def evaluated_algorithm(fitness, seed=0):
+    genetic_algorithm = GeneticAlgorithm(population_size=len(fitness), rng_service=RNGService(seed))
+    genetic_algorithm.population.fitness_scores = list(fitness)
+    return genetic_algorithm
+
+
+def test_emigrants_are_copies_of_the_fittest():
+    genetic_algorithm = evaluated_algorithm([3.0, 9.0, 1.0, 9.0, 5.0])
+    genomes, fitness = genetic_algorithm.emigrants(3)
+
+    # Ties keep population order
+    assert fitness.tolist() == [9.0, 9.0, 5.0]
+    assert np.array_equal(genomes, genetic_algorithm.population.genomes[[1, 3, 4]])
+    genomes[:] = 0
+    assert genetic_algorithm.population.genomes[1].any()
+
+
+def test_immigrants_replace_the_worst():
+    genetic_algorithm = evaluated_algorithm([3.0, 9.0, 1.0, 9.0, 5.0])
+    sender = evaluated_algorithm([7.0, 8.0, 0.0, 0.0, 0.0], seed=1)
+    genomes, fitness = sender.emigrants(2)
+
+    rows = genetic_algorithm.immigrate(genomes, fitness)
+    assert rows.tolist() == [2, 0]
+    assert np.array_equal(genetic_algorithm.population.genomes[[2, 0]], genomes)
+    assert genetic_algorithm.population.fitness_scores == [7.0, 9.0, 8.0, 9.0, 5.0]
+
+
+def test_more_immigrants_than_individuals():
+    genetic_algorithm = evaluated_algorithm([1.0, 2.0])
+    sender = evaluated_algorithm([5.0, 4.0, 3.0], seed=1)
+    rows = genetic_algorithm.immigrate(*sender.emigrants(3))
+    assert sorted(rows.tolist()) == [0, 1]
+    assert sorted(genetic_algorithm.population.fitness_scores) == [4.0, 5.0]
+
+
+def test_configure_island_rejects_unknown_settings():
+    genetic_algorithm = evaluated_algorithm([1.0, 2.0])
+    configure_island(genetic_algorithm, {'mutation_rate': 0.25})
+    assert genetic_algorithm.mutation_rate == 0.25
+    with pytest.raises(ValueError):
+        configure_island(genetic_algorithm, {'not_a_setting': 1})
+
+
+def island_run(seed):
+    model = IslandModel(island_count=2, population_size=12, migration_interval=1, migrants=2,
+                        topology="random", max_frames=200, seed=seed)
+    history = model.run(3)
+    return model, history
+
+
+def test_seeded_island_run_repeats():
+    model_a, history_a = island_run(11)
+    model_b, history_b = island_run(11)
+
+    assert [len(island) for island in history_a] == [3, 3]
+    for island_a, island_b in zip(model_a.islands, model_b.islands):
+        assert island_a['best_fitness'] == island_b['best_fitness']
+        assert np.array_equal(island_a['best_genome'], island_b['best_genome'])
+
+    index, genome, fitness = model_a.best()
+    assert fitness == max(island['best_fitness'] for island in model_a.islands)
+    assert np.array_equal(genome, model_a.islands[index]['best_genome'])
@@ -0,0 +1,125 @@
+import os
+import struct
+import numpy as np
+import pytest
+from src.ai.model_io import (ModelFormatError, export_json, import_json,
+                             load_models, load_network, save_models, save_network)
+from src.ai.neural_network import NeuralNetwork, PARAM_DTYPE
+from src.utils.constants import *
+
+LAYER_SIZES = [NN_INPUT_NODES] + NN_HIDDEN_NODES + [NN_OUTPUT_NODES]
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CHECKED_IN_MODEL = os.path.join(REPO_ROOT, BEST_BIRD_JSON_FILE)
+
+
+def random_genomes(count, seed=0):
+    rng = np.random.default_rng(seed)
+    num_params = NeuralNetwork.count_params(LAYER_SIZES)
+    return rng.normal(0, 1, (count, num_params)).astype(PARAM_DTYPE)
+
+
+@pytest.fixture
+def model_file(tmp_path):
+    filename = str(tmp_path / ("models" + MODEL_EXTENSION))
+    save_models(filename, random_genomes(5), LAYER_SIZES, fitness=[5.0, 4.5, 3.0, 1.25, -1.0])
+    return filename
+
+
+def patch(filename, offset, data):
+    with open(filename, 'r+b') as f:
+        f.seek(offset)
+        f.write(data)
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_stack_round_trip(model_file, mmap):
+    models = load_models(model_file, mmap=mmap)
+
+    assert models['version'] == MODEL_FORMAT_VERSION
+    assert models['layer_sizes'] == LAYER_SIZES
+    assert np.array_equal(models['fitness'], [5.0, 4.5, 3.0, 1.25, -1.0])
+    assert np.array_equal(models['genomes'], random_genomes(5))
+
+
+def test_single_model_round_trip(tmp_path):
+    filename = str(tmp_path / ("best" + MODEL_EXTENSION))
+    network = NeuralNetwork(NN_INPUT_NODES, NN_HIDDEN_NODES, NN_OUTPUT_NODES,
+                            rng=np.random.default_rng(3))
+    save_network(network, filename)
+
+    loaded = load_network(filename)
+    assert loaded.layer_sizes == network.layer_sizes
+    assert np.array_equal(loaded.get_weights_as_array(), network.get_weights_as_array())
+    assert np.isnan(load_models(filename)['fitness'][0])
+
+    # The extension picks the format
+    assert np.array_equal(NeuralNetwork.from_file(filename).get_weights_as_array(),
+                          network.get_weights_as_array())
+
+
+def test_wrong_parameter_count_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        save_models(str(tmp_path / "bad.model"), random_genomes(2)[:, :-1], LAYER_SIZES)
+
+
+def test_bad_magic(model_file):
+    patch(model_file, 0, b"NOPE")
+    with pytest.raises(ModelFormatError, match="magic"):
+        load_models(model_file)
+
+
+def test_newer_version(model_file):
+    patch(model_file, 4, struct.pack("<H", MODEL_FORMAT_VERSION + 1))
+    with pytest.raises(ModelFormatError, match="newer"):
+        load_models(model_file)
+
+
+def test_truncated_file(model_file):
+    os.truncate(model_file, os.path.getsize(model_file) - 7)
+    with pytest.raises(ModelFormatError, match="truncated"):
+        load_models(model_file)
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+@pytest.mark.parametrize("content", [b"", b"FBNN"])
+def test_too_short_for_header(tmp_path, content, mmap):
+    filename = str(tmp_path / "short.model")
+    with open(filename, 'wb') as f:
+        f.write(content)
+    with pytest.raises(ModelFormatError, match="truncated"):
+        load_models(filename, mmap=mmap)
+
+
+def test_flipped_byte_fails_checksum(model_file):
+    offset = os.path.getsize(model_file) - 3
+    with open(model_file, 'rb') as f:
+        f.seek(offset)
+        byte = f.read(1)[0]
+    patch(model_file, offset, bytes([byte ^ 0x01]))
+
+    with pytest.raises(ModelFormatError, match="checksum"):
+        load_models(model_file)
+    # verify=False skips the check (and reads the damaged value)
+    assert load_models(model_file, verify=False)['genomes'].shape == (5, random_genomes(1).shape[1])
+
+
+def test_checked_in_json_model_round_trip(tmp_path):
+    binary_file = str(tmp_path / ("best_bird" + MODEL_EXTENSION))
+    json_file = str(tmp_path / "best_bird.json")
+
+    original = NeuralNetwork.from_file(CHECKED_IN_MODEL)
+    imported = import_json(CHECKED_IN_MODEL, binary_file)
+    exported = export_json(binary_file, json_file)
+
+    # Networks hold PARAM_DTYPE parameters: every conversion keeps them bit for bit
+    params = original.get_weights_as_array()
+    assert np.array_equal(imported.get_weights_as_array(), params)
+    assert np.array_equal(load_models(binary_file)['genomes'][0], params)
+    assert np.array_equal(exported.get_weights_as_array(), params)
+    assert np.array_equal(NeuralNetwork.from_file(json_file).get_weights_as_array(), params)
+
+    # and a second import of the exported JSON writes the same file
+    second_file = str(tmp_path / ("again" + MODEL_EXTENSION))
+    import_json(json_file, second_file)
+    with open(binary_file, 'rb') as a, open(second_file, 'rb') as b:
+        assert a.read() == b.read()
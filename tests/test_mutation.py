@@ -0,0 +1,100 @@
+import numpy as np
+import pytest
+from src.ai.mutation import Mutation
+from src.ai.neural_network import NeuralNetwork, PARAM_DTYPE
+from src.utils.constants import *
+from src.utils.rng import seed_run
+
+ROWS = 30
+GENES = 41
+
+
+def genomes(seed=0):
+    return np.random.default_rng(seed).normal(0, 1, (ROWS, GENES)).astype(PARAM_DTYPE)
+
+
+def replay(kernel, rate, seed, **kwargs):
+    """Run a kernel on fresh genomes; also return the mask and the value draw it made"""
+    matrix = genomes()
+    count = kernel(matrix, rate, rng=np.random.default_rng(seed), **kwargs)
+    rng = np.random.default_rng(seed)
+    mask = rng.random(matrix.shape) < rate
+    return matrix, count, mask, rng
+
+
+def test_gaussian_adds_noise_to_masked_genes():
+    matrix, count, mask, rng = replay(Mutation.batch_gaussian, 0.2, 1)
+    expected = genomes()
+    expected[mask] += rng.normal(0, MUTATION_STRENGTH, count).astype(PARAM_DTYPE)
+    assert count == np.count_nonzero(mask)
+    assert np.array_equal(matrix, expected)
+    assert matrix.dtype == PARAM_DTYPE
+
+
+def test_uniform_replaces_masked_genes():
+    matrix, count, mask, rng = replay(Mutation.batch_uniform, 0.2, 2)
+    expected = genomes()
+    expected[mask] = rng.uniform(-MUTATION_RANGE, MUTATION_RANGE, count)
+    assert np.array_equal(matrix, expected)
+    assert np.all(np.abs(matrix[mask]) <= MUTATION_RANGE)
+
+
+def test_creep_nudges_masked_genes_by_at_most_one_step():
+    matrix, count, mask, _ = replay(Mutation.batch_creep, 0.3, 3)
+    change = matrix - genomes()
+    assert np.all(change[~mask] == 0)
+    assert np.all(np.abs(change[mask]) <= CREEP_STEP + 1e-6)
+    assert np.count_nonzero(change) == count
+
+
+def test_boundary_sets_masked_genes_to_the_limits():
+    matrix, count, mask, _ = replay(Mutation.batch_boundary, 0.3, 4)
+    assert np.array_equal(matrix[~mask], genomes()[~mask])
+    assert set(np.unique(matrix[mask])) <= {-BOUNDARY_LIMIT, BOUNDARY_LIMIT}
+    assert len(np.unique(matrix[mask])) == 2
+
+
+def test_adaptive_rate_schedule():
+    assert Mutation.adaptive_rate(0, 100) == pytest.approx(ADAPTIVE_INITIAL_RATE)
+    assert Mutation.adaptive_rate(100, 100) == pytest.approx(ADAPTIVE_FINAL_RATE)
+    assert Mutation.adaptive_rate(500, 100) == pytest.approx(ADAPTIVE_FINAL_RATE)
+    halfway = (ADAPTIVE_INITIAL_RATE + ADAPTIVE_FINAL_RATE) / 2
+    assert Mutation.adaptive_rate(50, 100) == pytest.approx(halfway)
+
+    early = Mutation.batch_adaptive(np.zeros((200, 50), PARAM_DTYPE), 0, 100,
+                                    rng=np.random.default_rng(5))
+    late = Mutation.batch_adaptive(np.zeros((200, 50), PARAM_DTYPE), 100, 100,
+                                   rng=np.random.default_rng(5))
+    assert early / 10000 == pytest.approx(ADAPTIVE_INITIAL_RATE, abs=0.02)
+    assert late / 10000 == pytest.approx(ADAPTIVE_FINAL_RATE, abs=0.01)
+
+
+@pytest.mark.parametrize("method", list(MUTATION_METHODS))
+def test_every_method_mutates_a_matrix_slice_in_place(method):
+    matrix = genomes()
+    before = matrix.copy()
+    count = Mutation.batch_mutation(matrix[5:15], method, 0.5, generation=3,
+                                    max_generations=10, rng=np.random.default_rng(6))
+    assert count > 0
+    assert np.array_equal(matrix[:5], before[:5]) and np.array_equal(matrix[15:], before[15:])
+    assert np.count_nonzero(matrix[5:15] != before[5:15]) <= count
+
+
+def test_zero_rate_and_unknown_method():
+    matrix = genomes()
+    assert Mutation.batch_mutation(matrix, "gaussian", 0.0, rng=np.random.default_rng(7)) == 0
+    assert np.array_equal(matrix, genomes())
+    with pytest.raises(ValueError):
+        Mutation.batch_mutation(matrix, "swap")
+
+
+def test_network_mutation_returns_a_mutated_copy():
+    seed_run(8)
+    network = NeuralNetwork(seed=1)
+    before = network.params.copy()
+    for mutate in (Mutation.gaussian_mutation, Mutation.uniform_mutation,
+                   Mutation.creep_mutation, Mutation.boundary_mutation):
+        child = mutate(network, 1.0)
+        assert not np.shares_memory(child.params, network.params)
+        assert not np.array_equal(child.params, before)
+    assert np.array_equal(network.params, before)
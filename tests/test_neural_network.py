@@ -0,0 +1,74 @@
+import random
+import numpy as np
+import pytest
+from src.ai.genetic_algorithm import GeneticAlgorithm
+from src.ai.mutation import Mutation
+from src.ai.neural_network import NeuralNetwork
+from src.utils.constants import *
+from src.utils.rng import seed_run
+
+
+@pytest.fixture(autouse=True)
+def run_in_tmp(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    seed_run(7)
+
+
+def global_rng_states():
+    return np.random.get_state(), random.getstate()
+
+
+def assert_same_states(before, after):
+    (np_before, py_before), (np_after, py_after) = before, after
+    assert np_before[0] == np_after[0]
+    assert np.array_equal(np_before[1], np_after[1])
+    assert np_before[2:] == np_after[2:]
+    assert py_before == py_after
+
+
+def test_clone_leaves_global_rng_untouched():
+    network = NeuralNetwork(NN_INPUT_NODES, NN_HIDDEN_NODES, NN_OUTPUT_NODES, seed=1)
+    np.random.seed(123)
+    random.seed(123)
+    before = global_rng_states()
+
+    copies = [network.clone() for _ in range(5)] + [network.copy()]
+    copies.append(network.with_params(network.params.copy()))
+    copies.append(Mutation.gaussian_mutation(network, 0.5))
+    assert_same_states(before, global_rng_states())
+
+    for copy in copies[:-1]:
+        assert np.array_equal(copy.params, network.params)
+    assert not np.array_equal(copies[-1].params, network.params)
+
+
+@pytest.mark.parametrize("extension", [MODEL_EXTENSION, ".json"])
+def test_load_leaves_global_rng_untouched(tmp_path, extension):
+    network = NeuralNetwork(NN_INPUT_NODES, NN_HIDDEN_NODES, NN_OUTPUT_NODES, seed=2)
+    filename = str(tmp_path / f"bird{extension}")
+    network.save_to_file(filename)
+    before = global_rng_states()
+
+    loaded = NeuralNetwork.from_file(filename)
+    assert_same_states(before, global_rng_states())
+    assert np.allclose(loaded.params, network.params)
+
+
+def test_clone_owns_its_buffer():
+    network = NeuralNetwork(NN_INPUT_NODES, NN_HIDDEN_NODES, NN_OUTPUT_NODES, seed=3)
+    clone = network.clone()
+    clone.params[:] = 0
+    assert np.any(network.params != 0)
+    # Weight and bias arrays are views of the clone's own buffer
+    assert all(np.shares_memory(w, clone.params) for w in clone.weights)
+
+
+def test_generations_reuse_two_genome_buffers():
+    ga = GeneticAlgorithm(population_size=20, generations=10)
+    buffers = {id(ga.population.genomes), id(ga.population.spare_genomes)}
+    for generation in range(4):
+        ga.population.fitness_scores = list(np.arange(20, dtype=float))
+        ga.evolve_generation()
+        assert {id(ga.population.genomes), id(ga.population.spare_genomes)} == buffers
+        network = ga.population.individuals[5]
+        assert np.shares_memory(network.params, ga.population.genomes)
@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+from src.sim.course import PipeCourse
+from src.sim.observation import build_observations, bottom_pipe_arrays, swarm_observations
+from src.sim.swarm import BirdSwarm
+from src.utils.constants import *
+
+pygame = pytest.importorskip("pygame")
+
+# (center x, center y, velocity): ceiling and floor, both velocity clips, and
+# birds far above / below a gap so diff_y clips
+BIRDS = [(100, 300, 0.0), (100, 20, -12.0), (100, 470, 15.0), (90, 200, -10.0),
+         (120, 300, 10.0), (86, 120, 3.5), (150, 420, -4.5)]
+
+
+def make_birds():
+    from src.game.bird import Bird
+    birds = []
+    for x, y, velocity in BIRDS:
+        # No sprites: a fixed BIRD_WIDTH x BIRD_HEIGHT rect, like BirdSwarm
+        bird = Bird(x, y, [])
+        bird.velocity = velocity
+        birds.append(bird)
+    return birds
+
+
+def make_swarm():
+    swarm = BirdSwarm([x for x, _, _ in BIRDS], [y for _, y, _ in BIRDS])
+    swarm.velocity[:] = [velocity for _, _, velocity in BIRDS]
+    return swarm
+
+
+def pipe_pairs(xs, gap_centers):
+    from src.game.pipe import Pipe
+    sprite = pygame.Surface((PIPE_SPRITE_WIDTH, PIPE_SPRITE_HEIGHT))
+    pipes = []
+    for x, gap_center in zip(xs, gap_centers):
+        pipes.append(Pipe(int(x), sprite, PIPE_GAP, is_top=True, gap_center=gap_center))
+        pipes.append(Pipe(int(x), sprite, PIPE_GAP, is_top=False, gap_center=gap_center))
+    return pipes
+
+
+@pytest.mark.parametrize("xs, gap_centers", [
+    ([], []),
+    # Right edge 8 px behind the left edge of the birds at x=100: still "next"
+    ([100 - BIRD_WIDTH // 2 - PIPE_SPRITE_WIDTH - 8, 300], [200, 450]),
+    # Right edge exactly 20 px behind: already passed
+    ([100 - BIRD_WIDTH // 2 - PIPE_SPRITE_WIDTH - 20, 300], [450, 150]),
+    # Only pipes behind every bird
+    ([-40, 0], [300, 300]),
+    # Next pipe more than a screen width away: dist_x clips to 1
+    ([100 + SCREEN_WIDTH + 60], [150]),
+    # A pipe overlapping the birds and one ahead
+    ([95, 270], [SCREEN_HEIGHT - PIPE_GAP_MARGIN, PIPE_GAP_MARGIN]),
+])
+def test_batched_rows_match_bird(xs, gap_centers):
+    pipes = pipe_pairs(xs, gap_centers)
+    birds = make_birds()
+    expected = np.array([bird.get_game_state(pipes) for bird in birds])
+
+    observations = build_observations(
+        [bird.rect.left for bird in birds], [bird.rect.right for bird in birds],
+        [bird.rect.centery for bird in birds], [bird.velocity for bird in birds],
+        *bottom_pipe_arrays(pipes))
+    assert np.allclose(observations, expected)
+    assert np.allclose(swarm_observations(make_swarm(), pipes), expected)
+
+
+def test_clipped_inputs_stay_in_range():
+    pipes = pipe_pairs([300], [450])
+    observations = swarm_observations(make_swarm(), pipes)
+    assert observations.min() >= 0.0 and observations.max() <= 1.0
+    # Velocities beyond +-10 clip to the ends of (v + 10) / 20
+    assert observations[1, 1] == 0.0 and observations[2, 1] == 1.0
+    # The bird at y=20 sits far above the gap at 450
+    assert observations[1, 3] == 0.0
+
+
+def test_course_arrays_match_bird():
+    course = PipeCourse(seed=9)
+    birds = make_birds()
+    swarm = make_swarm()
+    for frame in range(PIPE_SPAWN_DELAY * 6):
+        course.update()
+        if frame % 7:
+            continue
+        left, _, gap_center = course.bottom_arrays()
+        pipes = pipe_pairs(left, gap_center)
+        expected = np.array([bird.get_game_state(pipes) for bird in birds])
+        observations = build_observations(swarm.left, swarm.right, swarm.y, swarm.velocity,
+                                          *course.bottom_arrays())
+        assert np.allclose(observations, expected)
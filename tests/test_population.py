@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+from src.ai.neural_network import NeuralNetwork, PARAM_DTYPE
+from src.ai.policy import PopulationPolicy
+from src.ai.population import Population
+from src.utils.rng import seed_run
+
+
+@pytest.fixture
+def population():
+    seed_run(11)
+    return Population(12)
+
+
+def reference_forward(params, layer_sizes, inputs):
+    """Forward pass from a flat vector in bind() order (W1, b1, W2, b2, ...)"""
+    activation = np.asarray(inputs, dtype=np.float64)
+    idx = 0
+    for i in range(len(layer_sizes) - 1):
+        fan_in, fan_out = layer_sizes[i], layer_sizes[i + 1]
+        weights = params[idx:idx + fan_in * fan_out].reshape(fan_in, fan_out)
+        idx += fan_in * fan_out
+        biases = params[idx:idx + fan_out]
+        idx += fan_out
+        z = activation @ weights + biases
+        activation = np.tanh(z) if i < len(layer_sizes) - 2 else 1 / (1 + np.exp(-z))
+    return activation[0]
+
+
+def test_individuals_are_views_of_genome_rows(population):
+    genomes = population.genomes
+    assert genomes.shape == (12, population.num_params) and genomes.dtype == PARAM_DTYPE
+    assert genomes.flags.c_contiguous
+    for i, network in enumerate(population.individuals):
+        assert np.shares_memory(network.get_weights_as_array(), genomes[i])
+        assert all(np.shares_memory(w, genomes[i]) for w in network.weights)
+        assert all(np.shares_memory(b, genomes[i]) for b in network.biases)
+    # Rows are distinct networks
+    assert len({genomes[i].tobytes() for i in range(12)}) == 12
+
+
+def test_matrix_writes_reach_the_network(population):
+    inputs = [0.3, 0.6, 0.9, 0.2]
+    network = population.individuals[4]
+    population.genomes[4] *= -0.5
+    expected = reference_forward(population.genomes[4].astype(np.float64),
+                                 population.layer_sizes, inputs)
+    assert network.forward_pass(inputs) == pytest.approx(expected, rel=1e-5)
+
+    network.set_weights_from_array(np.zeros(population.num_params))
+    assert not population.genomes[4].any()
+
+
+def test_sort_and_load_rebind_views(population):
+    population.fitness_scores = [float(i % 5) for i in range(12)]
+    before = population.genomes.copy()
+    population.sort_by_fitness()
+
+    order = np.argsort(-np.array([i % 5 for i in range(12)]), kind="stable")
+    assert np.array_equal(population.genomes, before[order])
+    assert population.fitness_scores == sorted(population.fitness_scores, reverse=True)
+    for i, network in enumerate(population.individuals):
+        assert np.shares_memory(network.params, population.genomes[i])
+
+    replacement = np.ones((12, population.num_params), dtype=PARAM_DTYPE)
+    population.load_genomes(replacement)
+    assert np.shares_memory(population.individuals[0].params, replacement)
+    with pytest.raises(ValueError):
+        population.load_genomes(np.ones((3, population.num_params + 1)))
+
+
+def test_add_individual_grows_matrix(population):
+    extra = NeuralNetwork(seed=5)
+    population.add_individual(extra)
+    assert len(population) == 13 and population.genomes.shape[0] == 13
+    assert np.array_equal(population.genomes[12], extra.params)
+    assert np.shares_memory(population.individuals[12].params, population.genomes)
+
+
+def test_policy_matches_per_network_forward(population):
+    observations = np.random.default_rng(0).uniform(0, 1, (12, 4))
+    policy = PopulationPolicy(population.individuals)
+    batched = policy.forward(observations)[:, 0]
+    single = [network.forward_pass(row) for network, row in
+              zip(population.individuals, observations)]
+    assert np.allclose(batched, single, atol=1e-6)
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+from src.sim.engine import HeadlessEngine
+from src.sim.evaluator import ProcessPoolEvaluator
+from src.utils.rng import seed_run
+
+POPULATION = 40
+GENERATIONS = 3
+MAX_FRAMES = 600
+
+
+def seeded_run(seed, workers=None):
+    """Genome matrix and statistics (minus wall-clock times) after a seeded headless run"""
+    seed_run(seed)
+    evaluator = ProcessPoolEvaluator(workers, max_frames=MAX_FRAMES) if workers else None
+    try:
+        engine = HeadlessEngine(population_size=POPULATION, max_frames=MAX_FRAMES,
+                                evaluator=evaluator)
+        engine.run(GENERATIONS)
+    finally:
+        if evaluator is not None:
+            evaluator.close()
+
+    genetic_algorithm = engine.genetic_algorithm
+    stats = [{key: value for key, value in record.items() if key != 'evolution_time'}
+             for record in genetic_algorithm.generation_stats]
+    return genetic_algorithm.population.genomes.copy(), stats
+
+
+@pytest.fixture(autouse=True)
+def run_in_tmp(tmp_path, monkeypatch):
+    # Runs write models and statistics under ./data
+    monkeypatch.chdir(tmp_path)
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_same_seed_repeats_run(workers):
+    genomes_a, stats_a = seeded_run(42, workers)
+    genomes_b, stats_b = seeded_run(42, workers)
+
+    assert len(stats_a) == GENERATIONS
+    assert np.array_equal(genomes_a, genomes_b)
+    assert stats_a == stats_b
+
+
+def test_worker_count_does_not_change_run():
+    genomes_serial, stats_serial = seeded_run(42)
+    genomes_pool, stats_pool = seeded_run(42, workers=2)
+
+    assert np.array_equal(genomes_serial, genomes_pool)
+    assert stats_serial == stats_pool
+
+
+def test_different_seeds_differ():
+    genomes_a, _ = seeded_run(42)
+    genomes_b, _ = seeded_run(43)
+    assert not np.array_equal(genomes_a, genomes_b)
+
+
+def test_operator_defaults_use_run_seed():
+    from src.ai.crossover import Crossover
+    from src.ai.mutation import Mutation
+
+    draws = []
+    for _ in range(2):
+        seed_run(7)
+        parents = np.arange(20, dtype=np.float32).reshape(2, 10)
+        children, _ = Crossover.batch_crossover(parents[:1], parents[1:], "uniform")
+        Mutation.batch_mutation(children, "gaussian", 0.5)
+        draws.append(children)
+    assert np.array_equal(draws[0], draws[1])
@@ -0,0 +1,74 @@
+import types
+import pytest
+from src.game.scheduler import FrameScheduler
+from src.utils.constants import *
+
+
+class RecordingClock:
+    def __init__(self):
+        self.ticks = []
+
+    def tick(self, fps):
+        self.ticks.append(fps)
+
+
+def test_real_time_runs_multiplier_ticks_per_frame():
+    scheduler = FrameScheduler(target_fps=60, speed_multiplier=1)
+    clock = RecordingClock()
+    assert scheduler.ticks_per_frame() == 1
+
+    scheduler.faster()
+    scheduler.faster()
+    assert scheduler.ticks_per_frame() == 4
+    scheduler.wait(clock)
+    # Fast-forward keeps the frame rate and runs more ticks per frame
+    assert clock.ticks == [60]
+
+
+def test_slow_motion_lowers_the_frame_rate():
+    scheduler = FrameScheduler(target_fps=60, speed_multiplier=1)
+    clock = RecordingClock()
+    scheduler.slower()
+    assert scheduler.ticks_per_frame() == 1
+    scheduler.wait(clock)
+    assert clock.ticks == [30]
+
+
+def test_speed_is_clamped():
+    scheduler = FrameScheduler(speed_multiplier=1000)
+    assert scheduler.speed_multiplier == MAX_SPEED_MULTIPLIER
+    for _ in range(20):
+        scheduler.slower()
+    assert scheduler.speed_multiplier == MIN_SPEED_MULTIPLIER
+    scheduler.reset_speed()
+    assert scheduler.speed_multiplier == 1.0 and not scheduler.unthrottled
+
+
+def test_unthrottled_renders_every_interval_without_waiting():
+    scheduler = FrameScheduler(speed_multiplier=2, render_interval=250)
+    clock = RecordingClock()
+    scheduler.toggle_unthrottled()
+    assert scheduler.ticks_per_frame() == 250
+    scheduler.wait(clock)
+    assert clock.ticks == []
+    assert scheduler.describe() == "MAX (1/250)"
+
+    scheduler.toggle_unthrottled()
+    assert scheduler.ticks_per_frame() == 2 and scheduler.describe() == "2x"
+    assert FrameScheduler(render_interval=0).render_interval == 1
+
+
+def test_best_only_rendering_picks_fittest_alive_bird():
+    pytest.importorskip("pygame")
+    from src.game.game_engine import GameEngine
+
+    birds = [types.SimpleNamespace(alive=alive, fitness=fitness)
+             for alive, fitness in [(True, 3.0), (False, 9.0), (True, 5.0), (True, 1.0)]]
+    game = types.SimpleNamespace(birds=birds, render_best_only=False)
+    assert GameEngine.get_birds_to_render(game) is birds
+
+    game.render_best_only = True
+    assert GameEngine.get_birds_to_render(game) == [birds[2]]
+    for bird in birds:
+        bird.alive = False
+    assert GameEngine.get_birds_to_render(game) == []
@@ -0,0 +1,67 @@
+import types
+import numpy as np
+import pytest
+from src.sim.engine import HeadlessEngine
+from src.sim.swarm import BirdSwarm
+from src.utils.constants import *
+
+# Bird centers across the screen; some birds die, some join late (alive=False
+# until their first frame), to cover pairs that leave before they are passed
+XS = [60, 80, 98, 150, 240, 380, 470, 100, 300, 420]
+FIRST_FRAME = [0, 0, 0, 0, 0, 0, 0, 400, 700, 1000]
+LAST_FRAME = [2000, 650, 2000, 1234, 2000, 300, 2000, 2000, 1500, 2000]
+FRAMES = 2000
+
+
+def alive_at(frame):
+    return np.array([first <= frame < last for first, last in zip(FIRST_FRAME, LAST_FRAME)])
+
+
+def brute_force_scores(course, swarm, passed):
+    """Add every on-screen pair whose right edge is behind an alive bird"""
+    _, right, _ = course.bottom_arrays()
+    for i in np.flatnonzero(swarm.alive):
+        for seq, edge in zip(course.sequence_numbers(), right):
+            if edge < swarm.left[i]:
+                passed[i].add(int(seq))
+
+
+def test_sequence_scoring_matches_brute_force():
+    engine = HeadlessEngine(len(XS), course_seed=4)
+    engine.swarm = swarm = BirdSwarm(XS, [300] * len(XS))
+    passed = [set() for _ in XS]
+
+    for frame in range(FRAMES):
+        swarm.alive[:] = alive_at(frame)
+        engine.pipe_course.update()
+        engine.check_scoring()
+        brute_force_scores(engine.pipe_course, swarm, passed)
+
+    expected = [len(seqs) for seqs in passed]
+    assert swarm.score.tolist() == expected
+    assert np.allclose(swarm.fitness, swarm.score * FITNESS_BONUS_PIPE)
+    assert engine.score == max(expected) > 0
+    # Late birds never score the pairs that left before they joined
+    assert min(passed[9]) > 0
+
+
+def test_game_scoring_matches_swarm():
+    from src.game.bird import Bird
+    from src.game.game_engine import GameEngine
+
+    engine = HeadlessEngine(len(XS), course_seed=4)
+    engine.swarm = swarm = BirdSwarm(XS, [300] * len(XS))
+    birds = [Bird(x, 300, []) for x in XS]
+    game = types.SimpleNamespace(pipe_course=engine.pipe_course)
+
+    for frame in range(FRAMES):
+        swarm.alive[:] = alive_at(frame)
+        engine.pipe_course.update()
+        engine.check_scoring()
+        for bird, alive in zip(birds, swarm.alive):
+            if alive:
+                bird.score += GameEngine.check_score(game, bird)
+        assert [bird.score for bird in birds] == swarm.score.tolist()
+        # The swarm also advances dead birds past departed pairs; they never score
+        alive = np.flatnonzero(swarm.alive)
+        assert [birds[i].next_pipe_seq for i in alive] == swarm.next_pipe[alive].tolist()
@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+from src.ai.selection import Selection
+from src.utils.constants import *
+
+FITNESS = np.array([5.0, 1.0, 9.0, 0.0, 3.0, 9.0, 2.5, 7.0])
+
+
+def test_tournaments_match_per_tournament_loop():
+    picks = Selection.tournament_indices(FITNESS, 500, 3, np.random.default_rng(1))
+
+    contestants = np.random.default_rng(1).integers(0, len(FITNESS), size=(500, 3))
+    for pick, row in zip(picks, contestants):
+        best = max(row, key=lambda i: FITNESS[i])
+        # argmax keeps the first of equal contestants, like max()
+        assert pick == best
+
+
+def test_roulette_matches_linear_scan():
+    weights = Selection.selection_weights(FITNESS)
+    picks = Selection.roulette_indices(weights, 2000, np.random.default_rng(2))
+
+    spins = np.random.default_rng(2).random(2000) * weights.sum()
+    for pick, spin in zip(picks, spins):
+        running = 0.0
+        for i, weight in enumerate(weights):
+            running += weight
+            if spin < running:
+                break
+        assert pick == i
+    frequencies = np.bincount(picks, minlength=len(FITNESS)) / 2000
+    assert np.allclose(frequencies, weights / weights.sum(), atol=0.03)
+
+
+def test_sus_gives_each_individual_its_expected_share():
+    weights = Selection.selection_weights(FITNESS)
+    count = 40
+    picks = Selection.sus_indices(weights, count, np.random.default_rng(3))
+    expected = weights / weights.sum() * count
+    counts = np.bincount(picks, minlength=len(FITNESS))
+    assert np.all(counts >= np.floor(expected)) and np.all(counts <= np.ceil(expected))
+    # Shuffled so consecutive picks pair different parents
+    assert not np.all(np.diff(picks) >= 0)
+
+
+def test_negative_and_zero_fitness():
+    weights = Selection.selection_weights([-3.0, -1.0, 2.0])
+    assert weights.min() == 1 and np.array_equal(weights, [1.0, 3.0, 6.0])
+
+    zeros = np.zeros(5)
+    for method in ("roulette", "sus"):
+        picks = Selection.select_indices(zeros, 50, method, rng=np.random.default_rng(4))
+        assert len(picks) == 50 and picks.min() >= 0 and picks.max() < 5
+
+
+def test_rank_weights():
+    weights = Selection.rank_weights(FITNESS, selection_pressure=1.8)
+    assert weights[3] == pytest.approx(0.2)          # worst
+    assert weights.max() == pytest.approx(1.8)
+    assert weights.sum() == pytest.approx(len(FITNESS))
+    # Ties are ranked in their original order
+    assert weights[2] < weights[5]
+    assert np.array_equal(np.argsort(weights), np.argsort(FITNESS, kind="stable"))
+    assert Selection.rank_weights([4.0]).tolist() == [1.0]
+
+
+def test_elites_cycle_best_first():
+    assert Selection.elite_indices(FITNESS, 3).tolist() == [2, 5, 7]
+    assert Selection.elite_indices(FITNESS[:2], 5).tolist() == [0, 1, 0, 1, 0]
+
+
+@pytest.mark.parametrize("method", list(SELECTION_METHODS))
+def test_every_method_returns_count_indices(method):
+    picks = Selection.select_indices(FITNESS, 33, method, rng=np.random.default_rng(5))
+    assert picks.shape == (33,) and picks.min() >= 0 and picks.max() < len(FITNESS)
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        Selection.select_indices(FITNESS, 2, "lottery")
@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+from src.utils.constants import *
+
+pygame = pytest.importorskip("pygame")
+
+
+def flap_sprites():
+    """Three asymmetric bird-sized sprites with transparent corners"""
+    sprites = []
+    for frame in range(3):
+        sprite = pygame.Surface((BIRD_WIDTH, BIRD_HEIGHT), pygame.SRCALPHA)
+        pygame.draw.ellipse(sprite, (255, 200, 0, 255), (0, 2 * frame, BIRD_WIDTH - 6, 18))
+        pygame.draw.rect(sprite, (255, 0, 0, 255), (BIRD_WIDTH - 8, 8, 8, 4))
+        sprites.append(sprite)
+    return sprites
+
+
+@pytest.fixture
+def atlas():
+    from src.utils.sprite_atlas import SpriteAtlas
+    return SpriteAtlas(flap_sprites())
+
+
+def bird_rotations():
+    """Every tilt a Bird can have: velocities move in GRAVITY steps, tilt is -3 * velocity"""
+    velocities = np.arange(JUMP_STRENGTH + GRAVITY, 10 + GRAVITY, GRAVITY)
+    return sorted({min(BIRD_MAX_ROTATION, max(BIRD_MIN_ROTATION, -(velocity * 3)))
+                   for velocity in velocities})
+
+
+def test_cached_images_match_every_bird_rotation(atlas):
+    sprites = flap_sprites()
+    for frame in range(3):
+        for rotation in bird_rotations():
+            image, mask = atlas.get(frame, rotation)
+            fresh = pygame.transform.rotate(sprites[frame], rotation)
+            fresh_mask = pygame.mask.from_surface(fresh)
+            assert image.get_size() == fresh.get_size()
+            assert mask.count() == fresh_mask.count()
+            assert mask.overlap_area(fresh_mask, (0, 0)) == fresh_mask.count()
+
+
+def test_rotations_outside_the_range_clamp(atlas):
+    assert atlas.get(0, -400) is atlas.get(0, BIRD_MIN_ROTATION)
+    assert atlas.get(1, 90) is atlas.get(1, BIRD_MAX_ROTATION)
+    assert len(atlas) == 3 * (atlas.max_key - atlas.min_key + 1)
+
+
+def test_bird_with_atlas_never_rotates_per_frame(atlas, monkeypatch):
+    from src.game.bird import Bird
+    bird = Bird(100, 300, flap_sprites(), atlas=atlas)
+
+    def no_rotate(*args):
+        raise AssertionError("per-frame rotate")
+    monkeypatch.setattr(pygame.transform, "rotate", no_rotate)
+    monkeypatch.setattr(pygame.mask, "from_surface", no_rotate)
+
+    for frame in range(60):
+        bird.update(jump=frame % 12 == 0)
+        assert bird.get_mask() is atlas.get(bird.current_sprite, bird.rotation)[1]
+
+
+def test_pipe_masks_built_once_per_orientation():
+    from src.utils.asset_loader import AssetLoader
+    loader = AssetLoader()
+    pipe = pygame.Surface((PIPE_SPRITE_WIDTH, PIPE_SPRITE_HEIGHT), pygame.SRCALPHA)
+    pygame.draw.rect(pipe, (0, 255, 0, 255), (2, 0, PIPE_SPRITE_WIDTH - 4, 40))
+    loader.images["pipe_green"] = pipe
+    loader.images["bluebird_sprites"] = flap_sprites()
+    loader.build_sprite_atlas()
+
+    top = loader.get_pipe_sprite("GREEN", is_top=True)
+    assert loader.get_pipe_mask("GREEN", False).get_at((5, 5)) == 1
+    assert loader.get_pipe_mask("GREEN", True).get_at((5, 5)) == 0
+    assert loader.get_pipe_mask("GREEN", True).get_at((5, PIPE_SPRITE_HEIGHT - 5)) == 1
+    assert top.get_size() == pipe.get_size()
+    assert loader.get_pipe_mask("GREEN", True) is loader.get_pipe_mask("GREEN", True)
+    assert loader.get_bird_atlas("BLUE") is not None and loader.get_bird_atlas("RED") is None
@@ -0,0 +1,115 @@
+import csv
+import json
+import pytest
+from src.utils.stats_log import GENERATION_STATS_FIELDS, StatsLog, compact, read_log
+
+
+def record(generation):
+    values = {field: float(generation) for field in GENERATION_STATS_FIELDS}
+    values['generation'] = generation
+    values['elite_count'] = 2
+    return values
+
+
+@pytest.fixture
+def paths(tmp_path):
+    return str(tmp_path / "stats" / "log.jsonl"), str(tmp_path / "stats" / "stats.csv")
+
+
+def read_csv(csv_file):
+    with open(csv_file, newline='') as f:
+        return list(csv.DictReader(f))
+
+
+def test_append_writes_log_and_csv(paths):
+    log_file, csv_file = paths
+    log = StatsLog(log_file, csv_file)
+    log.write_parameters({'population_size': 10})
+    for generation in range(3):
+        log.append(dict(record(generation), extra='not a CSV column'))
+
+    # Flushed per line, readable before close
+    entries, _ = read_log(log_file)
+    assert entries[0] == {'algorithm_parameters': {'population_size': 10}}
+    assert [entry['generation'] for entry in entries[1:]] == [0, 1, 2]
+    assert entries[1]['extra'] == 'not a CSV column'
+
+    rows = read_csv(csv_file)
+    assert list(rows[0]) == GENERATION_STATS_FIELDS
+    assert [int(row['generation']) for row in rows] == [0, 1, 2]
+    log.close()
+
+
+def test_log_without_csv(paths):
+    log_file, _ = paths
+    log = StatsLog(log_file, None)
+    log.append(record(0))
+    assert log.offsets()['csv'] is None
+    log.close()
+    assert len(read_log(log_file)[0]) == 1
+
+
+def test_read_log_leaves_partial_line(paths):
+    log_file, csv_file = paths
+    log = StatsLog(log_file, csv_file)
+    log.append(record(0))
+    log.close()
+
+    with open(log_file, 'a') as f:
+        f.write('{"generation": 1, "best_fi')
+    entries, offset = read_log(log_file)
+    assert [entry['generation'] for entry in entries] == [0]
+
+    # The rest of the line arrives; reading continues from the offset
+    with open(log_file, 'a') as f:
+        f.write('tness": 4.0}\n\n')
+    entries, end = read_log(log_file, offset)
+    assert entries == [{'generation': 1, 'best_fitness': 4.0}]
+    assert read_log(log_file, end) == ([], end)
+
+
+def test_read_missing_log(tmp_path):
+    assert read_log(str(tmp_path / "missing.jsonl"), 5) == ([], 5)
+
+
+def test_offsets_cut_back_later_writes(paths):
+    log_file, csv_file = paths
+    log = StatsLog(log_file, csv_file)
+    log.write_parameters({})
+    log.append(record(0))
+    offsets = log.offsets()
+    log.append(record(1))
+    log.close()
+
+    # A run resumed from a checkpoint taken after generation 0
+    resumed = StatsLog(log_file, csv_file, offsets)
+    resumed.append(record(5))
+    resumed.close()
+
+    entries, _ = read_log(log_file)
+    assert [entry.get('generation') for entry in entries] == [None, 0, 5]
+    rows = read_csv(csv_file)
+    assert [int(row['generation']) for row in rows] == [0, 5]
+
+
+def test_compact_round_trip(paths, tmp_path):
+    log_file, csv_file = paths
+    log = StatsLog(log_file, csv_file)
+    log.write_parameters({'mutation_rate': 0.1})
+    records = [record(generation) for generation in range(4)]
+    for generation_record in records:
+        log.append(generation_record)
+    log.close()
+
+    output = str(tmp_path / "summary" / "evolution_stats.json")
+    summary = compact(log_file, output)
+    with open(output) as f:
+        assert json.load(f) == summary
+
+    assert summary['algorithm_parameters'] == {'mutation_rate': 0.1}
+    assert summary['generation_statistics'] == records
+    assert summary['fitness_history'] == {
+        'best': [0.0, 1.0, 2.0, 3.0],
+        'average': [0.0, 1.0, 2.0, 3.0],
+        'diversity': [0.0, 1.0, 2.0, 3.0]
+    }
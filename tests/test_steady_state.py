@@ -0,0 +1,51 @@
+import json
+import numpy as np
+import pytest
+from src.sim.steady_state import SteadyStateEngine
+from src.utils.constants import *
+from src.utils.rng import seed_run
+from src.utils.stats_log import read_log
+
+POPULATION = 24
+MAX_FRAMES = 400
+
+
+@pytest.fixture(autouse=True)
+def run_in_tmp(tmp_path, monkeypatch):
+    # Runs write models and statistics under ./data
+    monkeypatch.chdir(tmp_path)
+
+
+def steady_state_run(epochs, workers):
+    seed_run(3)
+    engine = SteadyStateEngine(population_size=POPULATION, workers=workers,
+                               max_frames=MAX_FRAMES, batch=5)
+    records = engine.run(epochs)
+    return engine, records
+
+
+def test_shared_memory_workers_match_in_process():
+    # One epoch evaluates only the initial population, in any completion order
+    serial, _ = steady_state_run(1, workers=1)
+    pooled, _ = steady_state_run(1, workers=2)
+    assert serial.evaluated.all() and pooled.evaluated.all()
+    assert np.array_equal(serial.fitness, pooled.fitness)
+    assert pooled.evaluator is None
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_epochs_are_logged_like_generations(workers):
+    engine, records = steady_state_run(3, workers)
+    assert [record['generation'] for record in records] == [1, 2, 3]
+    assert engine.births == 2 * POPULATION
+
+    entries, _ = read_log(GENERATION_STATS_LOG)
+    assert 'algorithm_parameters' in entries[0]
+    assert [entry['generation'] for entry in entries[1:]] == [1, 2, 3]
+    assert entries[-1]['best_fitness'] == records[-1]['best_fitness']
+
+    with open(GENERATION_STATS_FILE) as f:
+        assert len(f.read().splitlines()) == 1 + len(records)
+    with open(EVOLUTION_STATS_FILE) as f:
+        summary = json.load(f)
+    assert summary['fitness_history']['best'] == [record['best_fitness'] for record in records]
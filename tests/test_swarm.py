@@ -0,0 +1,72 @@
+import types
+import numpy as np
+import pytest
+from src.sim.swarm import BirdSwarm
+from src.utils.constants import *
+
+pygame = pytest.importorskip("pygame")
+
+# Frames between jumps per bird (0 = never): falls to the ground, hovers,
+# climbs into the ceiling, and mixes of both
+JUMP_PERIODS = [0, 3, 7, 12, 16, 19, 23, 31, 45, 1]
+
+
+def jump_schedule(frame):
+    return np.array([period > 0 and frame % period == 0 for period in JUMP_PERIODS])
+
+
+def test_swarm_trajectory_matches_birds():
+    from src.game.bird import Bird
+    from src.game.game_engine import GameEngine
+
+    swarm = BirdSwarm.spawn(len(JUMP_PERIODS))
+    # Spriteless birds keep the fixed BIRD_WIDTH x BIRD_HEIGHT rect
+    birds = [Bird(x, y, []) for x, y in zip(swarm.x, swarm.y)]
+    # check_bird_collision_detailed only needs these two attributes outside pipe modes
+    game = types.SimpleNamespace(collision_mode="analytic", on_bird_collision=lambda: None)
+    ground_y = SCREEN_HEIGHT - GROUND_HEIGHT
+
+    death_frame = [None] * len(birds)
+    for frame in range(400):
+        jumps = jump_schedule(frame)
+        for i, bird in enumerate(birds):
+            if bird.alive:
+                bird.update(bool(jumps[i]))
+                if GameEngine.check_bird_collision_detailed(game, bird, ground_y, i):
+                    death_frame[i] = frame
+        died = swarm.step(jumps)
+
+        assert swarm.alive.tolist() == [bird.alive for bird in birds]
+        assert swarm.y.tolist() == [bird.rect.centery for bird in birds]
+        assert swarm.velocity.tolist() == [bird.velocity for bird in birds]
+        assert swarm.frames_survived.tolist() == [bird.frames_survived for bird in birds]
+        for i in np.flatnonzero(died):
+            assert death_frame[i] == frame
+
+    # Both ends of the playfield and the velocity clamp were exercised
+    assert swarm.alive_count() < len(birds)
+    assert any(bird.rect.top <= COLLISION_BUFFER for bird in birds)
+    assert any(bird.rect.bottom >= GROUND_Y - COLLISION_BUFFER for bird in birds)
+
+
+def test_velocity_clamp_and_truncated_step():
+    from src.game.bird import Bird
+
+    swarm = BirdSwarm([100], [150])
+    bird = Bird(100, 150, [])
+    jumps = [True] + [False] * 45
+    for jump in jumps:
+        swarm.step(np.array([jump]))
+        bird.update(jump)
+        assert swarm.y[0] == bird.rect.centery
+        assert swarm.velocity[0] == bird.velocity
+    assert bird.alive and swarm.velocity[0] == swarm.max_velocity
+
+    # Fractional velocities move by int(velocity), toward zero, both ways
+    swarm = BirdSwarm([100], [300])
+    swarm.velocity[0] = -2.5 - GRAVITY
+    swarm.step()
+    assert swarm.y[0] == 298
+    swarm.velocity[0] = 2.5 - GRAVITY
+    swarm.step()
+    assert swarm.y[0] == 300
@@ -0,0 +1,81 @@
+import time
+from src.utils.telemetry import DEBUG, INFO, WARNING, Telemetry
+
+
+class CountingArg:
+    """Message argument that counts how often it is formatted"""
+
+    def __init__(self):
+        self.formatted = 0
+
+    def __str__(self):
+        self.formatted += 1
+        return "arg"
+
+
+def read_lines(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read().splitlines()
+
+
+def test_levels_and_sampling_gate_records(tmp_path):
+    telemetry = Telemetry(str(tmp_path / "log.txt"), level="INFO",
+                          sample_rates={"state": 10})
+    assert not telemetry.enabled("state", DEBUG)
+    assert telemetry.enabled("state", INFO, frame=20)
+    assert not telemetry.enabled("state", INFO, frame=21)
+    assert telemetry.enabled("other", INFO, frame=21)
+
+    for frame in range(100):
+        telemetry.info("state", "frame %d", frame, frame=frame)
+        telemetry.debug("state", "hidden", frame=frame)
+    assert len(telemetry.buffer) == 10
+
+
+def test_formatting_happens_on_flush(tmp_path, capsys):
+    log_file = tmp_path / "logs" / "training.log"
+    telemetry = Telemetry(str(log_file), level="DEBUG", echo_level="WARNING")
+    arg = CountingArg()
+    telemetry.debug("nn", "output %s", arg, frame=3)
+    telemetry.warning("nn_error", "bird %d failed", 7)
+    assert arg.formatted == 0
+
+    telemetry.flush()
+    assert arg.formatted == 1
+    lines = read_lines(log_file)
+    assert lines[0].endswith("DEBUG [nn] frame=3 output arg")
+    assert lines[1].endswith("WARNING [nn_error] bird 7 failed")
+    # Only WARNING and above reach the console
+    echoed = capsys.readouterr().out
+    assert echoed.strip().endswith("bird 7 failed")
+    assert "output arg" not in echoed
+
+
+def test_full_buffer_drops_oldest_and_reports(tmp_path):
+    log_file = tmp_path / "log.txt"
+    telemetry = Telemetry(str(log_file), level="DEBUG", echo_level="ERROR", capacity=5)
+    for i in range(12):
+        telemetry.info("score", "record %d", i)
+    assert telemetry.dropped == 7
+
+    telemetry.flush()
+    lines = read_lines(log_file)
+    assert [line.split()[-1] for line in lines[:5]] == ["7", "8", "9", "10", "11"]
+    assert "dropped 7 records" in lines[5]
+    assert telemetry.dropped == 0
+
+
+def test_background_thread_flushes_and_close_drains(tmp_path):
+    log_file = tmp_path / "log.txt"
+    telemetry = Telemetry(str(log_file), echo_level="ERROR", flush_interval=0.01)
+    telemetry.start()
+    telemetry.info("score", "first")
+    deadline = time.time() + 5
+    while not log_file.exists() and time.time() < deadline:
+        time.sleep(0.01)
+    assert read_lines(log_file)[0].endswith("first")
+
+    telemetry.info("score", "last")
+    telemetry.close()
+    assert telemetry.thread is None
+    assert read_lines(log_file)[-1].endswith("last")